@@ -43,3 +43,14 @@ export async function authenticateChairPerson(req: Request, res: Response, next:
     }
 }
 
+export async function authenticateAdmin(req: Request, res: Response, next: NextFunction) {
+    try {
+        const userData = (req as any).user;
+        if (userData.role !== 'admin') {
+            return res.status(403).send('Forbidden');
+        }
+        next();
+    } catch (e) {
+        return res.status(401).send('Unauthorized');
+    }
+}
@@ -1,13 +1,23 @@
 import express from 'express';
 import { catchError } from '../../utils/catch-error';
 import handleValidationError from '../../utils/handle-validation-error';
-import { checkUser, createAccessToken, createRefreshToken, createUser, verifyLogin, verifyToken } from './repository';
-import { loginSchema, userSchema } from './schema';
+import {
+    checkUser,
+    createAccessToken,
+    createPrehashedUser,
+    createRefreshToken,
+    createUser,
+    verifyLogin,
+    verifyToken,
+} from './repository';
+import { loginSchema, prehashedUserSchema, userSchema } from './schema';
 import db from '../../db';
 import { user } from '../../models/user';
 import { eq } from 'drizzle-orm';
 // import cookie from 'cookie';
-// import authenticateUser from '../../middleware/authenticate-user';
+import authenticateUser, { authenticateAdmin } from '../../middleware/authenticate-user';
+import { bulkHandler } from '../../utils/seed-bulk';
+import { CustomError } from '../../middleware/error-handler';
 
 const Router = express.Router();
 
@@ -100,6 +110,20 @@ Router.post('/register', async (req, res) => {
     }
 });
 
+// Bulk registration for the seeder: passwords arrive already bcrypt-hashed, so only admins may use it.
+Router.post(
+    '/register/bulk',
+    authenticateUser,
+    authenticateAdmin,
+    bulkHandler(prehashedUserSchema, async data => {
+        // Same answer as /register for an empId that is already taken.
+        if (await checkUser(data)) {
+            throw new CustomError('User already Exists!!', 400);
+        }
+        return createPrehashedUser(data);
+    }),
+);
+
 Router.post('/verifyToken', async (req, res) => {
     try {
         const data = req.body;
@@ -67,6 +67,15 @@ export function verifyToken(token: string) {
 
 export async function createUser(userData: User) {
     const hashedPassword = await bcrypt.hash(userData.password, 10);
+    return insertUser(userData, hashedPassword);
+}
+
+// For passwords the seeder already hashed, so bulk registration doesn't run bcrypt on the API server.
+export async function createPrehashedUser(userData: User) {
+    return insertUser(userData, userData.password);
+}
+
+async function insertUser(userData: User, hashedPassword: string) {
     const { password, ...expData } = userData;
 
     try {
@@ -27,6 +27,13 @@ export const userSchema = Joi.object({
     centre_name: Joi.string().required(),
 });
 
+// Passwords hashed by the seeder with bcrypt, cost 10, as createUser would store them.
+export const prehashedUserSchema = userSchema.keys({
+    password: Joi.string()
+        .pattern(/^\$2[aby]\$10\$[./A-Za-z0-9]{53}$/)
+        .required(),
+});
+
 export const loginSchema = Joi.object({
     empId: Joi.string().required(),
     password: Joi.string().required(),
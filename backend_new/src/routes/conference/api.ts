@@ -10,6 +10,7 @@ import {
 import { catchError } from '../../utils/catch-error';
 import { conferenceSchema } from './schema';
 import handleValidationError from '../../utils/handle-validation-error';
+import { seedBulk } from '../../utils/seed-bulk';
 // import authenticateUser from '../../middleware/authenticate-user';
 
 const Router = express.Router();
@@ -103,14 +104,14 @@ Router.delete('/:id', async (req, res) => {
 Router.post('/seed', async (req, res) => {
     try {
         const data = req.body;
-        const { name, ...rest } = data;
+        const { name, teacherAdminId, ...rest } = data;
         const { error } = conferenceSchema.validate(rest, { abortEarly: false });
         if (error) {
             console.log('error', error);
             return handleValidationError(error, res);
         }
 
-        const journalData = await seedConference(rest, name);
+        const journalData = await seedConference(rest, name, teacherAdminId);
         res.status(201).send(journalData);
     } catch (error) {
         console.log('catch error', error);
@@ -118,4 +119,6 @@ Router.post('/seed', async (req, res) => {
     }
 });
 
+Router.post('/seed/bulk', seedBulk(conferenceSchema, 'teacherAdminId', seedConference));
+
 export default Router;
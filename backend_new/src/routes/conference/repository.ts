@@ -305,12 +305,13 @@ export async function deleteConference(id: string, userId: string,role: string,a
     }
 }
 
-export async function seedConference(patentData: Conference, name: string) {
+export async function seedConference(patentData: Conference, name: string, teacherAdminId?: string) {
     let patentId = '';
     const { teacherIds, ...expData } = patentData;
     try {
+        // The seeder may resolve names to user ids itself; then skip the ilike scans.
         const user1 = await db.query.user.findFirst({
-            where: ilike(user.name, `%${name}%`),
+            where: teacherAdminId ? eq(user.id, teacherAdminId) : ilike(user.name, `%${name}%`),
         });
         if (!user1) {
             throw new Error('User not found');
@@ -334,6 +335,18 @@ export async function seedConference(patentData: Conference, name: string) {
 
         patentId = insertedPatent.id;
 
+        if (teacherAdminId) {
+            const userIds = [...new Set([...(teacherIds ?? []), user1.id])];
+            await db.insert(conferenceUser).values(
+                userIds.map(userId => ({
+                    id: generateRandomId(),
+                    userId,
+                    conferenceId: patentId,
+                })),
+            );
+            return { message: 'Successful' };
+        }
+
         teacherIds.push(name);
         console.log('name', name);
         const newteacherIds = [...new Set(teacherIds)];
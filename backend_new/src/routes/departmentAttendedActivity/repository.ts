@@ -175,11 +175,12 @@ export async function deleteActivity(id: string, userId: string, role: string, a
 
 
 
-export async function seedActivity(patentData: DepartmentAttendedActivity, name: string) {
+export async function seedActivity(patentData: DepartmentAttendedActivity, name: string, userId?: string) {
     let patentId = '';
     try {
+        // The seeder may resolve the name to a user id itself; then skip the ilike scan.
         const user1 = await db.query.user.findFirst({
-            where: ilike(user.name, `%${name}%`),
+            where: userId ? eq(user.id, userId) : ilike(user.name, `%${name}%`),
         });
         if (!user1) {
             throw new Error('User not found');
@@ -1,6 +1,7 @@
 import express from 'express';
 import { catchError } from '../../utils/catch-error';
 import handleValidationError from '../../utils/handle-validation-error';
+import { seedBulk } from '../../utils/seed-bulk';
 import { createActivity, deleteActivity, getAllActivities, getEachActivity, seedActivity, updateActivity } from './repository';
 import { departmentConductedActivitySchema } from './schema';
 
@@ -97,14 +98,14 @@ Router.delete('/:id', async (req, res) => {
 Router.post('/seed', async (req, res) => {
     try {
         const data = req.body;
-        const { name, ...rest } = data;
+        const { name, userId, ...rest } = data;
         const { error } = departmentConductedActivitySchema.validate(rest, { abortEarly: false });
         if (error) {
             console.log('error', error);
             return handleValidationError(error, res);
         }
 
-        const journalData = await seedActivity(rest, name);
+        const journalData = await seedActivity(rest, name, userId);
         res.status(201).send(journalData);
     } catch (error) {
         console.log('catch error', error);
@@ -113,4 +114,6 @@ Router.post('/seed', async (req, res) => {
 });
 
 
+Router.post('/seed/bulk', seedBulk(departmentConductedActivitySchema, 'userId', seedActivity));
+
 export default Router;
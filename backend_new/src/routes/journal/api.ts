@@ -3,6 +3,7 @@ import { createJournal, deleteJournal, getAllJournal, getEachJournal, seedJourna
 import { catchError } from '../../utils/catch-error';
 import { journalSchema } from './schema';
 import handleValidationError from '../../utils/handle-validation-error';
+import { seedBulk } from '../../utils/seed-bulk';
 // import authenticateUser from '../../middleware/authenticate-user';
 // import { user } from '../../models/user';
 
@@ -97,14 +98,14 @@ Router.delete('/:id', async (req, res) => {
 Router.post('/seed', async (req, res) => {
     try {
         const data = req.body;
-        const { name, ...rest } = data;
+        const { name, teacherAdminId, ...rest } = data;
         const { error } = journalSchema.validate(rest, { abortEarly: false });
         if (error) {
             console.log('error', error);
             return handleValidationError(error, res);
         }
 
-        const journalData = await seedJournal(rest, name);
+        const journalData = await seedJournal(rest, name, teacherAdminId);
         res.status(201).send(journalData);
     } catch (error) {
         console.log('catch error', error);
@@ -112,4 +113,6 @@ Router.post('/seed', async (req, res) => {
     }
 });
 
+Router.post('/seed/bulk', seedBulk(journalSchema, 'teacherAdminId', seedJournal));
+
 export default Router;
@@ -305,12 +305,13 @@ export async function deleteJournal(id: string, userId: string,role:string,acces
     }
 }
 
-export async function seedJournal(patentData: Journal, name: string) {
+export async function seedJournal(patentData: Journal, name: string, teacherAdminId?: string) {
     let patentId = '';
     const { teacherIds, ...expData } = patentData;
     try {
+        // The seeder may resolve names to user ids itself; then skip the ilike scans.
         const user1 = await db.query.user.findFirst({
-            where: ilike(user.name, `%${name}%`),
+            where: teacherAdminId ? eq(user.id, teacherAdminId) : ilike(user.name, `%${name}%`),
         });
         if (!user1) {
             throw new Error('User not found');
@@ -334,6 +335,18 @@ export async function seedJournal(patentData: Journal, name: string) {
 
         patentId = insertedPatent.id;
 
+        if (teacherAdminId) {
+            const userIds = [...new Set([...(teacherIds ?? []), user1.id])];
+            await db.insert(journalUser).values(
+                userIds.map(userId => ({
+                    id: generateRandomId(),
+                    userId,
+                    journalId: patentId,
+                })),
+            );
+            return { message: 'Successful' };
+        }
+
         teacherIds.push(name);
 
         const newteacherIds = [...new Set(teacherIds)];
@@ -3,6 +3,7 @@ import { createPatent, deletePatent, getAllPatent, getEachPatent, seedPatent, up
 import { catchError } from '../../utils/catch-error';
 import { patentSchema } from './schema';
 import handleValidationError from '../../utils/handle-validation-error';
+import { seedBulk } from '../../utils/seed-bulk';
 // import authenticateUser from '../../middleware/authenticate-user';
 
 const Router = express.Router();
@@ -97,18 +98,20 @@ Router.delete('/:id', async (req, res) => {
 Router.post('/seed', async (req, res) => {
     try {
         const data = req.body;
-        const { name, ...rest } = data;
+        const { name, teacherAdminId, ...rest } = data;
         const { error } = patentSchema.validate(rest, { abortEarly: false });
         if (error) {
             console.log('error', error);
             return handleValidationError(error, res);
         }
 
-        const patentData = await seedPatent(rest, name);
+        const patentData = await seedPatent(rest, name, teacherAdminId);
         res.status(201).send(patentData);
     } catch (error) {
         catchError(error, res);
     }
 });
 
+Router.post('/seed/bulk', seedBulk(patentSchema, 'teacherAdminId', seedPatent));
+
 export default Router;
@@ -302,13 +302,14 @@ export async function deletePatent(id: string, userId: string,role:string,access
     }
 }
 
-export async function seedPatent(patentData: Patent, name: string) {
+export async function seedPatent(patentData: Patent, name: string, teacherAdminId?: string) {
     let patentId = '';
     const { teacherIds, ...expData } = patentData;
     console.log('uname', name);
     try {
+        // The seeder may resolve names to user ids itself; then skip the ilike scans.
         const user1 = await db.query.user.findFirst({
-            where: ilike(user.name, `%${name}%`),
+            where: teacherAdminId ? eq(user.id, teacherAdminId) : ilike(user.name, `%${name}%`),
         });
         console.log('user1', user1);
         if (!user1) {
@@ -333,6 +334,18 @@ export async function seedPatent(patentData: Patent, name: string) {
 
         patentId = insertedPatent.id;
 
+        if (teacherAdminId) {
+            const userIds = [...new Set([...(teacherIds ?? []), user1.id])];
+            await db.insert(patentUser).values(
+                userIds.map(userId => ({
+                    id: generateRandomId(),
+                    userId,
+                    patentId: patentId,
+                })),
+            );
+            return { message: 'Successful' };
+        }
+
         teacherIds.push(name);
 
         const newteacherIds = [...new Set(teacherIds)];
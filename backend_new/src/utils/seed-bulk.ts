@@ -0,0 +1,71 @@
+import { Request, Response } from 'express';
+import { ObjectSchema } from 'joi';
+import { CustomError } from '../middleware/error-handler';
+import { catchError } from './catch-error';
+
+// Upper bound on records per bulk request so one call can't hold the connection for too long.
+export const MAX_BULK_RECORDS = 500;
+
+type SeedFn = (data: any, name: string, resolvedId?: string) => Promise<unknown>;
+
+export type BulkSeedResult = {
+    index: number;
+    status: number;
+    message?: string;
+};
+
+/*
+ * Handler for bulk endpoints taking { records: [...] }.
+ * Every record is validated (after `pick`) and created on its own; the response reports a status per record:
+ * { results: [{ index, status: 201 | 400 | 500, message? }] }
+ * `create` throws a CustomError to answer a record with its own status, e.g. 400 for a duplicate.
+ */
+export function bulkHandler(
+    schema: ObjectSchema,
+    create: (data: any, record: any) => Promise<unknown>,
+    pick: (record: any) => any = record => record,
+) {
+    return async (req: Request, res: Response) => {
+        try {
+            const records = req.body?.records;
+            if (!Array.isArray(records)) {
+                return res.status(400).send({ message: 'Expected a body of the form { records: [...] }' });
+            }
+            if (records.length > MAX_BULK_RECORDS) {
+                return res.status(400).send({ message: `At most ${MAX_BULK_RECORDS} records per request` });
+            }
+
+            const results: BulkSeedResult[] = [];
+            for (const [index, record] of records.entries()) {
+                const data = pick(record ?? {});
+                const { error } = schema.validate(data, { abortEarly: false });
+                if (error) {
+                    results.push({ index, status: 400, message: error.details.map(d => d.message).join('; ') });
+                    continue;
+                }
+                try {
+                    await create(data, record);
+                    results.push({ index, status: 201 });
+                } catch (e) {
+                    const status = e instanceof CustomError ? e.status : 500;
+                    results.push({ index, status, message: e instanceof Error ? e.message : String(e) });
+                }
+            }
+            res.status(200).send({ results });
+        } catch (error) {
+            console.log('catch error', error);
+            catchError(error, res);
+        }
+    };
+}
+
+/*
+ * Handler for `POST /<entity>/seed/bulk`, each record shaped like the single `/seed` payload.
+ */
+export function seedBulk(schema: ObjectSchema, idField: string, seed: SeedFn) {
+    return bulkHandler(
+        schema,
+        (data, record) => seed(data, record.name, record[idField]),
+        ({ name, [idField]: resolvedId, ...rest }) => rest,
+    );
+}
@@ -0,0 +1 @@
+"""Seed data and tooling for the research portal backend. Run ``python -m seed --help``."""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the seed scripts.
+
+Imports every seeder in a fresh interpreter, reports the median import time
+and fails if any of them pulls in pandas or numpy at import time. Spreadsheet
+parsing must import those lazily, on the code path that needs them.
+
+Usage:
+    python bench/import_time.py [--repeat N] [--budget-ms MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "seeding",
+    "journal",
+    "journal_2023",
+    "patent",
+    "student",
+    "department",
+    "teachers",
+    "default_users",
+]
+
+HEAVY_MODULES = ["pandas", "numpy"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat):
+    """Return (median import time in ms, heavy modules loaded) for ``module``."""
+    timings = []
+    heavy = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=SEED_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(sample["ms"])
+        heavy = sample["heavy"]
+    return statistics.median(timings), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module (default 5)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if any import takes longer")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<16}{'median ms':>12}  heavy imports")
+    for module in MODULES:
+        ms, heavy = measure(module, args.repeat)
+        print(f"{module:<16}{ms:>12.1f}  {', '.join(heavy) or '-'}")
+        if heavy:
+            failures.append(f"{module} imports {', '.join(heavy)} at import time")
+        if args.budget_ms is not None and ms > args.budget_ms:
+            failures.append(f"{module} took {ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    if failures:
+        print("\n" + "\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
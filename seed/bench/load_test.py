@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+HTTP load test of the read endpoints the portal depends on.
+
+Starts N virtual users, each logging in through ``/auth/login`` with its own
+account and cookie jar, then replaying a weighted mix of the GET requests the
+portal's pages make: the landing page's ``/home`` (``getStats``) and
+``/home/stats``, the research lists ``/journal`` (``getAllJournal``),
+``/conference`` and ``/patent``, the analysis page's ``/publication``
+(``getAllPublications``, with and without filters), the teacher picker's
+``/user/multiselect`` and the department activity lists. Users pause for a
+random think time between requests and start spread over ``--ramp-up``.
+
+Reports requests per second, errors, 429s and p50/p90/p99/max latency per
+route, with a latency histogram for each. ``--save`` writes the results as
+JSON; ``--compare`` fails when a route's p99 got worse than in a saved run by
+more than ``--tolerance``.
+
+Accounts come from the ``users`` dataset: the teacher roster, or generated
+users with ``--data-dir`` (``python -m seed generate users``), whose
+passwords are their plain-text ``password`` field. ``--stub`` runs against
+``bench/stub_backend.py`` instead of a real backend.
+
+Usage:
+    python bench/load_test.py [--base-url URL] [--users 50] [--duration 60] [--ramp-up 10] [--think-ms 500]
+        [--mix home=25,journal=15,...] [--data-dir DIR] [--seed S]
+        [--save FILE] [--compare FILE] [--tolerance 0.2]
+    python bench/load_test.py --stub [--latency-ms MS] [--jitter-ms MS] ...
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from argparse import Namespace
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SEED_DIR)
+
+from seed_throughput import LatencyHistogram  # noqa: E402
+from stub_backend import StubBackend  # noqa: E402
+
+DEFAULT_BASE_URL = "http://localhost:5500/api/v1"
+# Route name -> path. The names are what --mix weighs and the report shows.
+ROUTES = {
+    "home": "/home",
+    "homeStats": "/home/stats",
+    "journal": "/journal",
+    "conference": "/conference",
+    "patent": "/patent",
+    "publication": "/publication",
+    "userMultiselect": "/user/multiselect",
+    "departmentAttended": "/departmentAttendedActivity",
+    "departmentConducted": "/departmentConductedActivity",
+}
+# Every visit lands on the home page; the research lists and the analysis page follow.
+DEFAULT_MIX = (
+    "home=25,homeStats=15,journal=15,conference=10,publication=15,patent=5,userMultiselect=10,"
+    "departmentAttended=3,departmentConducted=2"
+)
+# Query strings the analysis page sends to /publication; unfiltered loads are the most common.
+PUBLICATION_FILTERS = (
+    {},
+    {},
+    {},
+    {"type": "Journal"},
+    {"type": "Conference"},
+    {"year": "2024"},
+    {"startYear": "2023", "endYear": "2024"},
+    {"domain": "CCNCS"},
+    {"domain": "C3I"},
+    {"indexing": "Scopus"},
+)
+# Upper bounds in ms of the histogram rows printed per route.
+HISTOGRAM_BOUNDS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+LOGIN = "login"
+
+
+def parse_mix(text):
+    """Parse ``name=weight,...`` into a list of (route name, weight)."""
+    mix = []
+    for item in text.split(","):
+        if not item:
+            continue
+        name, _, weight = item.partition("=")
+        if name not in ROUTES:
+            raise ValueError(f"Unknown route '{name}'. Known routes: {', '.join(ROUTES)}")
+        mix.append((name, float(weight or 1)))
+    if not mix or not any(weight > 0 for _, weight in mix):
+        raise ValueError("The mix needs at least one route with a positive weight")
+    return mix
+
+
+class RouteStats:
+    """Outcome counts and latencies of one route."""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.rate_limited = 0
+        self.slowest = 0.0
+
+    def add(self, seconds, status):
+        self.histogram.add(seconds)
+        self.slowest = max(self.slowest, seconds)
+        if status == 429:
+            self.rate_limited += 1
+        elif status is None or status >= 400:
+            self.errors += 1
+
+    def merge(self, other):
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+        self.rate_limited += other.rate_limited
+        self.slowest = max(self.slowest, other.slowest)
+
+    def share_below(self, milliseconds):
+        """Samples faster than ``milliseconds``."""
+        limit = self.histogram.bucket(milliseconds / 1000)
+        return sum(count for bucket, count in self.histogram.buckets.items() if bucket < limit)
+
+
+class VirtualUser(threading.Thread):
+    """
+    One portal user: logs in, then sends GETs from the mix until the deadline.
+
+    Each user has its own ``requests.Session``, so its own cookie jar and
+    keep-alive connection, like a browser. Stats are kept per user and merged
+    at the end, so the threads share nothing while running.
+    """
+
+    def __init__(self, number, base_url, account, mix, think, start_at, deadline, seed):
+        super().__init__(daemon=True)
+        self.number = number
+        self.base_url = base_url.rstrip("/")
+        self.account = account
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.think = think
+        self.start_at = start_at
+        self.deadline = deadline
+        self.random = random.Random(f"{seed}:{number}")
+        self.stats = {}
+
+    def _timed(self, name, send):
+        started = time.perf_counter()
+        try:
+            status = send().status_code
+        except Exception:
+            status = None
+        self.stats.setdefault(name, RouteStats()).add(time.perf_counter() - started, status)
+        return status
+
+    def run(self):
+        import requests
+
+        time.sleep(max(0.0, self.start_at - time.monotonic()))
+        with requests.Session() as session:
+            response = None
+
+            def login():
+                nonlocal response
+                response = session.post(
+                    f"{self.base_url}/auth/login",
+                    json={"empId": self.account["empId"], "password": self.account["password"]},
+                )
+                return response
+
+            if self._timed(LOGIN, login) != 200:
+                return
+            # The backend returns the token in the body; the portal stores it as the accessToken cookie.
+            session.cookies.set("accessToken", response.json()["token"])
+            while time.monotonic() < self.deadline:
+                name = self.random.choices(self.names, self.weights)[0]
+                params = self.random.choice(PUBLICATION_FILTERS) if name == "publication" else None
+                url = self.base_url + ROUTES[name]
+                self._timed(name, lambda: session.get(url, params=params))
+                if self.think:
+                    # Exponential think time: most pauses are short, a few are long.
+                    pause = self.random.expovariate(1 / self.think)
+                    time.sleep(max(0.0, min(pause, self.deadline - time.monotonic())))
+
+
+def load_accounts(data_dir=None):
+    """Logins from the ``users`` dataset (the teacher roster, or generated users in ``data_dir``)."""
+    from seeding import entities  # noqa: F401  (registers the built-in entities)
+    from seeding.registry import get_entity
+
+    options = Namespace(users_file=None, default_users_file=None, data_dir=data_dir)
+    return [{"empId": user["empId"], "password": user["password"]} for user in get_entity("users").load(options)]
+
+
+def run_load(base_url, accounts, users, duration, ramp_up=0.0, think=0.0, mix=None, seed=0):
+    """
+    Run the load test and return (route name -> RouteStats, seconds the requests took).
+
+    Args:
+        base_url (str): API base URL, e.g. http://localhost:5500/api/v1
+        accounts (list): ``{"empId", "password"}`` logins, dealt out to the users in turn
+        users (int): Concurrent virtual users
+        duration (float): Seconds every user keeps sending once started
+        ramp_up (float, optional): Seconds over which the users start. Defaults to 0
+        think (float, optional): Mean pause in seconds between a user's requests. Defaults to 0
+        mix (list, optional): (route name, weight) pairs. Defaults to DEFAULT_MIX
+        seed (int, optional): Seed of the route choices and think times. Defaults to 0
+    """
+    mix = mix or parse_mix(DEFAULT_MIX)
+    started = time.monotonic()
+    threads = []
+    for number in range(users):
+        start_at = started + (ramp_up * number / users if users else 0.0)
+        threads.append(
+            VirtualUser(
+                number, base_url, accounts[number % len(accounts)], mix, think, start_at, start_at + duration, seed
+            )
+        )
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    stats = {}
+    for thread in threads:
+        for name, route in thread.stats.items():
+            stats.setdefault(name, RouteStats()).merge(route)
+    return stats, elapsed
+
+
+def summarize(stats, elapsed):
+    """One JSON-serializable result per route, in ROUTES order with the logins first."""
+    results = []
+    for name in [LOGIN, *ROUTES]:
+        if name not in stats:
+            continue
+        route = stats[name]
+        histogram = route.histogram
+        results.append(
+            {
+                "route": name,
+                "requests": histogram.count,
+                "requests_per_second": histogram.count / elapsed if elapsed else 0.0,
+                "errors": route.errors,
+                "rate_limited": route.rate_limited,
+                "p50_ms": histogram.percentile(0.5),
+                "p90_ms": histogram.percentile(0.9),
+                "p99_ms": histogram.percentile(0.99),
+                "max_ms": route.slowest * 1000,
+                "histogram": {f"<{bound}": route.share_below(bound) for bound in HISTOGRAM_BOUNDS},
+            }
+        )
+    return results
+
+
+def print_report(results, elapsed):
+    print(
+        f"{'route':<21}{'requests':>9}{'req/s':>9}{'errors':>8}{'429s':>6}"
+        f"{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['route']:<21}{result['requests']:>9}{result['requests_per_second']:>9.1f}"
+            f"{result['errors']:>8}{result['rate_limited']:>6}{result['p50_ms']:>9.1f}{result['p90_ms']:>9.1f}"
+            f"{result['p99_ms']:>9.1f}{result['max_ms']:>9.1f}"
+        )
+    total = sum(result["requests"] for result in results if result["route"] != LOGIN)
+    print(f"{total} requests in {elapsed:.1f}s, {total / elapsed if elapsed else 0.0:.1f} req/s.")
+    for result in results:
+        print(f"\n{result['route']} latency:")
+        below = 0
+        for label, cumulative in result["histogram"].items():
+            count = cumulative - below
+            below = cumulative
+            if count:
+                share = count / result["requests"]
+                print(f"  {label + ' ms':>10} {count:>8} {share:>6.1%} {'#' * round(share * 40)}")
+        if result["requests"] > below:
+            count = result["requests"] - below
+            share = count / result["requests"]
+            print(f"  {'slower':>10} {count:>8} {share:>6.1%} {'#' * round(share * 40)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the portal's read endpoints with concurrent virtual users.")
+    parser.add_argument(
+        "--base-url",
+        default=os.environ.get("SEED_BASE_URL", DEFAULT_BASE_URL),
+        help=f"API base URL (default SEED_BASE_URL or {DEFAULT_BASE_URL})",
+    )
+    parser.add_argument("--users", type=int, default=50, help="concurrent virtual users (default 50)")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds each user sends requests (default 60)")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="seconds over which users start (default 10)")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="mean pause between requests (default 500)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"route weights (default {DEFAULT_MIX})")
+    parser.add_argument("--data-dir", metavar="DIR", default=None, help="log in as the generated users in DIR")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the route choices and think times (default 0)")
+    parser.add_argument("--stub", action="store_true", help="run against bench/stub_backend.py instead of --base-url")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stub latency per request (default 5)")
+    parser.add_argument("--jitter-ms", type=float, default=2.0, help="stub latency jitter (default 2)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="fail when a route's p99 is worse than in this saved run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p99 increase for --compare (default 0.2)")
+    options = parser.parse_args()
+
+    try:
+        mix = parse_mix(options.mix)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    accounts = load_accounts(options.data_dir)
+    if not accounts:
+        print("Error: no user accounts to log in with.")
+        sys.exit(1)
+
+    backend = None
+    base_url = options.base_url
+    if options.stub:
+        backend = StubBackend(options.latency_ms / 1000, options.jitter_ms / 1000)
+        base_url = backend.start()
+    print(
+        f"{options.users} users against {base_url} for {options.duration:.0f}s "
+        f"(ramp-up {options.ramp_up:.0f}s, think time {options.think_ms:.0f} ms)."
+    )
+    try:
+        stats, elapsed = run_load(
+            base_url,
+            accounts,
+            options.users,
+            options.duration,
+            options.ramp_up,
+            options.think_ms / 1000,
+            mix,
+            options.seed,
+        )
+    finally:
+        if backend is not None:
+            backend.stop()
+
+    results = summarize(stats, elapsed)
+    print_report(results, elapsed)
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    login = next((result for result in results if result["route"] == LOGIN), None)
+    failed = login is None or login["errors"] == login["requests"]
+    if failed:
+        print("Error: no virtual user could log in.")
+    regressions = []
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as f:
+            baseline = {result["route"]: result for result in json.load(f)}
+        for result in results:
+            before = baseline.get(result["route"])
+            if before and result["p99_ms"] > before["p99_ms"] * (1 + options.tolerance):
+                regressions.append(result)
+                print(f"Regression: {result['route']} p99 {result['p99_ms']:.1f} ms, was {before['p99_ms']:.1f} ms.")
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
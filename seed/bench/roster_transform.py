@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the roster transform stage.
+
+Builds a synthetic teacher roster, shapes it with the vectorized
+``transform_roster`` and with the per-row ``apply`` version it replaced, and
+reports rows per second for both. Both must produce identical records.
+
+Usage:
+    python bench/roster_transform.py [--rows N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SEED_DIR)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from seeding.roster import TEACHER_CONSTANTS, TEACHER_FIELDS, transform_roster  # noqa: E402
+
+
+def synthetic_roster(rows, seed=0):
+    """Return a teacher roster shaped like seed/teachers.csv with ``rows`` rows."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 9000, rows)
+    joined = pd.Series(pd.Timestamp("2000-01-01") + pd.to_timedelta(days, unit="D")).dt.strftime("%Y-%m-%d")
+    phones = pd.Series(rng.integers(6_000_000_000, 9_999_999_999, rows), dtype="float64")
+    # A few blanks, as in real exports.
+    joined[rng.random(rows) < 0.02] = None
+    phones[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "empId": [f"teacher{i}@pes.edu" if i % 10 else f"T{i:06d}" for i in range(rows)],
+            "name": [f"Dr. Teacher {i}" for i in range(rows)],
+            "panNo": [f"ABCDE{i % 10000:04d}F" for i in range(rows)],
+            "phno": phones,
+            "designation": rng.choice(["Professor", "Associate Professor", "Assistant Professor"], rows),
+            "dateofJoining": joined,
+            "role": "user",
+            "accessTo": "none",
+        }
+    )
+
+
+def per_row_transform(data):
+    """The per-row ``apply`` transform that ``transform_roster`` replaced, kept as the baseline."""
+    data = data.copy()
+    data['password'] = data['empId'].apply(lambda x: x.split('@')[0] if '@' in x else x)
+    data['phno'] = data['phno'].apply(lambda x: str(int(x)) if pd.notnull(x) else '')
+    for field, value in TEACHER_CONSTANTS.items():
+        data[field] = value
+    data['dateofJoining'] = pd.to_datetime(data['dateofJoining'], format="%Y-%m-%d", errors='coerce').fillna(
+        pd.Timestamp(datetime.today().date())
+    )
+    data['dateofJoining'] = data['dateofJoining'].apply(lambda x: x.isoformat() if pd.notnull(x) else None)
+    return data[TEACHER_FIELDS]
+
+
+def vectorized_transform(data):
+    return transform_roster(
+        data, TEACHER_FIELDS, TEACHER_CONSTANTS, derive_passwords=True, parse_dates=True, date_format="%Y-%m-%d"
+    )
+
+
+def measure(transform, data, repeat):
+    """Return (median seconds, output of the last run)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = transform(data)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic roster size (default 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per transform (default 3)")
+    args = parser.parse_args()
+
+    data = synthetic_roster(args.rows)
+    results = {}
+    print(f"{'transform':<12}{'median s':>10}{'rows/s':>14}")
+    for name, transform in (("per-row", per_row_transform), ("vectorized", vectorized_transform)):
+        seconds, output = measure(transform, data, args.repeat)
+        results[name] = output
+        print(f"{name:<12}{seconds:>10.3f}{args.rows / seconds:>14,.0f}")
+
+    if results["per-row"].to_dict(orient="records") != results["vectorized"].to_dict(orient="records"):
+        print("\nThe transforms disagree.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Seeding throughput benchmark against a local stub backend.
+
+Starts ``bench/stub_backend.py`` in-process, then seeds synthetic datasets
+(``seeding/synthetic.py``) of each size through every selected seeder at
+every concurrency level. Each case runs in a fresh interpreter so its peak
+RSS is its own, and reports records per second, p50/p99 request latency
+seen by the client, 429s and peak RSS. ``--save`` writes the results as JSON; ``--compare`` fails when a
+case got slower than a saved run by more than ``--tolerance``.
+
+Usage:
+    python bench/seed_throughput.py [--entities users,journal] [--sizes 100,10000] [--concurrency 8,64]
+        [--latency-ms MS] [--jitter-ms MS] [--limit N --window S] [--batch-size N]
+        [--save FILE] [--compare FILE] [--tolerance 0.2]
+"""
+import argparse
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import time
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SEED_DIR)
+
+from stub_backend import StubBackend  # noqa: E402
+
+# The seeders the stub answers for: everything posted to the routes in stub_backend.ROUTES.
+ENTITIES = ("users", "journal", "conference", "patent", "departmentAttended", "departmentConducted")
+
+
+class LatencyHistogram:
+    """Log-bucketed latencies (1% resolution), so a million samples take a few kB instead of a list."""
+
+    BASE = math.log(1.01)
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+
+    def bucket(self, seconds):
+        return int(math.log(max(seconds * 1e6, 1.0)) / self.BASE)
+
+    def add(self, seconds):
+        bucket = self.bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+
+    def merge(self, other):
+        """Add the samples of ``other``, e.g. one histogram per thread combined at the end."""
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+
+    def percentile(self, fraction):
+        """Latency in ms below which ``fraction`` of the samples fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return math.exp((bucket + 0.5) * self.BASE) / 1000
+        return None
+
+
+class TimedTransport:
+    """Wraps a transport and records how long each request takes."""
+
+    def __init__(self, transport, histogram):
+        self.transport = transport
+        self.histogram = histogram
+
+    async def post_json(self, url, record):
+        start = time.perf_counter()
+        response = await self.transport.post_json(url, record)
+        self.histogram.add(time.perf_counter() - start)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def synthetic_records(entity, count):
+    """
+    Yield ``count`` records for ``entity`` from its synthetic generator (see seeding/synthetic.py).
+
+    The teacher pool is as large as the dataset, so ``users`` get distinct names as well as logins.
+    """
+    from seeding.synthetic import generator
+
+    return generator(entity.name, teachers=max(count, 1))(count)
+
+
+def run_case(case):
+    """Seed one synthetic dataset and return the measurements; runs in the child interpreter."""
+    from seeding import entities  # noqa: F401  (registers the built-in entities)
+    from seeding.registry import get_entity
+    from seeding.sender import Seeder
+
+    entity = get_entity(case["entity"])
+    histogram = LatencyHistogram()
+    with Seeder(concurrency=case["concurrency"]) as seeder:
+        seeder.transport = TimedTransport(seeder.transport, histogram)
+        start = time.perf_counter()
+        summary = seeder.send(
+            entity.url(case["base_url"]),
+            synthetic_records(entity, case["records"]),
+            describe=entity.describe,
+            schema=entity.schema,
+            bulk_url=entity.bulk_url(case["base_url"]) if case["batch_size"] else None,
+            batch_size=case["batch_size"],
+        )
+        elapsed = time.perf_counter() - start
+    return {
+        "sent": summary.sent,
+        "failed": summary.failed + summary.errors + summary.invalid,
+        "rate_limited": summary.rate_limited,
+        "seconds": elapsed,
+        "records_per_second": summary.sent / elapsed if elapsed else 0.0,
+        "p50_ms": histogram.percentile(0.5),
+        "p99_ms": histogram.percentile(0.99),
+        # ru_maxrss is in kB on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def measure(case):
+    """Run ``case`` in a fresh interpreter and return its measurements merged into it."""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)],
+        cwd=SEED_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{case['entity']} x{case['records']} failed:\n{result.stderr}")
+    return {**case, **json.loads(result.stdout.strip().splitlines()[-1])}
+
+
+def _key(result):
+    return result["entity"], result["records"], result["concurrency"], result["batch_size"]
+
+
+def _csv_ints(text):
+    return [int(value) for value in text.split(",") if value]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure seeding throughput against a local stub backend.")
+    parser.add_argument("--entities", default=",".join(ENTITIES), help=f"comma-separated seeders (default {','.join(ENTITIES)})")
+    parser.add_argument("--sizes", default="100,10000", help="comma-separated dataset sizes, up to 1000000 (default 100,10000)")
+    parser.add_argument("--concurrency", default="8,64", help="comma-separated concurrency levels (default 8,64)")
+    parser.add_argument("--batch-size", type=int, default=None, help="records per request through the /bulk routes")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stub latency per request (default 5)")
+    parser.add_argument("--jitter-ms", type=float, default=2.0, help="stub latency jitter (default 2)")
+    parser.add_argument("--limit", type=int, default=None, help="stub requests per window before 429 (default no limit)")
+    parser.add_argument("--window", type=float, default=1.0, help="stub rate-limit window in seconds (default 1)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="fail when a case is slower than in this saved run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown for --compare (default 0.2)")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    if options.case:
+        # Child interpreter: the sender's per-record status lines are part of the cost, but not of the output.
+        stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        print(json.dumps(run_case(json.loads(options.case))), file=stdout)
+        return
+
+    backend = StubBackend(options.latency_ms / 1000, options.jitter_ms / 1000, options.limit, options.window)
+    base_url = backend.start()
+    results = []
+    print(f"{'seeder':<20}{'records':>9}{'conc':>6}{'rec/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'429s':>7}{'RSS MB':>9}")
+    try:
+        for name in options.entities.split(","):
+            for records in _csv_ints(options.sizes):
+                for concurrency in _csv_ints(options.concurrency):
+                    case = {
+                        "entity": name,
+                        "records": records,
+                        "concurrency": concurrency,
+                        "batch_size": options.batch_size,
+                        "base_url": base_url,
+                    }
+                    result = measure(case)
+                    results.append(result)
+                    print(
+                        f"{name:<20}{records:>9}{concurrency:>6}{result['records_per_second']:>10.0f}"
+                        f"{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}{result['rate_limited']:>7}"
+                        f"{result['peak_rss_mb']:>9.1f}"
+                    )
+    finally:
+        backend.stop()
+
+    failed = [result for result in results if result["failed"] or result["sent"] != result["records"]]
+    for result in failed:
+        print(f"Error: {result['entity']} x{result['records']}: {result['sent']} of {result['records']} records sent.")
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    regressions = []
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as f:
+            baseline = {_key(result): result for result in json.load(f)}
+        for result in results:
+            before = baseline.get(_key(result))
+            if before and result["records_per_second"] < before["records_per_second"] * (1 - options.tolerance):
+                regressions.append(result)
+                print(
+                    f"Regression: {result['entity']} x{result['records']} at concurrency {result['concurrency']}: "
+                    f"{result['records_per_second']:.0f} rec/s, was {before['records_per_second']:.0f}."
+                )
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
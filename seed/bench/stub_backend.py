@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the backend's seed and read endpoints, for benchmarks.
+
+Answers the routes the seeders post to (``/auth/register``, ``/journal/seed``,
+``/conference/seed``, ``/patent/seed``, the department activity ``/seed``
+routes and their ``/bulk`` variants) under ``/api/v1`` with a 201, after a
+configurable latency plus uniform jitter. ``/auth/login`` returns a token
+for any login, and the GET routes the load test replays (``/home``,
+``/journal``, ``/publication``, ...) answer with empty lists, or a 401
+without the ``accessToken`` cookie where the backend requires it. With a
+request limit it behaves like the backend's express-rate-limit middleware:
+``RateLimit-*`` headers on every response and a 429 with ``Retry-After``
+once the window is spent.
+
+Usage:
+    python bench/stub_backend.py [--port 5500] [--latency-ms MS] [--jitter-ms MS] [--limit N --window S]
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_PREFIX = "/api/v1"
+ROUTES = (
+    "/auth/register",
+    "/journal/seed",
+    "/conference/seed",
+    "/patent/seed",
+    "/departmentAttendedActivity/seed",
+    "/departmentConductedActivity/seed",
+)
+HOME_STATS = ("users", "journals", "conferences", "patents", "dept_attended", "dept_conducted")
+# GET route -> (needs the accessToken cookie, response body).
+READ_ROUTES = {
+    "/home": (False, dict.fromkeys(HOME_STATS, 0)),
+    "/home/stats": (True, {"journals": 0, "conferences": 0, "patents": 0, "total": 0}),
+    "/journal": (True, []),
+    "/conference": (True, []),
+    "/patent": (True, []),
+    "/publication": (True, []),
+    "/user/multiselect": (True, []),
+    "/departmentAttendedActivity": (True, []),
+    "/departmentConductedActivity": (True, []),
+}
+
+
+class StubBackend:
+    """
+    Threaded HTTP server answering the seed routes.
+
+    Args:
+        latency (float, optional): Seconds every request takes. Defaults to 0
+        jitter (float, optional): Up to this many seconds are added or taken off at random. Defaults to 0
+        limit (int, optional): Requests allowed per window before answering 429. Defaults to no limit
+        window (float, optional): Rate-limit window in seconds. Defaults to 1
+        seed (int, optional): Seed of the jitter, so runs are repeatable
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, limit=None, window=1.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.limit = limit
+        self.window = window
+        self.requests = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._server = None
+
+    def _delay(self):
+        with self._lock:
+            offset = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + offset)
+
+    def _admit(self):
+        """Count a request against the window; returns (allowed, remaining, seconds to reset)."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._window_count = 0
+            reset = self.window - (now - self._window_start)
+            if self.limit is None:
+                return True, None, reset
+            self._window_count += 1
+            allowed = self._window_count <= self.limit
+            if not allowed:
+                self.rate_limited += 1
+            return allowed, max(0, self.limit - self._window_count), reset
+
+    def _handler(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle on, each response waits for a delayed ACK.
+            disable_nagle_algorithm = True
+
+            def _reply(self, status, payload, headers=()):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _throttle(self):
+                """Apply the rate limit and latency; returns the RateLimit headers, or None once answered 429."""
+                allowed, remaining, reset = backend._admit()
+                headers = []
+                if remaining is not None:
+                    # express-rate-limit reports whole seconds.
+                    headers = [
+                        ("RateLimit-Limit", str(backend.limit)),
+                        ("RateLimit-Remaining", str(remaining)),
+                        ("RateLimit-Reset", str(math.ceil(reset))),
+                    ]
+                if not allowed:
+                    self._reply(429, {"message": "Too many requests"}, headers + [("Retry-After", str(math.ceil(reset)))])
+                    return None
+                time.sleep(backend._delay())
+                return headers
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                route = path[len(API_PREFIX):] if path.startswith(API_PREFIX) else None
+                if route not in READ_ROUTES:
+                    self._reply(404, {"message": f"Cannot GET {path}"})
+                    return
+                headers = self._throttle()
+                if headers is None:
+                    return
+                authenticated, payload = READ_ROUTES[route]
+                if authenticated and "accessToken=" not in self.headers.get("Cookie", ""):
+                    self._reply(401, "Unauthorized", headers)
+                    return
+                self._reply(200, payload, headers)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                path = self.path.split("?", 1)[0]
+                route = path[len(API_PREFIX):] if path.startswith(API_PREFIX) else None
+                bulk = route is not None and route.endswith("/bulk")
+                if bulk:
+                    route = route[: -len("/bulk")]
+                if route not in ROUTES and route != "/auth/login":
+                    self._reply(404, {"message": f"Cannot POST {path}"})
+                    return
+                headers = self._throttle()
+                if headers is None:
+                    return
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    self._reply(400, {"message": "Invalid JSON"}, headers)
+                    return
+                if route == "/auth/login":
+                    data = {"empId": payload.get("empId")}
+                    self._reply(200, {"message": "Successfully logged in", "data": data, "token": "stub"}, headers)
+                elif bulk:
+                    results = [{"index": index, "status": 201} for index in range(len(payload.get("records", [])))]
+                    self._reply(200, {"results": results}, headers)
+                else:
+                    self._reply(201, {"message": "Created"}, headers)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self, host="127.0.0.1", port=0):
+        """Serve on a background thread; returns the API base URL. Port 0 picks a free port."""
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}{API_PREFIX}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5500)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="time every request takes")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random +/- added to the latency")
+    parser.add_argument("--limit", type=int, default=None, help="requests per window before answering 429")
+    parser.add_argument("--window", type=float, default=1.0, help="rate-limit window in seconds (default 1)")
+    options = parser.parse_args()
+
+    backend = StubBackend(options.latency_ms / 1000, options.jitter_ms / 1000, options.limit, options.window)
+    print(f"Serving seed and read routes at {backend.start(options.host, options.port)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.stop()
+        print(f"{backend.requests} requests, {backend.rate_limited} answered 429.")
+
+
+if __name__ == "__main__":
+    main()
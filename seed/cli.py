@@ -0,0 +1,266 @@
+"""
+Single entry point for seeding every entity from one process.
+
+Usage:
+    python -m seed list
+    python -m seed run [entity ...] [--base-url URL] [--concurrency N] ...
+    python -m seed run [entity ...] --shards K [--workers N] [--queue FILE]
+    python -m seed validate [entity ...]
+    python -m seed generate [entity ...] --out DIR [--records N] [--teachers N] [--seed S] [--format parquet]
+    python -m seed bootstrap [entity ...] (--database-url URL | --sqlite PATH | --out DIR)
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+from .seeding import Seeder
+from .seeding.sender import MAX_BULK_RECORDS
+from .seeding import entities  # noqa: F401  (registers the built-in entities)
+from .seeding.copyload import BOOTSTRAP_ENTITIES, build_plan, load_postgres, load_sqlite, write_copy_files
+from .seeding.graph import seed_graph
+from .seeding.names import SharedNameIndex
+from .seeding.registry import ENTITIES, get_entity, with_dependencies
+from .seeding.schemas import USER
+from .seeding.shards import run_sharded
+from .seeding.synthetic import DEFAULT_TEACHERS, FORMATS, write_dataset
+
+DEFAULT_BASE_URL = "http://localhost:5500/api/v1"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m seed", description="Seed the research portal backend.")
+    parser.add_argument(
+        "--plugin",
+        action="append",
+        default=[],
+        help="import MODULE to register extra entities (repeatable)",
+        metavar="MODULE",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the registered entities and their endpoints")
+
+    validate = commands.add_parser("validate", help="check datasets against the backend schemas without sending")
+    validate.add_argument("entities", nargs="*", help="entity names, see `python -m seed list`")
+    _add_source_options(validate)
+
+    run = commands.add_parser("run", help="seed the given entities (all of them when none are given)")
+    run.add_argument("entities", nargs="*", help="entity names, see `python -m seed list`")
+    run.add_argument("--with-deps", action="store_true", help="also seed every entity the given ones depend on")
+    run.add_argument(
+        "--base-url",
+        default=os.environ.get("SEED_BASE_URL", DEFAULT_BASE_URL),
+        help=f"API base URL (default SEED_BASE_URL or {DEFAULT_BASE_URL})",
+    )
+    run.add_argument("--token", default=os.environ.get("SEED_TOKEN"), help="accessToken cookie for authenticated routes")
+    run.add_argument("--concurrency", type=int, default=None, help="requests in flight (default SEED_CONCURRENCY or 8)")
+    run.add_argument(
+        "--batch-size",
+        type=_batch_size,
+        default=None,
+        help=f"records per request on entities with a /seed/bulk endpoint, at most {MAX_BULK_RECORDS}; keep each "
+        "request under the backend's 100kb JSON body limit (default: one record per request)",
+    )
+    run.add_argument("--pool-size", type=int, default=None, help="connections per host (default SEED_POOL_SIZE or 16)")
+    run.add_argument("--http2", action="store_true", default=None, help="use HTTP/2 when httpx[http2] is installed")
+    run.add_argument("--checkpoint", default=None, help="resumable checkpoint file (default SEED_CHECKPOINT)")
+    run.add_argument("--manifest", default=None, help="send only records changed since the last run (default SEED_MANIFEST)")
+    run.add_argument(
+        "--resolve-names",
+        action="store_true",
+        help="resolve teacher names to user ids client-side so the backend skips its name lookups",
+    )
+    run.add_argument(
+        "--names-from",
+        action="append",
+        default=[],
+        metavar="CSV",
+        help="user export with id and name columns for --resolve-names (repeatable; default: fetch from the API)",
+    )
+    run.add_argument("--shards", type=int, default=None, help="split every dataset into N shards seeded in parallel")
+    run.add_argument("--workers", type=int, default=None, help="worker processes for --shards (default: N or every core)")
+    run.add_argument(
+        "--queue", metavar="FILE", default=None, help="work-queue file shared with other hosts seeding the same shards"
+    )
+    run.add_argument(
+        "--shard-key", metavar="FIELD", default=None, help="shard by a hash of FIELD (default: by position in the file)"
+    )
+    _add_source_options(run)
+
+    generate = commands.add_parser(
+        "generate", help="write synthetic datasets shaped like the bundled ones, for --data-dir"
+    )
+    generate.add_argument("entities", nargs="*", help="entity names (default: every entity with bundled records)")
+    generate.add_argument("--out", metavar="DIR", required=True, help="directory for the generated datasets")
+    generate.add_argument("--records", type=int, default=1000, help="records per entity (default 1000)")
+    generate.add_argument(
+        "--teachers",
+        type=int,
+        default=DEFAULT_TEACHERS,
+        help=f"synthetic teachers: the `users` generated and the names publications use (default {DEFAULT_TEACHERS})",
+    )
+    generate.add_argument("--seed", type=int, default=0, help="random seed; same seed, same datasets (default 0)")
+    generate.add_argument("--format", choices=FORMATS, default="jsonl", help="jsonl, or parquet (needs pyarrow)")
+
+    bootstrap = commands.add_parser(
+        "bootstrap", help="COPY users, journals and conferences straight into an empty database, bypassing the API"
+    )
+    bootstrap.add_argument(
+        "entities", nargs="*", help=f"any of {', '.join(BOOTSTRAP_ENTITIES)} (default: all of them)"
+    )
+    target = bootstrap.add_mutually_exclusive_group()
+    target.add_argument(
+        "--database-url", default=os.environ.get("DB_URL"), help="Postgres connection string (default DB_URL)"
+    )
+    target.add_argument("--sqlite", metavar="PATH", help="load into a SQLite stand-in instead, e.g. :memory: for a dry run")
+    target.add_argument("--out", metavar="DIR", help="write <table>.copy files and a load.psql script instead")
+    _add_source_options(bootstrap)
+    return parser
+
+
+def _batch_size(text):
+    try:
+        size = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if not 1 <= size <= MAX_BULK_RECORDS:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_BULK_RECORDS} (the bulk endpoints' limit)")
+    return size
+
+
+def _add_source_options(parser):
+    parser.add_argument("--users-file", default=None, help="teacher roster CSV for `users` (default seed/teachers.csv)")
+    parser.add_argument(
+        "--default-users-file", default=None, help="workbook for `defaultUsers` (default seed/default_users.xlsx)"
+    )
+    parser.add_argument(
+        "--data-dir", metavar="DIR", default=None, help="read <dataset>.jsonl (or .parquet) files from DIR instead of seed/data"
+    )
+
+
+def _select(names):
+    try:
+        return [get_entity(name) for name in names] or list(ENTITIES.values())
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        sys.exit(1)
+
+
+def list_entities():
+    for entity in ENTITIES.values():
+        depends = f"  (after {', '.join(entity.depends_on)})" if entity.depends_on else ""
+        print(f"{entity.name:<22}{entity.path}{depends}")
+
+
+def validate(options):
+    invalid = 0
+    for entity in _select(options.entities):
+        if entity.schema is None:
+            print(f"{entity.name}: no schema, skipped.")
+            continue
+        checked = 0
+        for index, record in enumerate(entity.load(options)):
+            checked += 1
+            errors = entity.schema.errors(record)
+            if errors:
+                invalid += 1
+                label = entity.describe(record) if entity.describe else f"record {index + 1}"
+                print(f"{entity.name}: {label}:")
+                for error in errors:
+                    print(f"    {error}")
+        print(f"{entity.name}: {checked} records checked.")
+    if invalid:
+        print(f"{invalid} invalid records.")
+        sys.exit(1)
+
+
+def run(options):
+    selected = _select(options.entities)
+    if options.with_deps:
+        selected = with_dependencies(selected)
+
+    if options.shards:
+        try:
+            results = run_sharded(options, selected)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if any(
+            isinstance(result, Exception) or result.failed or result.errors or result.invalid
+            for result in results.values()
+        ):
+            sys.exit(1)
+        return
+
+    cookies = {"accessToken": options.token} if options.token else None
+    if options.resolve_names:
+        options.name_index = SharedNameIndex(options.names_from, base_url=options.base_url, cookies=cookies)
+    with Seeder(
+        concurrency=options.concurrency,
+        checkpoint=options.checkpoint,
+        manifest=options.manifest,
+        pool_size=options.pool_size,
+        http2=options.http2,
+        cookies=cookies,
+    ) as seeder:
+        try:
+            results = seeder.run(seed_graph(seeder, selected, options.base_url, options))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    if any(
+        isinstance(result, Exception) or result.failed or result.errors or result.invalid
+        for result in results.values()
+    ):
+        sys.exit(1)
+
+
+def generate(options):
+    # defaultUsers would register the same synthetic teachers as users.
+    names = options.entities or [name for name in ENTITIES if name != "defaultUsers"]
+    for entity in _select(names):
+        started = time.perf_counter()
+        # The users are the teacher pool the other entities' names are drawn from.
+        count = options.teachers if entity.schema is USER else options.records
+        try:
+            path = write_dataset(entity.name, count, options.out, options.format, options.teachers, options.seed)
+        except ValueError as e:
+            print(f"{entity.name}: skipped, {e}.")
+            continue
+        print(f"{entity.name}: {count} records written to {path} in {time.perf_counter() - started:.1f}s.")
+
+
+def bootstrap(options):
+    unknown = [name for name in options.entities if name not in BOOTSTRAP_ENTITIES]
+    if unknown:
+        print(f"Error: cannot bootstrap {', '.join(unknown)}; use `python -m seed run` for those.")
+        sys.exit(1)
+    if not (options.database_url or options.sqlite or options.out):
+        print("Error: give --database-url (or set DB_URL), --sqlite or --out.")
+        sys.exit(1)
+    plan = build_plan(_select(options.entities or list(BOOTSTRAP_ENTITIES)), options)
+    print(f"{len(plan)} rows prepared, {plan.skipped} records skipped.")
+    if options.out:
+        write_copy_files(options.out, plan)
+    elif options.sqlite:
+        load_sqlite(options.sqlite, plan).close()
+    else:
+        load_postgres(options.database_url, plan)
+
+
+def main(argv=None):
+    options = build_parser().parse_args(argv)
+    for module in options.plugin:
+        importlib.import_module(module)
+    if options.command == "list":
+        list_entities()
+    elif options.command == "validate":
+        validate(options)
+    elif options.command == "generate":
+        generate(options)
+    elif options.command == "bootstrap":
+        bootstrap(options)
+    else:
+        run(options)
@@ -1,5460 +1,23 @@
 import sys
-import os
-import pandas as pd
-import requests
-from datetime import datetime
-import numpy as np
-import json
 
+from seeding import Seeder, load_dataset
 
-if len(sys.argv) != 3:
-    print("Usage: python seed.py <path_to_excel_file> <api_url>")
-    sys.exit(1)
 
-journal_api_url = sys.argv[1]
-conference_api_url = sys.argv[2]
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python journal.py <journal_api_url> <conference_api_url>")
+        sys.exit(1)
 
+    journal_api_url = sys.argv[1]
+    conference_api_url = sys.argv[2]
 
+    with Seeder() as seeder:
+        print("Started seeding journal data...")
+        seeder.send(journal_api_url, load_dataset("journal"), dataset="journal")
 
-journal= [
-  {
-    "title": "ADAPTIVE CROSS-LAYER MULTI-OBJECTIVE OPTIMISATION FOR EFFICIENT RPL ROUTING IN LOW-POWER AND LOSSY IoT NETWORK IN SMART CITIES",
-    "name": "Animesh Giri",
-    "teacherIds": [
+        print("Started seeding conference data...")
+        seeder.send(conference_api_url, load_dataset("conference"), dataset="conference")
 
-    ],
-    "journalName": "Journal of Environmental Protection and Ecology ",
-    "month": "December",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://scibulcom.net/en/article/xvE6NGrE0eNZSEzN16tx",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "ADAPTIVE",
-      "CROSS",
-      "LAYER",
-      "MULTI",
-      "OBJECTIVE"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Cloud-Based and Self-Scrutiny Deep Learning Model for Detecting Skin Cancer",
-    "name": "Shilpa S",
-    "teacherIds": [],
-    "journalName": "Journal of Technology, Volume 12, Issue 12",
-    "month": "December",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "DOI:18.15001/JOT.2024/V12I12.24.1106",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "I.F : 5.1",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Cloud",
-      "Based",
-      "Scrutiny",
-      "Learning",
-      "Model"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "Developing an offline and real-time Indian sign language recognition system with machine learning and deep learning",
-    "name": "Dr. Sandesh B J",
-    "teacherIds": [
-   
-    ],
-    "journalName": "SN Computer Science",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1007/s42979-023-02482-w",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "3.1",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Developing",
-      "offline",
-      "Indian",
-      "language",
-      "recognition"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "Graph-based Saliency Detection: Integrating Multilevel Features and Analyzing the Distraction using DNN",
-    "name": "Dr. Kokila P",
-    "teacherIds": [
-  
-    ],
-    "journalName": "Computación y Sistemas, Vol. 28, No. 3, 2024, pp. 1577–1596",
-    "month": "September",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "doi: 10.13053/CyS-28-3-5170",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q3",
-    "impactFactor": "JCR, IF=0.6",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Graph",
-      "based",
-      "Saliency",
-      "Detection:",
-      "Integrating"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Handling Imbalnce Data in Intrusion Detection using Time Weighted Support Vector Classifier and Crossover Boosted Dwarf Mongose Optimization Algorithm",
-    "name": "Dr. Suja C M",
-    "teacherIds": [
-   
-    ],
-    "journalName": "Applied Soft Computing Journal",
-    "month": "October",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1016/j.asoc.2024.112327",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q1",
-    "impactFactor": "IF=7.2",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Handling",
-      "Imbalnce",
-      "Intrusion",
-      "Detection",
-      "using"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Leveraging multimodal deep learning for natural disaster event classification and its damage severity analysis through social media posts. ",
-    "name": "Nivedita Kasturi",
-    "teacherIds": [
-     
-    ],
-    "journalName": "IAES International Journal of Artificial Intelligence (IJ-AI)",
-    "month": "January",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "doi.:10.11591/ijai.v13.i4.pp4766-4777",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "3.9",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Leveraging",
-      "multimodal",
-      "learning",
-      "natural",
-      "disaster"
-    ],
-    "domain": "CODMAV"
-  },
-  {
-    "title": "From Diagnosis to Remission: Understanding Cancer Detection and Staging",
-    "name": "Dr. Prema R",
-    "teacherIds": [
-     
-    ],
-    "journalName": "Hinweis Second International Conference on Advanced Research in Engineering and Technology",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "Grenze ID: 01.GIJET.10.2.269",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Diagnosis",
-      "Remission:",
-      "Understanding",
-      "Cancer",
-      "Detection"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Climate Smart AG: Analyzing and Predicting Greenhouse Gas Emissions from Agricultural Activities",
-    "name": "Dr. Saritha K",
-    "teacherIds": [
-    
-    ],
-    "journalName": " International Journal of Advances in Electronics and Computer Science ( IJAECS )",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "http://iraj.doionline.org/dx/IJAECS-IRAJ-DOIONLINE-20562",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Climate",
-      "Smart",
-      "Analyzing",
-      "Predicting",
-      "Greenhouse"
-    ],
-    "domain": "General"
-  },
-  {
-    "title": "MONITORING THE EFFECTS OF NONPOINT SOURCE WATER POLLUTION ON MARINE LIFE USING MACHINE LEARNING",
-    "name": "Dr. Saritha K",
-    "teacherIds": [
-    
-    ],
-    "journalName": " International Journal of Advances in Electronics and Computer Science ( IJAECS )",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://iraj.doionline.org/dx/IJAECS-IRAJ-DOIONLINE-20569",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "MONITORING",
-      "EFFECTS",
-      "NONPOINT",
-      "SOURCE",
-      "WATER"
-    ],
-    "domain": "General"
-  },
-  {
-    "title": "Advancing Healthcare Networks: Optimizing Multi-Objective RPL for Diverse Traffic in Low-Power, Lossy Environments",
-    "name": "Animesh Giri",
-    "teacherIds": [
-    ],
-    "journalName": "Journal of Electrical Systems; Paris ",
-    "month": "May",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://journal.esrgroups.org/jes/article/view/3343/2650",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advancing",
-      "Healthcare",
-      "Networks:",
-      "Optimizing",
-      "Multi"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Energy and Security Aware Hybrid Optimal Cluster Based Routing in Wireless Sensor Networks",
-    "name": "Dr. Suja C M",
-    "teacherIds": [
-     
-    ],
-    "journalName": "Wireless Personal Computing ",
-    "month": "July",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1007/s11277-024-11288-9",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": True,
-    "qNo": "Q2",
-    "impactFactor": "1.9",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Energy",
-      "Security",
-      "Aware",
-      "Hybrid",
-      "Optimal"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "An Efficient and Optimized Backoff Scheme for Disseminating Heterogeneous Traffic for Multiple Instances of LLN-Based Industrial IOT Networks.",
-    "name": "Animesh Giri",
-    "teacherIds": [
 
-    ],
-    "journalName": "International Journal of Intelligent Systems and Applications in Engineering",
-    "month": "May",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://ijisae.org/index.php/IJISAE/article/view/5769",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Efficient",
-      "Optimized",
-      "Backoff",
-      "Scheme",
-      "Disseminating"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "MMHFND: Fusing Modalities for Multimodal Multiclass Hindi Fake News detection via contrastive Learning",
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-     
-    ],
-    "journalName": "ACM Transactions on Asian and Low-Resource Language Information Processing",
-    "month": "November",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1145/3686797",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "1.8",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "MMHFND:",
-      "Fusing",
-      "Modalities",
-      "Multimodal",
-      "Multiclass"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "UAV Swarm Objectives: A Critical Analysis and Comprehensive Review",
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-   
-    ],
-    "journalName": "SN Computer Science",
-    "month": "August",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "10.1007/s42979-024-03156-x",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "3.8",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Swarm",
-      "Objectives:",
-      "Critical",
-      "Analysis",
-      "Comprehensive"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Smart intrusion detection system with balanced data in IoMT infra",
-    "name": "Dr. J Mannar Mannan",
-    "teacherIds": [
-     
-    ],
-    "journalName": "Journal of Intelligent & Fuzzy Systems",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "10.3233/JIFS-233649",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": True,
-    "qNo": "Q2",
-    "impactFactor": "1.7",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Smart",
-      "intrusion",
-      "detection",
-      "system",
-      "balanced"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Cardiovascular disease prediction by deep learning based on IOMT: review",
-    "name": "Deepti Chandrasekharan",
-    "teacherIds": [
-  
-    ],
-    "journalName": "Smart Science(Taylor and Francis)",
-    "month": "August",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1080/23080477.2024.2370211",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "2.4",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Cardiovascular",
-      "disease",
-      "prediction",
-      "learning",
-      "based"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Artificial Hummingbird Algorithm with Optimal Deep Learning-Based Intrusion Detection on Vehicular Adhoc Networks",
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [
-   
-    ],
-    "journalName": "International Journal of Engineering Trends and Technology",
-    "month": "August",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.14445/22315381/IJETT-V72I8P136",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Artificial",
-      "Hummingbird",
-      "Algorithm",
-      "Optimal",
-      "Learning"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "An Attention based Spatial Temporal Graph Convolutional Networks for Traffic Flow Prediction",
-    "name": "Dr. Sreenath M V",
-    "teacherIds": [
-    ],
-    "journalName": "International Journal of INTELLIGENT SYSTEMS AND APPLICATIONS IN ENGINEERING",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://ijisae.org/index.php/IJISAE/article/view/4772",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Attention",
-      "based",
-      "Spatial",
-      "Temporal",
-      "Graph"
-    ],
-    "domain": "General"
-  },
-  {
-    "title": "Enhancing intrusion detection using coati optimization algorithm with deep learning on vehicular Adhoc network",
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [
-
-    ],
-    "journalName": "International Journal of information Technology",
-    "month": "March",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://link.springer.com/article/10.1007/s41870-024-01827-9",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "Q2",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "intrusion",
-      "detection",
-      "using",
-      "coati"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Developing an Offline and Real-Time Indian Sign Language Recognition System with Machine Learning and Deep Learning",
-    "name": "Dr. Sandesh B J",
-    "teacherIds": [
-    ],
-    "journalName": "Journal - SN Computer Science ,, Springer Nature Publisher.",
-    "month": "April",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1007/s42979-023-02482-w",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Developing",
-      "Offline",
-      "Indian",
-      "Language",
-      "Recognition"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "Empowering Users in Minimizing Air Pollution Exposure during Travel: A Scalable Algorithmic Solution ",
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-
-    ],
-    "journalName": "“Journal of Computational Social Science”",
-    "month": "June",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "10.1007/s42001-024-00297-0",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "3.2",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Empowering",
-      "Users",
-      "Minimizing",
-      "Pollution",
-      "Exposure"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "\"Epigraphiology: A Hybrid Approach for Measuring and Analyzing Influence Diffusion in Article Networks\".",
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-      "Dr. Swati Pratap Jagdale"
-    ],
-    "journalName": "Journal of Scientometric Research",
-    "month": "August",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "10.5530/jscires.13.2.48",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "Q2(0.8 )",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Epigraphiology",
-      "Hybrid",
-      "Approach",
-      "Measuring",
-      "Analyzing"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "DepXGBoot: depression detection using robust tuned extreme gradient boosting model generator",
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [],
-    "journalName": "IJAI",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "http://doi.org/10.11591/ijai.v13.i4.pp4352-4363",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "0.36",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "DepXGBootdepression",
-      "detection",
-      "using",
-      "robust",
-      "tuned"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Breast Cancer Prognosis through the Use of Multi-Modal Classifiers: Current State of the Art and the Way Forward",
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [],
-    "journalName": "Briefings in Functional Genomics (Oxford University Press,",
-    "month": "September",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.1093/bfgp/elae015",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q1",
-    "impactFactor": " I.F: 4.4",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Breast",
-      "Cancer",
-      "Prognosis",
-      "through",
-      "MultiModal"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "title": "An Energy‑Efficient and QoS‑Preserving Hybrid Cross‑Layer Protocol Design for Deep Learning‑Based Air Quality Monitoring and Prediction",
-    "name": "Dr. Saritha K",
-    "teacherIds": [
-      "Dr. Sarasvathi V"
-    ],
-    "journalName": "SN COMPUTER SCIENCE(Q2)",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://link.springer.com/article/10.1007/s42979-023-02525-2",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "0.72",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "EnergyEfficient",
-      "QoSPreserving",
-      "Hybrid",
-      "CrossLayer",
-      "Protocol"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "title": "Multi-Objective Hybrid Split-Ring Resonator And Electromagnetic Bandgap Structure-Based Fractal Antennas Using Hybrid Metaheuristic Framework For Wireless Applications",
-    "name": "Saranya Rubini S",
-    "teacherIds": [
-
-    ],
-    "journalName": "Scientific Reports (Q1)",
-    "month": "January",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://link.springer.com/article/10.1007/s42979-023-02525-2",
-    "isUGC": False,
-    "isScopus": False,
-    "isWOS": False,
-    "qNo": "Q1",
-    "impactFactor": " I.F: 4.9",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "MultiObjective",
-      "Hybrid",
-      "SplitRing",
-      "Resonator",
-      "Electromagnetic"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Ensemble of Multimodal Deep Learning Models for Violin Bowing Techniques Classification",
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "journalName": "Journal of Advances in Information Technology",
-    "month": "January",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "https://doi.org/10.12720/jait.15.1.40-48",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q2",
-    "impactFactor": "0.32",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Ensemble",
-      "Multimodal",
-      "Learning",
-      "Models",
-      "Violin"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Intellectual Play with Kids:Building an interactive toy by using LSTM model",
-    "name": "Dr. Alpha Vijayan",
-    "teacherIds": [],
-    "journalName": "International Conference on Engineering & Technology (ICET-24)\" taking place in Hyderabad - India on 10th February 2024.",
-    "month": "January",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "efaidnbmnnnibpcajpcglclefindmkaj/https://romanpub.com/resources/ijaet20v5-4-2023-143.pdf",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "NA",
-    "impactFactor": "0",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Intellectual",
-      "Kids:Building",
-      "interactive",
-      "using",
-      "model"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "title": "Multilevel Troll Classification of Twitter Data Using Machine Learning Techniques",
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "journalName": "International Journal of Computer Theory and Engineering( SCOPUS )",
-    "month": "February",
-    "year": "2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "issn": "NA",
-    "websiteLink": "",
-    "articleLink": "10.7763/IJCTE.2024.V16.1350",
-    "isUGC": False,
-    "isScopus": True,
-    "isWOS": False,
-    "qNo": "Q4",
-    "impactFactor": "0.13",
-    "isCapstone": True,
-    "isAffiliating": False,
-    "pageNumber": 0,
-    "abstract": "Not provided",
-    "keywords": [
-      "Multilevel",
-      "Troll",
-      "Classification",
-      "Twitter",
-      "Using"
-    ],
-    "domain": "C3I"
-  }
-]
-
-conference= [
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": " 2023 Second International Conference on Advances in Computational Intelligence and Communication (ICACIC)",
-    "paperTitle": "A Novel IoT Based Railway Platform Safety",
-    "proceedings_conference_title": " 2023 Second International Conference on Advances in Computational Intelligence and Communication (ICACIC)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://ieeexplore.ieee.org/document/10435074",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Novel",
-      "Based",
-      "Railway",
-      "Platform",
-      "Safety"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Second International Conference on Data Science and Information System (ICDSIS)",
-    "paperTitle": "Transfer Learning for Classification of GPR B-scan Images from Clutter using Vision Transformer and VGG-16",
-    "proceedings_conference_title": "2024 Second International Conference on Data Science and Information System (ICDSIS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://ieeexplore.ieee.org/document/10594683",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Transfer",
-      "Learning",
-      "Classification",
-      "Images",
-      "Clutter"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "2024 7th International Conference on Big Data and Artificial Intelligence (BDAI 2024) Beijing, China, July 5-7, 2024",
-    "paperTitle": "Overcoming the challenges of Large Language Models: Introducing a novel proposition for Synthetic Data Validation",
-    "proceedings_conference_title": "2024 7th International Conference on Big Data and Artificial Intelligence (BDAI 2024) Beijing, China, July 5-7, 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2007",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/BDAI62182.2024.10692968",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Overcoming",
-      "challenges",
-      "Large",
-      "Language",
-      "Models:"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Geetha Dayalan",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Springer Lecture Notes in Networks and Systems, Innovative computing & Communications, Proceedings of ICICC 2024, Volume 4",
-    "paperTitle": "Empowering Aspiring Artists: A Machine Learning-Powered Carnatic Music Tutor",
-    "proceedings_conference_title": "Springer Lecture Notes in Networks and Systems, Innovative computing & Communications, Proceedings of ICICC 2024, Volume 4",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-3817-5_17",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Empowering",
-      "Aspiring",
-      "Artists:",
-      "Machine",
-      "Learning"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Smart Trends in Computing and Communications Proceedings of SmartCom 2024, Volume 3",
-    "paperTitle": "Predictive Analysis of Outages and Enhanced Network Optimization for Industrial IoT System",
-    "proceedings_conference_title": "Smart Trends in Computing and Communications Proceedings of SmartCom 2024, Volume 3",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-1326-4_29",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Predictive",
-      "Analysis",
-      "Outages",
-      "Enhanced",
-      "Network"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Smart Trends in Computing and Communications Proceedings of SmartCom 2024, Volume 2",
-    "paperTitle": "ONOS SDN Framework: Assessing the Impact of Single and Multi-Controller Architectures on Network Efficiency",
-    "proceedings_conference_title": "Smart Trends in Computing and Communications Proceedings of SmartCom 2024, Volume 2",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-1323-3_32",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Framework:",
-      "Assessing",
-      "Impact",
-      "Single",
-      "Multi"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Geetha Dayalan",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "7th International Conference on Multi-Disciplinary Research Studies and Education ",
-    "paperTitle": "Empowering Vision - An Integrated AI Solution for Object Detection, Navigation, and Emergency Assistanc",
-    "proceedings_conference_title": "7th International Conference on Multi-Disciplinary Research Studies and Education ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://iferp-in-docs.s3.ap-south-1.amazonaws.com/conf-proceedings/2024/7th-ICMDRSE-24Malaysia.pdf",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Empowering",
-      "Vision",
-      "Integrated",
-      "Solution",
-      "Object"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Jeny Jijo",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE International Conference on Advanced Systems and Emergent Technologies (IC_ASET), Hammamet, Tunisia, 2024",
-    "paperTitle": "Generation and Editing of Faces using Stable Diffusion with Criminal Suspect Matching,",
-    "proceedings_conference_title": "2024 IEEE International Conference on Advanced Systems and Emergent Technologies (IC_ASET), Hammamet, Tunisia, 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/IC_ASET61847.2024.10596159",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Generation",
-      "Editing",
-      "Faces",
-      "using",
-      "Stable"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Dr. Jeny Jijo",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 5th International Conference for Emerging Technology (INCET), Belgaum, India, 2024",
-    "paperTitle": "Optimization of Cornering Lights in Adaptive Headlamps",
-    "proceedings_conference_title": "2024 5th International Conference for Emerging Technology (INCET), Belgaum, India, 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/INCET61516.2024.10593337",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Optimization",
-      "Cornering",
-      "Lights",
-      "Adaptive",
-      "Headlamps"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "THE 15th INTERNATIONAL IEEE CONFERENCE ON COMPUTING, COMMUNICATION AND NETWORKING TECHNOLOGIES, IIT Mandi",
-    "paperTitle": "An Innovative Feature Fusion driven Multi Disease Diagnosis using Deep Learning",
-    "proceedings_conference_title": "THE 15th INTERNATIONAL IEEE CONFERENCE ON COMPUTING, COMMUNICATION AND NETWORKING TECHNOLOGIES, IIT Mandi",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICCCNT61001.2024.10724000",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Innovative",
-      "Feature",
-      "Fusion",
-      "driven",
-      "Multi"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Charu Kathuria",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "paperTitle": "Emotion Echo: An Emotion-based Music Recommender System",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Emotion",
-      "Echo:",
-      "Emotion",
-      "based",
-      "Music"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Charu Kathuria",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "paperTitle": "DeepFake Detection Through an Ensemble",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "DeepFake",
-      "Detection",
-      "Through",
-      "Ensemble"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Charu Kathuria",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024), BITS PILANI",
-    "paperTitle": "Analysis of Badminton playing techniques using Computer Vision and Deep Learning",
-    "proceedings_conference_title": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024), BITS PILANI",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Analysis",
-      "Badminton",
-      "playing",
-      "techniques",
-      "using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Vandana Mevaldas Ladwani",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "paperTitle": "Bimodal Detection of Parkinson’s Disease",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Amrita Vishwa Vidyapeetham, Chennai, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Bimodal",
-      "Detection",
-      "Parkinson’s",
-      "Disease"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Vandana Mevaldas Ladwani",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "Advanced Automated Document Processing Using Optical Character Recognition (OCR)",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/I2CT61223.2024.10544263",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advanced",
-      "Automated",
-      "Document",
-      "Processing",
-      "Using"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Vandana Mevaldas Ladwani",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "12th Computing Conference, UK",
-    "paperTitle": "Optimised Round Robin with Virtual Runtime for CPU Scheduling",
-    "proceedings_conference_title": "12th Computing Conference, UK",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-3-031-62277-9_1",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Optimised",
-      "Round",
-      "Robin",
-      "Virtual",
-      "Runtime"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Neha Sharma",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "2024 International Conference on Intelligent Systems for Cybersecurity (ISCS)",
-    "paperTitle": "A Comprehensive Review on Knee Osteoarthritis Detection using Medical Imaging and Machine Learning",
-    "proceedings_conference_title": "2024 International Conference on Intelligent Systems for Cybersecurity (ISCS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ISCS61804.2024.10581051",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Comprehensive",
-      "Review",
-      "Osteoarthritis",
-      "Detection",
-      "using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "SmartCom 2024- SPRINGER Conference",
-    "paperTitle": "Automated Gym Exercise Form Checker: Deep-Learning Based Pose Estimation",
-    "proceedings_conference_title": "SmartCom 2024- SPRINGER Conference",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "SPRINGER",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-1320-2_7",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Automated",
-      "Exercise",
-      "Checker:",
-      "Deep-Learning",
-      "Based"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Sandesh B J",
-    "teacherIds": [
-      "Dr. Bharathi R"
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "SmartCom 2024- SPRINGER Conference",
-    "paperTitle": "Player Performance Analysis",
-    "proceedings_conference_title": "SmartCom 2024- SPRINGER Conference",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "SPRINGER",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-1329-5_27",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Player",
-      "Performance",
-      "Analysis"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. L Kamatchi Priya",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computing and Machine Learning (CML 2024) Lecture Notes in Networks and Systems (LNNS)",
-    "paperTitle": "A Hybrid Model Approach for Advanced Disease Identification in Precision Agriculture",
-    "proceedings_conference_title": "International Conference on Computing and Machine Learning (CML 2024) Lecture Notes in Networks and Systems (LNNS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/InC460750.2024.10649143",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Hybrid",
-      "Model",
-      "Approach",
-      "Advanced",
-      "Disease"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Alpha Vijayan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computer, Cybernetics and Education (ICCCE-2024)” 23rd & 24th on February 2024 in Jakarta, Indonesia organized by Institute for Educational Research and Publication (IFERP) Indonesia Society.",
-    "paperTitle": "Realistic Face Image Generation With Age and Ethnicity prediction for criminal identification",
-    "proceedings_conference_title": "International Conference on Computer, Cybernetics and Education (ICCCE-2024)” 23rd & 24th on February 2024 in Jakarta, Indonesia organized by Institute for Educational Research and Publication (IFERP) Indonesia Society.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Realistic",
-      "Image",
-      "Generation",
-      "Ethnicity",
-      "prediction"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Alpha Vijayan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Health Informatics, Intelligent Systems and Networking Technologies Organized by the Department of Computer Science and Engineering, Manipal Institute of Technology, Manipal, Karnataka, India on March 14 and 15, 2024- (HINT 24) ;  Lecture Notes in Networks and Systems (LNNS)",
-    "paperTitle": "Unlocking Imagination: Story Generation from Autistic Childrens’ artwork using a fusion of Computer Vision and NLP",
-    "proceedings_conference_title": "International Conference on Health Informatics, Intelligent Systems and Networking Technologies Organized by the Department of Computer Science and Engineering, Manipal Institute of Technology, Manipal, Karnataka, India on March 14 and 15, 2024- (HINT 24) ;  Lecture Notes in Networks and Systems (LNNS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Unlocking",
-      "Imagination:",
-      "Story",
-      "Generation",
-      "Autistic"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Alpha Vijayan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Organized by Department of Computer Science and Engineering,School of Computing,Amrita Vishwa Vidyapeetham, Chennai,Tamil Nadu, India",
-    "paperTitle": "Real-time Pothole Detection Android Smartphone Application for Road Maintenance",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Organized by Department of Computer Science and Engineering,School of Computing,Amrita Vishwa Vidyapeetham, Chennai,Tamil Nadu, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Real-time",
-      "Pothole",
-      "Detection",
-      "Android",
-      "Smartphone"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Organized by Department of Computer Science and Engineering,School of Computing,Amrita Vishwa Vidyapeetham, Chennai,Tamil Nadu, India",
-    "paperTitle": "End to End Encrypted Messaging Application using ORDEX",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing (DISC 2024), Organized by Department of Computer Science and Engineering,School of Computing,Amrita Vishwa Vidyapeetham, Chennai,Tamil Nadu, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Encrypted",
-      "Messaging",
-      "Application",
-      "using",
-      "ORDEX"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 the 8th International Conference on Virtual and Augmented Reality Simulations (ICVARS 2024), Melbourne, Australia, March 14-16, 2024",
-    "paperTitle": "Augmented Reality Visualization of Menu Items using Image Reconstruction",
-    "proceedings_conference_title": "2024 the 8th International Conference on Virtual and Augmented Reality Simulations (ICVARS 2024), Melbourne, Australia, March 14-16, 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1145/3657547.3657554",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Augmented",
-      "Reality",
-      "Visualization",
-      "Items",
-      "using"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "BROADNETS 2024 - 14th International Conference on Broadband Communications, Networks, and Systems, February 16-17, 2024,Vardhaman College of Engineering,Hyderabad, India",
-    "paperTitle": "Framework for Brute-Force attack detection using Federated Learning",
-    "proceedings_conference_title": "BROADNETS 2024 - 14th International Conference on Broadband Communications, Networks, and Systems, February 16-17, 2024,Vardhaman College of Engineering,Hyderabad, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Framework",
-      "Brute-Force",
-      "attack",
-      "detection",
-      "using"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "BROADNETS 2024 - 14th International Conference on Broadband Communications, Networks, and Systems, February 16-17, 2024,Vardhaman College of Engineering,Hyderabad, India",
-    "paperTitle": "Real Time Phishing Detection using Lexical Analysis and Visual Similarity",
-    "proceedings_conference_title": "BROADNETS 2024 - 14th International Conference on Broadband Communications, Networks, and Systems, February 16-17, 2024,Vardhaman College of Engineering,Hyderabad, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Phishing",
-      "Detection",
-      "using",
-      "Lexical",
-      "Analysis"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "9th International conference for convergence in technology",
-    "paperTitle": "A Federated Learning Approach for Disease Prediction and Remedies Recommendation",
-    "proceedings_conference_title": "9th International conference for convergence in technology",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "pageNumber": 0,
-    "year": "2024",
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/I2CT61223.2024.10544309",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Federated",
-      "Learning",
-      "Approach",
-      "Disease",
-      "Prediction"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Springer International Conference on Multi-Strategy Learning Environment ICMSLE-2024.",
-    "paperTitle": "Importance of Drug Features in Drug-Drug Interaction : A Comparative Study",
-    "proceedings_conference_title": "2024 Springer International Conference on Multi-Strategy Learning Environment ICMSLE-2024.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-1488-9_36",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Importance",
-      "Features",
-      "Drug-Drug",
-      "Interaction",
-      "Comparative"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "9th International conference for convergence in technology",
-    "paperTitle": "A comprehensive analysis of PCOS",
-    "proceedings_conference_title": "9th International conference for convergence in technology",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543283",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "comprehensive",
-      "analysis"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "9th International conference for convergence in technology",
-    "paperTitle": "Crop Combination And Market Prediction using ML methods",
-    "proceedings_conference_title": "9th International conference for convergence in technology",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543457",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Combination",
-      "Market",
-      "Prediction",
-      "using",
-      "methods"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "10th International Conference on Computer Technology Applications (ICCTA), Vienna, Austria",
-    "paperTitle": "A Distinctive Ensemble Approach for Unbiased Movie Recommendations using Variants of Graph Convolution Networks",
-    "proceedings_conference_title": "10th International Conference on Computer Technology Applications (ICCTA), Vienna, Austria",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1145/3674558.3674599",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Distinctive",
-      "Ensemble",
-      "Approach",
-      "Unbiased",
-      "Movie"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "A Hybrid Approach for Happy Emotion Analysis through Partition and Voronoi-density based Clustering and DistilBERT ",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543658",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Hybrid",
-      "Approach",
-      "Happy",
-      "Emotion",
-      "Analysis"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "An Empirical Study of Financial BERT Models for Sentiment Analysis and Cryptocurrency Price Correlation ",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543560",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Empirical",
-      "Study",
-      "Financial",
-      "Models",
-      "Sentiment"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "Ensemble of Graph Neural Networks for Enhanced Financial Fraud Detection ",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543898",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Ensemble",
-      "Graph",
-      "Neural",
-      "Networks",
-      "Enhanced"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 the 9th International Conference on Big Data Analytics (ICBDA) March 16-18, 2024 @ Waseda University, Tokyo, Japan",
-    "paperTitle": "Techniques used in time series databases and their internals",
-    "proceedings_conference_title": "2024 the 9th International Conference on Big Data Analytics (ICBDA) March 16-18, 2024 @ Waseda University, Tokyo, Japan",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICBDA61153.2024.10607196",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Techniques",
-      "series",
-      "databases",
-      "their",
-      "internals"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Intelligent Systems and Machine Learning Conference",
-    "paperTitle": "Exploring LLMs as a means for conducting Bias-free technical Interviews ",
-    "proceedings_conference_title": "2024 Intelligent Systems and Machine Learning Conference",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Exploring",
-      "means",
-      "conducting",
-      "Bias-free",
-      "technical"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "J Ruby Dinakar",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "Twelth international conference on contemporary engineering and technology ICCET 2024",
-    "paperTitle": "Smart Traffic Management and Control System Using Deep Learning",
-    "proceedings_conference_title": "Twelth international conference on contemporary engineering and technology ICCET 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-   "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Smart",
-      "Traffic",
-      "Management",
-      "Control",
-      "System"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "U. Ananthanagu and P. Agarwal, \"Fostering Resilience: Machine Learning Models for Student Stress Prediction in Education,\" 2024 IEEE 9th International Conference for Convergence in Technology (I2CT), Pune, India, 2024, pp. 1-5.",
-    "paperTitle": "Fostering Resilience: Machine Learning Models for Student Stress Prediction in Education",
-    "proceedings_conference_title": "U. Ananthanagu and P. Agarwal, \"Fostering Resilience: Machine Learning Models for Student Stress Prediction in Education,\" 2024 IEEE 9th International Conference for Convergence in Technology (I2CT), Pune, India, 2024, pp. 1-5.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543492",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Fostering",
-      "Resilience:",
-      "Machine",
-      "Learning",
-      "Models"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "Vidgen: Long-Form Text-to-Video Generation  with Temporal, Narrative and Visual  Consistency for High Quality Story-Visualisation  Tasks",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2025",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "doi: 10.1109/I2CT61223.2024.10544050.",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Vidgen",
-      "LongForm",
-      "TexttoVideo",
-      "Generation",
-      "Temporal"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "ICMIP '24: Proceedings of the 2024 9th International Conference on Multimedia and Image Processing, OSAKA, JAPAN https://doi.org/10.1145/3665026.366503",
-    "paperTitle": "Revitalising Ocean Ecosystems: A Comprehensive Approach to Sustainable Underwater Trash Analysis Using AUVs, Image Enhancement, YOLO Detection, and Material Circularity Index",
-    "proceedings_conference_title": "ICMIP '24: Proceedings of the 2024 9th International Conference on Multimedia and Image Processing, OSAKA, JAPAN https://doi.org/10.1145/3665026.366503",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2025",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1145/3665026.366503",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Revitalising",
-      "Ocean",
-      "Ecosystems",
-      "Comprehensive",
-      "Approach"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "9th International Conference on Infromation System Design and Intelligent Applications (ISDIA 2025), Dubai, Springer",
-    "paperTitle": "LVDCS: Minimising Doubts in Distance Learning",
-    "proceedings_conference_title": "9th International Conference on Infromation System Design and Intelligent Applications (ISDIA 2025), Dubai, Springer",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2025",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "LVDCS",
-      "Minimising",
-      "Doubts",
-      "Distance",
-      "Learning"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "Call Translator with Voice Cloning Using Transformers",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2025",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/I2CT61223.2024.10543304",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Translator",
-      "Voice",
-      "Cloning",
-      "Using",
-      "Transformers"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Gauri Sameer Rapate",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "ICICC-2024, Innovative Computing and Communications",
-    "paperTitle": "An AI-Powered Personalised Badminton Training System with Frame-by-Frame Correction",
-    "proceedings_conference_title": "ICICC-2024, Innovative Computing and Communications",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1007/978-981-97-4228-8_16",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "AIPowered",
-      "Personalised",
-      "Badminton",
-      "Training",
-      "System"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "ICTIS 2024, Las Vegas, USA",
-    "paperTitle": "DeTroll - Leveraging Graph Neural Networks with Attention Mechanism to Detect State-Sponsored Trolls",
-    "proceedings_conference_title": "ICTIS 2024, Las Vegas, USA",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-5799-2_34",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "DeTroll",
-      "Leveraging",
-      "Graph",
-      "Neural",
-      "Networks"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Deepti Chandrasekharan",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "6th International Conference on Inventive Computation and Information Technologies [ICICIT 2024].",
-    "paperTitle": "Fetal Care: Enhancing Prenatal Care through a Machine Learning Approach for Fetal Health Classification and Birth Weight Prediction",
-    "proceedings_conference_title": "6th International Conference on Inventive Computation and Information Technologies [ICICIT 2024].",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/ICAAIC60222.2024.10575277",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Fetal",
-      "Care",
-      "Enhancing",
-      "Prenatal",
-      "through"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Pranjali Swapnil Thakre",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computer Science, Industrial Economics IEEE forum",
-    "paperTitle": "Speech emotion recognition through federated learning for quality assurance in call centre",
-    "proceedings_conference_title": "International Conference on Computer Science, Industrial Economics IEEE forum",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Speech",
-      "emotion",
-      "recognition",
-      "through",
-      "federated"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "M Sheela Devi",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "International Virtual Conference on Machine Learning Applications in Applied Sciences and MathematicsAIP Conf. Proc. 2802, 120011-1–120011-9;  978-0-7354-4798-1 ",
-    "paperTitle": "GitHub Issue Analysis",
-    "proceedings_conference_title": "International Virtual Conference on Machine Learning Applications in Applied Sciences and MathematicsAIP Conf. Proc. 2802, 120011-1–120011-9;  978-0-7354-4798-1 ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1063/5.0181776  (https://pubs.aip.org/aip/acp/article/2802/1/120011/3126862/GitHub-issue-analysis)",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "GitHub",
-      "Issue",
-      "Analysis"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "M Sheela Devi",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "4th International conference on Smart Data Intelligence(ICSMDI2024)",
-    "paperTitle": "Decentralized File storage system using IPFS & Block chain",
-    "proceedings_conference_title": "4th International conference on Smart Data Intelligence(ICSMDI2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://link.springer.com/chapter/10.1007/978-981-97-3191-6_22",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Decentralized",
-      "storage",
-      "system",
-      "using",
-      "Block"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE Conference :International Conference on Work Integrated Learning",
-    "paperTitle": "Pen2Code-Translating Handwritten Pseudocode into functional source code",
-    "proceedings_conference_title": "IEEE Conference :International Conference on Work Integrated Learning",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "PenCodeTranslating",
-      "Handwritten",
-      "Pseudocode",
-      "functional",
-      "source"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE Conference :International Conference on Work Integrated Learning",
-    "paperTitle": "AI-Infused Academic Planning for Student Excellence",
-    "proceedings_conference_title": "IEEE Conference :International Conference on Work Integrated Learning",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "AIInfused",
-      "Academic",
-      "Planning",
-      "Student",
-      "Excellence"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Shanthala P T",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "5th International Conference on Intelligent Communication Technologies and Virtual Mobile Networks - ICICV 2024, organized by Francis Xavier Engineering College, Tirunelveli, India.",
-    "paperTitle": "Aquaculture IoT Security Landscape: A Comprehensive Analysis of Threats and Mitigation Strategies",
-    "proceedings_conference_title": "5th International Conference on Intelligent Communication Technologies and Virtual Mobile Networks - ICICV 2024, organized by Francis Xavier Engineering College, Tirunelveli, India.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Aquaculture",
-      "Security",
-      "Landscape",
-      "Comprehensive",
-      "Analysis"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Leveraging Knowledge Graphs for Analyzing Open-Source Software Ecosystems: A GitHub Case Study",
-    "paperTitle": "9th International Conference on Convergence of Technology (I2CT)",
-    "proceedings_conference_title": "Leveraging Knowledge Graphs for Analyzing Open-Source Software Ecosystems: A GitHub Case Study",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10544334",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "International",
-      "Conference",
-      "Convergence",
-      "Technology",
-      "ICT"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "AirO’Drive: Pioneering Scalable Intelligent Application for Pollutant-Free Navigation",
-    "paperTitle": "International Conference on Data Intelligence & Secure Computing - DISC 2024, Amrita Vishwa Vidyapeetham, Chennai, India, held on March 8-9, 2024.",
-    "proceedings_conference_title": "AirO’Drive: Pioneering Scalable Intelligent Application for Pollutant-Free Navigation",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "International",
-      "Conference",
-      "Intelligence",
-      "Secure",
-      "Computing"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "8th International Conference on Cryptography, Security and Privacy (CSP 2024), April 20-22, 2024, in Osaka, Japan, co-sponsored by Ritsumeikan University, Japan, hosted in Ritsumeikan University Osaka campus",
-    "paperTitle": "A Real-Time Approach to Detecting API Abuses Based on Behavioral Patterns",
-    "proceedings_conference_title": "8th International Conference on Cryptography, Security and Privacy (CSP 2024), April 20-22, 2024, in Osaka, Japan, co-sponsored by Ritsumeikan University, Japan, hosted in Ritsumeikan University Osaka campus",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.ieeecomputersociety.org/10.1109/CSP62567.2024.00012",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "RealTime",
-      "Approach",
-      "Detecting",
-      "Abuses",
-      "Based"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "2024 International Conference on Cognitive Robotics and Intelligent Systems (ICC - ROBINS).",
-    "paperTitle": "Intrusion Detection using Arithmetic Optimization Algorithm with Fuzzy Logic in VANET",
-    "proceedings_conference_title": "2024 International Conference on Cognitive Robotics and Intelligent Systems (ICC - ROBINS).",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Intrusion",
-      "Detection",
-      "using",
-      "Arithmetic",
-      "Optimization"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Deepti Chandrasekharan",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "4th International Conference on Paradigms of Communication Computing and Data Analytics(PCCDA 2024)",
-    "paperTitle": "An ensemble Machine Learning based Approach towards accuracy in Bitcoin Price Prediction ",
-    "proceedings_conference_title": "4th International Conference on Paradigms of Communication Computing and Data Analytics(PCCDA 2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "ensemble",
-      "Machine",
-      "Learning",
-      "based",
-      "Approach"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "30th  Int'l Conference on Computational & Experimental Engineering and Sciences (ICCES 2024), Singapore",
-    "paperTitle": " Synergistic Approach for UAV Target Tracking: A Voronoi - GWO- Reinforcement Learning framework ",
-    "proceedings_conference_title": "30th  Int'l Conference on Computational & Experimental Engineering and Sciences (ICCES 2024), Singapore",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Synergistic",
-      "Approach",
-      "Target",
-      "Tracking",
-      "Voronoi"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "M Sheela Devi",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE International conference on contemporary computing and Communication,Christ University,Bengaluru",
-    "paperTitle": "Image reconstruction anf  Facial Feature Extraction for criminal Identification using machine intelligence",
-    "proceedings_conference_title": "IEEE International conference on contemporary computing and Communication,Christ University,Bengaluru",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/INC460750.2024.10649104",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Image",
-      "reconstruction",
-      "Facial",
-      "Feature",
-      "Extraction"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Divya Ebenezer Nathaniel",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Health Informatics, Intelligent Systems and Networking Technologies Organized by the Department of Computer Science and Engineering, Manipal Institute of Technology, Manipal, Karnataka, India on March 14 and 15, 2024- (HINT 24) ;  Lecture Notes in Networks and Systems (LNNS)",
-    "paperTitle": "Eating Disorder Detection and classification using Machine learning",
-    "proceedings_conference_title": "International Conference on Health Informatics, Intelligent Systems and Networking Technologies Organized by the Department of Computer Science and Engineering, Manipal Institute of Technology, Manipal, Karnataka, India on March 14 and 15, 2024- (HINT 24) ;  Lecture Notes in Networks and Systems (LNNS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Eating",
-      "Disorder",
-      "Detection",
-      "classification",
-      "using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. L Kamatchi Priya",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computing and Machine Learning (CML 2024) Lecture Notes in Networks and Systems (LNNS)",
-    "paperTitle": "Reinventing Urban Mobility with Reinforcement Learning in Vehicular Ad-Hoc Networks",
-    "proceedings_conference_title": "International Conference on Computing and Machine Learning (CML 2024) Lecture Notes in Networks and Systems (LNNS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Reinventing",
-      "Urban",
-      "Mobility",
-      "Reinforcement",
-      "Learning"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "Springer International Conference on Computing and Machine Learning (CML 2024)",
-    "paperTitle": "Data-Efficient Training for Effective Paraphrase Retrieval Techniques Using Language Models to Identify Research Gaps\"",
-    "proceedings_conference_title": "Springer International Conference on Computing and Machine Learning (CML 2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://link.springer.com/chapter/10.1007/978-981-97-6588-1_8",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "DataEfficient",
-      "Training",
-      "Effective",
-      "Paraphrase",
-      "Retrieval"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "25th International Conference on Engineering Applications of Neural Networks, Greece",
-    "paperTitle": "Graph-Based Fault Localization in Python Projects with Class-Imbalanced Learning.",
-    "proceedings_conference_title": "25th International Conference on Engineering Applications of Neural Networks, Greece",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1007/978-3-031-62495-7_27",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Graph",
-      "Based",
-      "Fault",
-      "Localization",
-      "Python"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-      "Dr. Swati Pratap Jagdale"
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "3rd IEEE International Conference on Artificial Intelligence For Internet of Things (AIIoT)",
-    "paperTitle": "Interpreting Breast Cancer Recurrence Prediction Models: Exploring Feature Importance with Explainable AI",
-    "proceedings_conference_title": "3rd IEEE International Conference on Artificial Intelligence For Internet of Things (AIIoT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/AIIoT58432.2024.10574760",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Interpreting",
-      "Breast",
-      "Cancer",
-      "Recurrence",
-      "Prediction"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Geetha Dayalan",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "12th International Conference on Contemporary Engineering and Technology 2024",
-    "paperTitle": "Algorithm Visualization for Student Performance ",
-    "proceedings_conference_title": "12th International Conference on Contemporary Engineering and Technology 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "ISBN 978-81-965908-5-7 Proceedings of 12th International Conference on Contemporary Engineering and Technology 2024",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Algorithm",
-      "Visualization",
-      "Student",
-      "Performance"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Geetha Dayalan",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Data Intelligence & Secure Computing-DISC 2024",
-    "paperTitle": "IKSHANA",
-    "proceedings_conference_title": "International Conference on Data Intelligence & Secure Computing-DISC 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "IKSHANA"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "ICACCT 2024, Chandigarh University, India.",
-    "paperTitle": "A Comparative Exploration of Machine Learning and Graph Deep Learning Models for Discriminatory Speech Detection",
-    "proceedings_conference_title": "ICACCT 2024, Chandigarh University, India.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/InCACCT61598.2024.10551005",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Comparative",
-      "Exploration",
-      "Machine",
-      "Learning",
-      "Graph"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "25th International Conference on Engineering Applications of Neural Networks, Greece",
-    "paperTitle": "Empirical Insights into Deep Learning Models for Misinformation Classification with Small Datasets",
-    "proceedings_conference_title": "25th International Conference on Engineering Applications of Neural Networks, Greece",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1007/978-3-031-62495-7_10",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Empirical",
-      "Insights",
-      "Learning",
-      "Models",
-      "Misinformation"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Sreenath M V",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "ICONWIL-2024",
-    "paperTitle": "iSEAD - Intelligent System for Evaluating and Analyzing Descriptive Responses",
-    "proceedings_conference_title": "ICONWIL-2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "iSEAD",
-      "Intelligent",
-      "System",
-      "Evaluating",
-      "Analyzing"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Saranya Rubini S",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "Lecture notes in Networks and Systems",
-    "paperTitle": "Evolutionary Discriminative Deep Belief Network Based Diabetic Retinopathy Classification",
-    "proceedings_conference_title": "Lecture notes in Networks and Systems",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-99-8628-6_29",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Evolutionary",
-      "Discriminative",
-      "Belief",
-      "Network",
-      "Based"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "M Sheela Devi",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Electronics, Computing, Communication and Control Technology, 2024",
-    "paperTitle": "A Secure And Privacy Oriented Implementation of Electronic Health  Records  ",
-    "proceedings_conference_title": "International Conference on Electronics, Computing, Communication and Control Technology, 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/ICECCC61767.2024.10593868",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Secure",
-      "Privacy",
-      "Oriented",
-      "Implementation",
-      "Electronic"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "2024 IEEE 9th International Conference for Convergence in Technology (I2CT),",
-    "paperTitle": "An xG Based Football Scouting System Using Machine Learning Techniques,",
-    "proceedings_conference_title": "2024 IEEE 9th International Conference for Convergence in Technology (I2CT),",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/i2ct61223.2024.10544261",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Based",
-      "Football",
-      "Scouting",
-      "System",
-      "Using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",                 
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE 9th International Conference for Convergence in Technology (I2CT),",
-    "paperTitle": "Smart Basket: An E-Commerce Recommendation System",
-    "proceedings_conference_title": "2024 IEEE 9th International Conference for Convergence in Technology (I2CT),",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543740",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Smart",
-      "Basket",
-      "Commerce",
-      "Recommendation",
-      "System"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Swati Pratap Jagdale",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE 9th International Conference for Convergence in Technology ",
-    "paperTitle": "Audio Description of Videos Using Machine Learning",
-    "proceedings_conference_title": "2024 IEEE 9th International Conference for Convergence in Technology ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10544216",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Audio",
-      "Description",
-      "Videos",
-      "Using",
-      "Machine"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Swati Pratap Jagdale",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE 9th International Conference for Convergence in Technology ",
-    "paperTitle": "Intelligent System for Research Article Recommendation: A Knowledge Graph-based Approach",
-    "proceedings_conference_title": "2024 IEEE 9th International Conference for Convergence in Technology ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10544156",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Intelligent",
-      "System",
-      "Research",
-      "Article",
-      "Recommendation"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "18th International Conference on Algorithmic Aspects in Information and Management ( AAIM2024)",
-    "paperTitle": "Detection and Analysis of Cryptocurrency Scams on Twitter",
-    "proceedings_conference_title": "18th International Conference on Algorithmic Aspects in Information and Management ( AAIM2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://link.springer.com/chapter/10.1007/978-981-97-7801-0_1",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Detection",
-      "Analysis",
-      "Cryptocurrency",
-      "Scams",
-      "Twitter"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "The Sixth International Conference on Blockchain Computing and Applications-IEEE BCCA'24",
-    "paperTitle": "Leveraging NFTs For Secured Decentralized Lending: A Defi Solution",
-    "proceedings_conference_title": "The Sixth International Conference on Blockchain Computing and Applications-IEEE BCCA'24",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Leveraging",
-      "Secured",
-      "Decentralized",
-      "Lending",
-      "Solution"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "The Sixth International Conference on Blockchain Computing and Applications-IEEE BCCA'24",
-    "paperTitle": "Securing Controlled Drug Prescription in India:A Blockchain Approach",
-    "proceedings_conference_title": "The Sixth International Conference on Blockchain Computing and Applications-IEEE BCCA'24",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Securing",
-      "Controlled",
-      "Prescription",
-      "IndiaA",
-      "Blockchain"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Lenish Pramiee",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "7th international conference on soft computing and signal Processing(ICSCSP-2024)",
-    "paperTitle": "IOT Based Fault Location and Detection of Underground cables using Enhanced Deep Learning Approch",
-    "proceedings_conference_title": "7th international conference on soft computing and signal Processing(ICSCSP-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2001",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Based",
-      "Fault",
-      "Location",
-      "Detection",
-      "Underground"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2023 IEEE International Conference on ICT in Business Industry & Government (ICTBIG)",
-    "paperTitle": "Railway Track Crack Detection Using IoT Model",
-    "proceedings_conference_title": "2023 IEEE International Conference on ICT in Business Industry & Government (ICTBIG)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://ieeexplore.ieee.org/document/10456116",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Railway",
-      "Track",
-      "Crack",
-      "Detection",
-      "Using"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Chandrashekhar Pomu Chavan",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 2,
-    "bookTitle": "2023 IEEE Fifth International Conference on Advances in Electronics, Computers and Communications (ICAECC)",
-    "paperTitle": "An Automated Workflow For Deepfake Detection",
-    "proceedings_conference_title": "2023 IEEE Fifth International Conference on Advances in Electronics, Computers and Communications (ICAECC)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://ieeexplore.ieee.org/document/10560271",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Automated",
-      "Workflow",
-      "Deepfake",
-      "Detection"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Work Integrated Learning (ICONWIL-2024)",
-    "paperTitle": "AI Based Personalized Job Recommendation System",
-    "proceedings_conference_title": "International Conference on Work Integrated Learning (ICONWIL-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.14445/22315381/IJETT-V72I8P136",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Based",
-      "Personalized",
-      "Recommendation",
-      "System"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "Nineth International Conference on Smart Trends in Computing and Communications (SmartCom-2024)",
-    "paperTitle": "Winning Formula: Data-Driven Cricket Team Selection and Match Prediction",
-    "proceedings_conference_title": "Nineth International Conference on Smart Trends in Computing and Communications (SmartCom-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Winning",
-      "Formula:",
-      "Driven",
-      "Cricket",
-      "Selection"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "Nineth International Conference on Smart Trends in Computing and Communications (SmartCom-2024)",
-    "paperTitle": "Fast bowler Injury prediction and Rectification system",
-    "proceedings_conference_title": "Nineth International Conference on Smart Trends in Computing and Communications (SmartCom-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "bowler",
-      "Injury",
-      "prediction",
-      "Rectification",
-      "system"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Asia Pacific Conference on Innovation in Technology (APCIT)-IEEE ",
-    "paperTitle": "CelestLearn AI: Astronomical Image Generator and Classifier",
-    "proceedings_conference_title": "2024 Asia Pacific Conference on Innovation in Technology (APCIT)-IEEE ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/APCIT62007.2024.10673540",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "CelestLearn",
-      "Astronomical",
-      "Image",
-      "Generator",
-      "Classifier"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Smart Systems and Wireless Communication [SSWC2024]-SPRINGER",
-    "paperTitle": "An Architecture for Phishing URL Detection using Concatenated Features",
-    "proceedings_conference_title": "International Conference on Smart Systems and Wireless Communication [SSWC2024]-SPRINGER",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "SPRINGER",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Architecture",
-      "Phishing",
-      "Detection",
-      "using",
-      "Concatenated"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "THE 6TH IEEE INTERNATIONAL CONFERENCE ON ARTIFICIAL INTELLIGENCE IN ENGINEERING AND TECHNOLOGY",
-    "paperTitle": "LLM Based Enhanced Form Checker for Weight Training Exercises",
-    "proceedings_conference_title": "THE 6TH IEEE INTERNATIONAL CONFERENCE ON ARTIFICIAL INTELLIGENCE IN ENGINEERING AND TECHNOLOGY",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/IICAIET62352.2024.10730681",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Based",
-      "Enhanced",
-      "Checker",
-      "Weight",
-      "Training"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Arti Arya",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "11th International Conference on Soft Computing & Machine Intelligence (ISCMI)",
-    "paperTitle": "Enhancing Fine-Tuning of Pre-trained Language Models for Sentiment Analysis Using Metaheuristic Algorithms",
-    "proceedings_conference_title": "11th International Conference on Soft Computing & Machine Intelligence (ISCMI)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Tuning",
-      "trained",
-      "Language",
-      "Models"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "J Ruby Dinakar",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE International Conference on Contemporary Computing and Communications (InC4)",
-    "paperTitle": "NFTGenesis - An NFT Generation and Authentication System with Market Intelligence Using Deep Learning Based Steganography ",
-    "proceedings_conference_title": "2024 IEEE International Conference on Contemporary Computing and Communications (InC4)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "doi: 10.1109/InC460750.2024.10649392",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "NFTGenesis",
-      "Generation",
-      "Authentication",
-      "System",
-      "Market"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Nazmin Begum",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "International conferenceon Data Science and Explorationin Artificial Intelligence,CODE AI 2024",
-    "paperTitle": "Demystifying Cloud Computing: An Overview of Architecture, Service Models, Benefits, and Challenges",
-    "proceedings_conference_title": "International conferenceon Data Science and Explorationin Artificial Intelligence,CODE AI 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Demystifying",
-      "Cloud",
-      "Computing:",
-      "Overview",
-      "Architecture"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Nazmin Begum",
-    "teacherIds": [
-      
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "5th International Conference on Multidisciplinary and Current Educational Research (ICMCER-2024",
-    "paperTitle": "Deep Learning-Based Cancer Classification from DNA Sequences: Prediction using End-to-End Neural Network without Feature Selection’",
-    "proceedings_conference_title": "5th International Conference on Multidisciplinary and Current Educational Research (ICMCER-2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Learning",
-      "Based",
-      "Cancer",
-      "Classification",
-      "Sequences:"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Nazmin Begum",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "paperTitle": "Synthesizing 3D Faces and Bodies from Text: A Stable Diffusion-based Fusion of DECA and PIFuHD",
-    "proceedings_conference_title": "IEEE 9th International Conference for Convergence in Technology, Pune, India( SCOPUS and WoS Indexed)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/I2CT61223.2024.10543846",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Synthesizing",
-      "Faces",
-      "Bodies",
-      "Text:",
-      "Stable"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 6th International Conference on Electrical, Control and Instrumentation Engineering (ICECIE), Pattaya, Thailand",
-    "paperTitle": "End to End Encrypted Messaging Application Using ORDEX",
-    "proceedings_conference_title": "IEEE 6th International Conference on Electrical, Control and Instrumentation Engineering (ICECIE), Pattaya, Thailand",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/ICECIE63774.2024.10815684",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Encrypted",
-      "Messaging",
-      "Application",
-      "Using",
-      "ORDEX"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 3rd International Conference on Data, Decision and Systems, PES University",
-    "paperTitle": "YouTube Viralomics:  A Scoring Framework by Analyzing Engagement Metrics in the Indian context ",
-    "proceedings_conference_title": "IEEE 3rd International Conference on Data, Decision and Systems, PES University",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "YouTube",
-      "Viralomics:",
-      "Scoring",
-      "Framework",
-      "Analyzing"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Sudeepa Roy Dey",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024), BITS PILANI",
-    "paperTitle": "Unveiling Critical Insights using Predictive Analytics and Explainable AI: A Case Study on COVID-19 through Statistical Inference",
-    "proceedings_conference_title": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024), BITS PILANI",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Unveiling",
-      "Critical",
-      "Insights",
-      "using",
-      "Predictive"
-    ],
-    "domain": "CODMAV"
-  },
-  {
-    "name": "Dr. Prema R",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "FOURTH INTERNATIONAL CONFERENCE ON ARTIFICIAL INTELLIGENCE AND SMART COMPUTING",
-    "paperTitle": "PAVED: A Fusion of Deep Reinforcement Learning with Biometric Authentication for Self-Driving Vehicles",
-    "proceedings_conference_title": "FOURTH INTERNATIONAL CONFERENCE ON ARTIFICIAL INTELLIGENCE AND SMART COMPUTING",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICAIT61638.2024.10690282",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "PAVED:",
-      "Fusion",
-      "Reinforcement",
-      "Learning",
-      "Biometric"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Vandana Mevaldas Ladwani",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Emerging Technologies in Computer Science for Interdisciplinary Applications (ICETCS) 2024",
-    "paperTitle": "Streamlining of Event Management for Attendees and Organizers",
-    "proceedings_conference_title": "International Conference on Emerging Technologies in Computer Science for Interdisciplinary Applications (ICETCS) 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1109/ICETCS61022.2024.10543966",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Streamlining",
-      "Event",
-      "Management",
-      "Attendees",
-      "Organizers"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE International Conference on Electronics, Computing and Communication Technologies (CONECCT) , Bengaluru India ",
-    "paperTitle": "Enhancing Network Resilience for Flood Response and Rehabilitation Using SDN",
-    "proceedings_conference_title": "IEEE International Conference on Electronics, Computing and Communication Technologies (CONECCT) , Bengaluru India ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/CONECCT62155.2024.10677020",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Network",
-      "Resilience",
-      "Flood",
-      "Response"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "IEEE International Conference on Electronics, Computing and Communication Technologies (CONECCT) , Bengaluru India ",
-    "paperTitle": "Advancing Cricket Narratives: AI-Enhanced Advanced Journaling in the IPL Using Language Models",
-    "proceedings_conference_title": "IEEE International Conference on Electronics, Computing and Communication Technologies (CONECCT) , Bengaluru India ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/CONECCT62155.2024.10677234",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advancing",
-      "Cricket",
-      "Narratives:",
-      "Enhanced",
-      "Advanced"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "2024 2nd International Conference on Sustainable Computing and Smart Systems (ICSCSS) , Coimbatore, India",
-    "paperTitle": " Enhancing Efficiency in Smart Grid Billing with Blockchain Technology and Smart Contracts",
-    "proceedings_conference_title": "2024 2nd International Conference on Sustainable Computing and Smart Systems (ICSCSS) , Coimbatore, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICSCSS60660.2024.10625244",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Efficiency",
-      "Smart",
-      "Billing",
-      "Blockchain"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "2024 4th International Conference on Intelligent Technologies (CONIT)",
-    "paperTitle": "MediBot: Revolutionizing Healthcare with IoT-Based Autonomous Medication Management and Smart Cart Facility",
-    "proceedings_conference_title": "2024 4th International Conference on Intelligent Technologies (CONIT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/CONIT61985.2024.10626312",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "MediBot:",
-      "Revolutionizing",
-      "Healthcare",
-      "Based",
-      "Autonomous"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Prajwala Ranganath Talanki",
-    "teacherIds": [
-    "Nivedita Kasturi"
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "International Conference on Computational Research and Data Analytics (ICCRDA-2025)",
-    "paperTitle": "NexGen Farming: AI-Driven Agriculture with GAN, Crop Selection, Predictive Irrigation, Fertilizer Planning, and Crop Monitoring",
-    "proceedings_conference_title": "International Conference on Computational Research and Data Analytics (ICCRDA-2025)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "NexGen",
-      "Farming:",
-      "Driven",
-      "Agriculture",
-      "Selection"
-    ],
-    "domain": "CODMAV"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "2024 4th International Conference on Intelligent Technologies (CONIT)",
-    "paperTitle": "Advancing Urban Evacuation Management: A Real-Time, Adaptive Model Leveraging Cloud-Enabled Big Data and IoT Surveillance",
-    "proceedings_conference_title": "2024 4th International Conference on Intelligent Technologies (CONIT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/CONIT61985.2024.10626540",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advancing",
-      "Urban",
-      "Evacuation",
-      "Management:",
-      "Adaptive"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Saritha K",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 IEEE Students Conference on Engineering and Systems (SCES), Prayagraj, India, 2024, NIT Allahabad",
-    "paperTitle": "Integrating Deep Learning Techniques for Enhanced Cyclone Prediction and its Impact on Air Quality Index Utilizing Satellite Imagery",
-    "proceedings_conference_title": "2024 IEEE Students Conference on Engineering and Systems (SCES), Prayagraj, India, 2024, NIT Allahabad",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/SCES61914.2024.10652299.",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Integrating",
-      "Learning",
-      "Techniques",
-      "Enhanced",
-      "Cyclone"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Dr. Saritha K",
-    "teacherIds": [
-      
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "5th International conference on Computing on computer science, commyunication and /services(COMS2)",
-    "paperTitle": "Monitoring the concentration of air pollutants and its health hazards using Machine Learning models",
-    "proceedings_conference_title": "5th International conference on Computing on computer science, commyunication and /services(COMS2)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-3-031-75170-7_19",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Monitoring",
-      "concentration",
-      "pollutants",
-      "health",
-      "hazards"
-    ],
-    "domain": "General"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-      
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "nnovative Computing and Communications. ICICC 2024. Lecture Notes in Networks and Systems, vol 1043. Springer",
-    "paperTitle": "Comparison of GANs for Speech to Face Generation Using a Custom Indian Face Dataset",
-    "proceedings_conference_title": "nnovative Computing and Communications. ICICC 2024. Lecture Notes in Networks and Systems, vol 1043. Springer",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-4228-8_34",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Comparison",
-      "Speech",
-      "Generation",
-      "Using",
-      "Custom"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. J Mannar Mannan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "Inernational Conferene on Data Intelligence & Secure Computing - DISC 2024",
-    "paperTitle": "Holistic Solution for ADHD with Machine Learning: Bridging Detection and Intervention Strategies",
-    "proceedings_conference_title": "Inernational Conferene on Data Intelligence & Secure Computing - DISC 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Holistic",
-      "Solution",
-      "Machine",
-      "Learning:",
-      "Bridging"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. J Mannar Mannan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "9th International Conference for Convergence in Technology (I2CT) 2024",
-    "paperTitle": "Carcinikos - Presentiment of Cancer in Males using Multimodeal Tecchniques",
-    "proceedings_conference_title": "9th International Conference for Convergence in Technology (I2CT) 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/I2CT61223.2024.10543336",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Carcinikos",
-      "Presentiment",
-      "Cancer",
-      "Males",
-      "using"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. J Mannar Mannan",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "IATMSI-2024",
-    "paperTitle": "An Intelligent Fetal Prognostic System using Machine learning Techniques",
-    "proceedings_conference_title": "IATMSI-2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2016",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/IATMSI60426.2024.10503455",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Intelligent",
-      "Fetal",
-      "Prognostic",
-      "System",
-      "using"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Kokila P",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 International Conference on Current Trends in Advanced Computing (ICCTAC)",
-    "paperTitle": "Integrated Sensory Perception: Real-Time Object Detection, Action Recognition and Emotion Analysis",
-    "proceedings_conference_title": "2024 International Conference on Current Trends in Advanced Computing (ICCTAC)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICCTAC61556.2024.10581033",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Integrated",
-      "Sensory",
-      "Perception:",
-      "Object",
-      "Detection"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-      
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Second International Conference on Advances in Information Technology (ICAIT)",
-    "paperTitle": "Smart Slice Selection in 5G: Unleashing the Power of Machine Learning",
-    "proceedings_conference_title": "2024 Second International Conference on Advances in Information Technology (ICAIT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICAIT61638.2024.10690705",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Smart",
-      "Slice",
-      "Selection",
-      "Unleashing",
-      "Power"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Prema R",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "7th ICASETM-24",
-    "paperTitle": "Emotion-aware Music Information Retrieval System",
-    "proceedings_conference_title": "7th ICASETM-24",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://journal.esrgroups.org/jes/article/view/7432",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Emotion",
-      "aware",
-      "Music",
-      "Information",
-      "Retrieval"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Prema R",
-    "teacherIds": [
-      "Dr. Arti Arya"
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Information Technology and Applications Lecture Notes in Network Systems Series",
-    "paperTitle": "Research Challenges and Gaps on the Recent Advances in Animal Emotion Recognition",
-    "proceedings_conference_title": "International Conference on Information Technology and Applications Lecture Notes in Network Systems Series",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Research",
-      "Challenges",
-      "Recent",
-      "Advances",
-      "Animal"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International conference on Interdisciplinary Research in Technology and Management",
-    "paperTitle": "Strategic Portfolio Management System Using Bio-Inspired Algorithms",
-    "proceedings_conference_title": "International conference on Interdisciplinary Research in Technology and Management",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Strategic",
-      "Portfolio",
-      "Management",
-      "System",
-      "Using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Sixth International Conference on Soft Computing and its Engineering Applications",
-    "paperTitle": "Real-Time Multi-Waste Classification and Monitoring Leveraging Varied Imaging  Techniques",
-    "proceedings_conference_title": "Sixth International Conference on Soft Computing and its Engineering Applications",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Multi",
-      "Waste",
-      "Classification",
-      "Monitoring",
-      "Leveraging"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Smart Systems and Wireless Communication [SSWC2024]",
-    "paperTitle": "An Architecture for Phishing URL Detection using Concatenated Features",
-    "proceedings_conference_title": "International Conference on Smart Systems and Wireless Communication [SSWC2024]",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Architecture",
-      "Phishing",
-      "Detection",
-      "using",
-      "Concatenated"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International conference in Artificial Intelligence and Speech Technology.",
-    "paperTitle": " A Comprehensive Review of Instructional Tools and Applications for Dyslexic Learners. In: Dev, A., Sharma, A., Agrawal, S.S., Rani, R. (eds) Artificial Intelligence and Speech Technology. AIST 2023. Communications in Computer and Information Science, vol 2267. Springer, Cham. https://doi.org/10.1007/978-3-031-75164-6_18",
-    "proceedings_conference_title": "International conference in Artificial Intelligence and Speech Technology.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-3-031-75164-6_18",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Comprehensive",
-      "Review",
-      "Instructional",
-      "Tools",
-      "Applications"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Clara Kanmani A",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "international Conference on ,Next Generation Communication & Information Processing ( INCIP 2025), January 23-24 2025 Manipal institute of Technology, Bengaluru.",
-    "paperTitle": "Enhancing Cloud Security: An Ontology-Based NIDS with Semantic Technologies for VM Attack Detection",
-    "proceedings_conference_title": "international Conference on ,Next Generation Communication & Information Processing ( INCIP 2025), January 23-24 2025 Manipal institute of Technology, Bengaluru.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Cloud",
-      "Security:",
-      "Ontology",
-      "Based"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Sarasvathi V",
-    "teacherIds": [
-      "Dr. Gauri Sameer Rapate"
-      ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 7th International Conference on Signal Processing and Information Security (ICSPIS)",
-    "paperTitle": "Data Analysis of Dark Web Marketplaces",
-    "proceedings_conference_title": "2024 7th International Conference on Signal Processing and Information Security (ICSPIS)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://ieeexplore.ieee.org/document/10812633",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Analysis",
-      "Marketplaces"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on “Interdisciplinary Research in Technology & Management” IRTM 2024",
-    "paperTitle": "Strategic Portfolio Management System Using Bio-Inspired Algorithms",
-    "proceedings_conference_title": "International Conference on “Interdisciplinary Research in Technology & Management” IRTM 2024",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2007",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Strategic",
-      "Portfolio",
-      "Management",
-      "System",
-      "Using"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Eleventh International Conference on Business Analytics and Intelligence",
-    "paperTitle": "Sentence Level Correction of Common Spoken Grammatical Errors with Deep Neural Networks",
-    "proceedings_conference_title": "Eleventh International Conference on Business Analytics and Intelligence",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2011",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Sentence",
-      "Level",
-      "Correction",
-      "Common",
-      "Spoken"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Bharathi R",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "Eleventh International Conference on Business Analytics and Intelligence",
-    "paperTitle": "Stock Forecasting and Sector-Specific Recommendation using Deep Learning",
-    "proceedings_conference_title": "Eleventh International Conference on Business Analytics and Intelligence",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2011",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Stock",
-      "Forecasting",
-      "Sector",
-      "Specific",
-      "Recommendation"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Dr. Kokila P",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 15th International Conference on Computing Communication and Networking Technologies (ICCCNT)",
-    "paperTitle": "Advancements in Underwater Image Enhancement Techniques using UFPN-ESRGAN",
-    "proceedings_conference_title": "2024 15th International Conference on Computing Communication and Networking Technologies (ICCCNT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "doi: 10.1109/ICCCNT61001.2024.10724906",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advancements",
-      "Underwater",
-      "Image",
-      "Enhancement",
-      "Techniques"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Deepti Chandrasekharan",
-    "teacherIds": [],
-    "totalAuthors": 6,
-    "bookTitle": "1st International Conference on Optimization Techniques for Learning (ICOTL), Bengaluru, India, 2023",
-    "paperTitle": "A Novel Approach to Identify Diabetic Macular Edema Using a Minimal CNN Model,",
-    "proceedings_conference_title": "1st International Conference on Optimization Techniques for Learning (ICOTL), Bengaluru, India, 2023",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/ICOTL59758.2023.10435002",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Novel",
-      "Approach",
-      "Identify",
-      "Diabetic",
-      "Macular"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Shruthi L",
-    "teacherIds": [],
-    "totalAuthors": 6,
-    "bookTitle": "2024 Parul International Conference on Engineering and Technology (PICET)",
-    "paperTitle": "Application of Blockchain to Prevent Benami Transactions",
-    "proceedings_conference_title": "2024 Parul International Conference on Engineering and Technology (PICET)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/PICET60765.2024.10716170",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Application",
-      "Blockchain",
-      "Prevent",
-      "Benami",
-      "Transactions"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Shruthi L",
-    "teacherIds": [],
-    "totalAuthors": 6,
-    "bookTitle": "ICAMC-International conference on Emerging applications of artificial intelligence,machine learning and cyber security",
-    "paperTitle": "web appliaction for speech impairment using sign language translation and facial recognition",
-    "proceedings_conference_title": "ICAMC-International conference on Emerging applications of artificial intelligence,machine learning and cyber security",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "appliaction",
-      "speech",
-      "impairment",
-      "using",
-      "language"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 2,
-    "bookTitle": "Third International Conference on Security, Privacy, and Data Analytics (ISPDA 2024)",
-    "paperTitle": "An Integrated Approach for Augmenting Computer Accessibility: Eye-Tracking Software for Individuals with Disabilities",
-    "proceedings_conference_title": "Third International Conference on Security, Privacy, and Data Analytics (ISPDA 2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Integrated",
-      "Approach",
-      "Augmenting",
-      "Computer",
-      "Accessibility:"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "ISPDA 2024 - 3rd International Conference on Security, Privacy and Data Analytics",
-    "paperTitle": "Performance Benchmarking of Adaptive TCP Variants in Dynamic Vehicular IoT Networks",
-    "proceedings_conference_title": "ISPDA 2024 - 3rd International Conference on Security, Privacy and Data Analytics",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Performance",
-      "Benchmarking",
-      "Adaptive",
-      "Variants",
-      "Dynamic"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-      
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "4th International Conference on Intelligent Systems & Sustainable Computing (ICISSC-2024)",
-    "paperTitle": "A Multi-Cluster, Real-Time IoT Solution for Child Abduction Prevention: Integration of Mobility Analysis Using Contiki OS and Cooja Simulator",
-    "proceedings_conference_title": "4th International Conference on Intelligent Systems & Sustainable Computing (ICISSC-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Multi",
-      "Cluster",
-      "Solution",
-      "Child",
-      "Abduction"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024)",
-    "paperTitle": "Blockchain in Crop Insurance: Enhancing Transparency and Efficiency",
-    "proceedings_conference_title": "5th International Conference on Frontiers in Computing and Systems (COMSYS-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Blockchain",
-      "Insurance:",
-      "Enhancing",
-      "Transparency",
-      "Efficiency"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "9th International Conference on Information and Communication Technology for Competitive Strategies (ICTCS-2024)",
-    "paperTitle": "Identifying Critical Nodes in Complex Networks: A Study of Iterative Algorithms with 6LoWPAN RPL-powered Cooja",
-    "proceedings_conference_title": "9th International Conference on Information and Communication Technology for Competitive Strategies (ICTCS-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Identifying",
-      "Critical",
-      "Nodes",
-      "Complex",
-      "Networks:"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "1st International Conference on Data, Computation, and Communication (ICDCC-2024)",
-    "paperTitle": "Revolutionizing Recruitment with Large Language Models: A Multimodal AI Framework Integrating Video, Social Media, and Traditional Screening for Efficient Talent Acquisition",
-    "proceedings_conference_title": "1st International Conference on Data, Computation, and Communication (ICDCC-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Revolutionizing",
-      "Recruitment",
-      "Large",
-      "Language",
-      "Models:"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "9th International Conference on Communication and Electronics Systems (ICCES-2024)",
-    "paperTitle": "Bit Errors, Congestion, or Success? Investigating Packet Loss in VANETs",
-    "proceedings_conference_title": "9th International Conference on Communication and Electronics Systems (ICCES-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Errors",
-      "Congestion",
-      "Success?",
-      "Investigating",
-      "Packet"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 2,
-    "bookTitle": "International Conference on Work Integrated Learning – 2024. - BITS Pilani Hyderabad ",
-    "paperTitle": "Improving Work Integrated Learning Outcomes through Big Data Technologies: An Insight into Student Learning Patterns",
-    "proceedings_conference_title": "International Conference on Work Integrated Learning – 2024. - BITS Pilani Hyderabad ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Improving",
-      "Integrated",
-      "Learning",
-      "Outcomes",
-      "through"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "International Conference on Work Integrated Learning – 2024. - BITS Pilani Hyderabad ",
-    "paperTitle": "Harnessing LLMs and Generative AI in NLP for Crafting Personalized Learning Paths in Emerging Fields:",
-    "proceedings_conference_title": "International Conference on Work Integrated Learning – 2024. - BITS Pilani Hyderabad ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Harnessing",
-      "Generative",
-      "Crafting",
-      "Personalized",
-      "Learning"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Jeny Jijo",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computing Science, Communication and Security(COMS2)",
-    "paperTitle": "Containment of Compromised Nodes in a Distributed Environment",
-    "proceedings_conference_title": "International Conference on Computing Science, Communication and Security(COMS2)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-3-031-75170-7_20",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Containment",
-      "Compromised",
-      "Nodes",
-      "Distributed",
-      "Environment"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Shilpa S",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "6th International Conference on Inventive Computation and Information Technologies (ICICIT 2024) to be held 16-17, April 2024 in Stamford International University, Bangkok, Thailand.",
-    "paperTitle": "Cloud-based Deep Learning Model for Classifying Skin Cancer  ",
-    "proceedings_conference_title": "6th International Conference on Inventive Computation and Information Technologies (ICICIT 2024) to be held 16-17, April 2024 in Stamford International University, Bangkok, Thailand.",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/ICAAIC60222.2024.10575849",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Cloud",
-      "based",
-      "Learning",
-      "Model",
-      "Classifying"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Shilpa S",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "AlliedCon: International Conference on Allied Health sciences” (AlliedCon)",
-    "paperTitle": "Deep Learning Model for Classifying Skin Cancer Images",
-    "proceedings_conference_title": "AlliedCon: International Conference on Allied Health sciences” (AlliedCon)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Learning",
-      "Model",
-      "Classifying",
-      "Cancer",
-      "Images"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Shilpa S",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "International Conference on Computer, Cybernetics and  Education (ICCCE-2024)",
-    "paperTitle": "ADAS for Indian roads",
-    "proceedings_conference_title": "International Conference on Computer, Cybernetics and  Education (ICCCE-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Indian",
-      "roads"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Shilpa S",
-    "teacherIds": [],
-    "totalAuthors": 5,
-    "bookTitle": "IEEE 6th edition PiCET 2024 Submission id 64",
-    "paperTitle": "OptiNet: Leveraging Deep Learning Ensembles for Timely Detection of Visual Abnormalities in Children",
-    "proceedings_conference_title": "IEEE 6th edition PiCET 2024 Submission id 64",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/PICET60765.2024.10716101",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "OptiNet:",
-      "Leveraging",
-      "Learning",
-      "Ensembles",
-      "Timely"
-    ],
-    "domain": "CodMaV"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "2023 IEEE International Symposium on Smart Electronic Systems (iSES) , Ahmedabad, India",
-    "paperTitle": "VitalSense+: A Mobility-based Multi-Sink Approach for Prioritized Vital Monitoring in Military Operations",
-    "proceedings_conference_title": "2023 IEEE International Symposium on Smart Electronic Systems (iSES) , Ahmedabad, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/iSES58672.2023.00024",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "VitalSense+:",
-      "Mobility",
-      "based",
-      "Multi",
-      "Approach"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "2023 IEEE MIT Undergraduate Research Technology Conference (URTC) , Cambridge, MA, USA",
-    "paperTitle": "Orthographic Syllable Pair Encoding for Language modelling tasks in Indic Languages",
-    "proceedings_conference_title": "2023 IEEE MIT Undergraduate Research Technology Conference (URTC) , Cambridge, MA, USA",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/URTC60662.2023.10534970",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Orthographic",
-      "Syllable",
-      "Encoding",
-      "Language",
-      "modelling"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "paperTitle": "RPL-Powered Low-Power Lossy Networks: A Catalyst for Advancing Smart Grid Capabilities",
-    "proceedings_conference_title": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/NKCon59507.2023.10396129",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Powered",
-      "Power",
-      "Lossy",
-      "Networks:",
-      "Catalyst"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 2,
-    "bookTitle": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "paperTitle": "Enhancing Disaster Response: A Study on SDN-Integrated Alarm and Alert Systems Using Cooja Simulations",
-    "proceedings_conference_title": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/NKCon59507.2023.10396137",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Disaster",
-      "Response:",
-      "Study",
-      "Integrated"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 3,
-    "bookTitle": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "paperTitle": "HVSNA: An Advanced Hybrid Attack on RPL-Based Low-Power Wireless Networks",
-    "proceedings_conference_title": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/NKCon59507.2023.10396649",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "HVSNA:",
-      "Advanced",
-      "Hybrid",
-      "Attack",
-      "Based"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 3,
-    "bookTitle": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "paperTitle": "Analyzing the Impact of RPL Routing Attacks on the Smart City Ecosystems",
-    "proceedings_conference_title": "2023 IEEE North Karnataka Subsection Flagship International Conference (NKCon) , Belagavi, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/NKCon59507.2023.10396069",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Analyzing",
-      "Impact",
-      "Routing",
-      "Attacks",
-      "Smart"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Animesh Giri",
-    "teacherIds": [],
-    "totalAuthors": 4,
-    "bookTitle": "2023 International Conference on Evolutionary Algorithms and Soft Computing Techniques (EASCT) , Bengaluru, India",
-    "paperTitle": "Reinforcement Learning Employing a Multi-Objective Reward Function for SDN Routing Optimization",
-    "proceedings_conference_title": "2023 International Conference on Evolutionary Algorithms and Soft Computing Techniques (EASCT) , Bengaluru, India",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "10.1109/EASCT59475.2023.10392368",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Reinforcement",
-      "Learning",
-      "Employing",
-      "Multi",
-      "Objective"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 3,
-    "bookTitle": " Internation Conference on Information System Design: AI and ML Applications. ISDIA 2024. Lecture Notes in Networks and Systems, vol 1107. Springer, Singapore. ",
-    "paperTitle": "Enhancing Yoga Posture Recognition with Deep Learning: A Customized Activation Function Approach. ",
-    "proceedings_conference_title": " Internation Conference on Information System Design: AI and ML Applications. ISDIA 2024. Lecture Notes in Networks and Systems, vol 1107. Springer, Singapore. ",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-6581-2_12",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Enhancing",
-      "Posture",
-      "Recognition",
-      "Learning:",
-      "Customized"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-   
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 International Conference on Electronics, Computing, Communication and Control Technology (ICECCC)",
-    "paperTitle": "Advanced Reinforcement Learning Based Penetration Testing",
-    "proceedings_conference_title": "2024 International Conference on Electronics, Computing, Communication and Control Technology (ICECCC)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/ICECCC61767.2024.10593902",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Advanced",
-      "Reinforcement",
-      "Learning",
-      "Based",
-      "Penetration"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Pooja Agarwal",
-    "teacherIds": [
-
-    ],
-    "totalAuthors": 4,
-    "bookTitle": "SDCN 2024- SmartDataCom: Internation Conference on Smart Data-processing,   Communication and Networking, Europe",
-    "paperTitle": "Software Vulnerability Detection using Ensemble Methods and BERT",
-    "proceedings_conference_title": "SDCN 2024- SmartDataCom: Internation Conference on Smart Data-processing,   Communication and Networking, Europe",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2025",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Software",
-      "Vulnerability",
-      "Detection",
-      "using",
-      "Ensemble"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
-     
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "5th Doctoral Symposium of Computational Intelligence (DoSCI-2024)",
-    "paperTitle": "API Summarization, Digitization of PHR and validation through Blockchain",
-    "proceedings_conference_title": "5th Doctoral Symposium of Computational Intelligence (DoSCI-2024)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "https://doi.org/10.1007/978-981-97-6318-4_32",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Summarization",
-      "Digitization",
-      "validation",
-      "through",
-      "Blockchain"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Dr. Vinodha K",
-    "teacherIds": [
- 
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 Second International Conference on Advances in Information Technology (ICAIT)",
-    "paperTitle": "Talent acquisition process using NLP and Machine Learning",
-    "proceedings_conference_title": "2024 Second International Conference on Advances in Information Technology (ICAIT)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "DOI: 10.1109/ICAIT61638.2024.10690675",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Talent",
-      "acquisition",
-      "process",
-      "using",
-      "Machine"
-    ],
-    "domain": "CCNCS"
-  },
-  {
-    "name": "Surbhi Choudhary",
-    "teacherIds": [
-    
-    ],
-    "totalAuthors": 5,
-    "bookTitle": "2024 International Conference on Intelligent Systems and Advanced Applications (ICISAA)",
-    "paperTitle": "Classification of Brain Tumors in MRI Images Using GoogLeNet architecture with Walrus Optimization",
-    "proceedings_conference_title": "2024 International Conference on Intelligent Systems and Advanced Applications (ICISAA)",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Classification",
-      "Brain",
-      "Tumors",
-      "Images",
-      "Using"
-    ],
-    "domain": "C3I"
-  },
-  {
-    "name": "Dr. Sandesh B J",
-    "teacherIds": [
-  
-    ],
-    "totalAuthors": 6,
-    "bookTitle": "9th Edition ICT4SD International ICT Summit & Awards",
-    "paperTitle": "Winning Formula: Data-Driven Cricket Team Selection and Match Prediction",
-    "proceedings_conference_title": "9th Edition ICT4SD International ICT Summit & Awards",
-    "volumeNo": "1",
-    "issueNo": "1",
-    "year": "2024",
-    "pageNumber": 0,
-    "issn": "NA",
-    "is_affiliating_institution_same": False,
-    "publisherName": "NA",
-    "impactFactor": "0",
-    "core": "NA",
-    "link_of_paper": "",
-    "isCapstone": True,
-    "abstract": "Not provided",
-    "keywords": [
-      "Winning",
-      "Formula:",
-      "Driven",
-      "Cricket",
-      "Selection"
-    ],
-    "domain": "CodMaV"
-  }
-]
-
-
-print("Started seeding journal data...")
-
-
-for record in journal:
-    try:
-        # Use custom JSON dumps to handle serialization
-        response = requests.post(
-            journal_api_url, 
-            data=json.dumps(record),
-            headers={'Content-Type': 'application/json'}
-        )
-        
-        if response.status_code == 201:
-            print(f"successfully.")
-        else:
-            print(f"Failed : {response.text}")
-    except Exception as e:
-        print(f"Error: {e}")
-        
-        
-print("Started seeding conference data...")
-        
-        
-for record in conference:
-    try:
-        # Use custom JSON dumps to handle serialization
-        response = requests.post(
-            conference_api_url, 
-            data=json.dumps(record),
-            headers={'Content-Type': 'application/json'}
-        )
-        
-        if response.status_code == 201:
-            print(f"successfully.")
-        else:
-            print(f"Failed : {response.text}")
-    except Exception as e:
-        print(f"Error: {e}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Shared helpers used by the seed scripts."""
+
+from .checkpoint import Checkpoint, open_checkpoint, record_key
+from .datasets import DATA_DIR, dataset_path, find_dataset, iter_jsonl, iter_parquet, load_dataset
+from .manifest import Manifest, open_manifest
+from .sender import Seeder, SeedSummary, send_all, send_records
+from .throttle import RateLimitThrottle
+from .transport import HttpxTransport, RequestsTransport, Transport, make_transport
+
+__all__ = [
+    "DATA_DIR",
+    "Checkpoint",
+    "HttpxTransport",
+    "Manifest",
+    "RateLimitThrottle",
+    "RequestsTransport",
+    "Seeder",
+    "SeedSummary",
+    "Transport",
+    "dataset_path",
+    "find_dataset",
+    "iter_jsonl",
+    "iter_parquet",
+    "load_dataset",
+    "make_transport",
+    "open_checkpoint",
+    "open_manifest",
+    "record_key",
+    "send_all",
+    "send_records",
+]
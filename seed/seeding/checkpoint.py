@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+
+
+def iter_entries(path):
+    """Yield the ``(key, url)`` entries of a checkpoint file, skipping a partially written last line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                yield entry["key"], entry.get("url")
+            except (ValueError, KeyError):
+                continue
+
+
+def record_key(url, record):
+    """Content hash identifying ``record`` posted to ``url``."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{url}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+class Checkpoint:
+    """
+    Append-only JSONL log of records the backend acknowledged with a 201.
+
+    Each line holds the content hash of one record (see :func:`record_key`).
+    Reopening the same file on a later run lets the sender skip every record
+    that already went through without touching the network, so an interrupted
+    seed can simply be rerun. A partially written last line (from a crash
+    mid-write) is ignored.
+
+    Args:
+        path (str): Location of the checkpoint file. Created if missing
+        known (iterable, optional): Keys to skip without logging them, e.g. those of another checkpoint
+    """
+
+    def __init__(self, path, known=()):
+        self.path = path
+        self._done = set(known)
+        if os.path.exists(path):
+            self._done.update(key for key, _ in iter_entries(path))
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key):
+        return key in self._done
+
+    def __len__(self):
+        return len(self._done)
+
+    def mark(self, key, url):
+        """Record ``key`` as acknowledged and flush it to disk immediately."""
+        if key in self._done:
+            return
+        self._done.add(key)
+        self._file.write(json.dumps({"key": key, "url": url}) + "\n")
+        self._file.flush()
+
+    def merge(self, path):
+        """Log every key of the checkpoint file at ``path`` (e.g. one shard's) in this one."""
+        for key, url in iter_entries(path):
+            self.mark(key, url)
+
+    def close(self):
+        self._file.close()
+
+
+def open_checkpoint(path=None):
+    """Open the checkpoint at ``path`` or SEED_CHECKPOINT; returns None when neither is set."""
+    if isinstance(path, Checkpoint):
+        return path
+    path = path or os.environ.get("SEED_CHECKPOINT")
+    return Checkpoint(path) if path else None
@@ -0,0 +1,447 @@
+"""
+Direct-to-database loader for bootstrapping a fresh instance.
+
+Skips the API entirely: users, journals and conferences are turned into rows
+for the ``users``, ``journal``, ``journalUser``, ``conference`` and
+``conferenceUser`` tables, with ids generated, owners and co-authors resolved
+to user ids locally and passwords pre-hashed. Each table is streamed as one
+``COPY ... FROM STDIN`` in its own transaction. Records go through the same
+client-side validation as ``python -m seed run``, so the tables end up with
+what the API would have stored for a successful run.
+"""
+import os
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+
+from .names import NameIndex
+from .passwords import hash_passwords
+
+REQUIRED = object()
+
+
+@dataclass
+class Table:
+    """
+    Columns of one table as the loader writes them.
+
+    ``createdAt`` is left out so the database fills in its default. Defaults
+    follow the ``.default()`` of the matching Joi schema.
+
+    Args:
+        name (str): Table name
+        columns (tuple): ``(column, default)`` pairs; REQUIRED columns must be present in every row
+        references (dict, optional): Column -> referenced table, used by the SQLite stand-in
+    """
+
+    name: str
+    columns: tuple
+    references: dict = field(default_factory=dict)
+
+    @property
+    def column_names(self):
+        return [column for column, _ in self.columns]
+
+    def row(self, values):
+        row = []
+        for column, default in self.columns:
+            value = values.get(column, default)
+            if value is REQUIRED:
+                raise ValueError(f'"{column}" is required for {self.name}')
+            row.append(value)
+        return row
+
+    def copy_sql(self, source="STDIN", command="COPY"):
+        columns = ", ".join(f'"{column}"' for column in self.column_names)
+        return f'{command} "{self.name}" ({columns}) FROM {source}'
+
+
+USERS = Table(
+    "users",
+    (
+        ("id", REQUIRED),
+        ("empId", REQUIRED),
+        ("password", REQUIRED),
+        ("name", REQUIRED),
+        ("phno", REQUIRED),
+        ("dept", REQUIRED),
+        ("campus", REQUIRED),
+        ("panNo", REQUIRED),
+        ("qualification", REQUIRED),
+        ("designation", REQUIRED),
+        ("expertise", REQUIRED),
+        ("dateofJoining", REQUIRED),
+        ("totalExpBfrJoin", REQUIRED),
+        ("googleScholarId", REQUIRED),
+        ("sId", REQUIRED),
+        ("oId", REQUIRED),
+        ("role", "user"),
+        ("accessTo", "none"),
+        ("profileImg", None),
+        ("centre_name", None),
+    ),
+)
+JOURNAL = Table(
+    "journal",
+    (
+        ("id", REQUIRED),
+        ("title", REQUIRED),
+        ("teacherAdminId", REQUIRED),
+        ("campus", REQUIRED),
+        ("dept", REQUIRED),
+        ("journalName", REQUIRED),
+        ("month", REQUIRED),
+        ("year", REQUIRED),
+        ("volumeNo", REQUIRED),
+        ("issueNo", REQUIRED),
+        ("issn", REQUIRED),
+        ("websiteLink", None),
+        ("articleLink", None),
+        ("status", None),
+        ("isUGC", False),
+        ("isScopus", False),
+        ("isWOS", False),
+        ("qNo", "NA"),
+        ("impactFactor", None),
+        ("isCapstone", False),
+        ("isAffiliating", False),
+        ("pageNumber", 0),
+        ("abstract", REQUIRED),
+        ("keywords", None),
+        ("domain", REQUIRED),
+    ),
+    {"teacherAdminId": "users"},
+)
+JOURNAL_USER = Table(
+    "journalUser",
+    (("id", REQUIRED), ("journalId", REQUIRED), ("userId", REQUIRED)),
+    {"journalId": "journal", "userId": "users"},
+)
+CONFERENCE = Table(
+    "conference",
+    (
+        ("id", REQUIRED),
+        ("teacherAdminId", REQUIRED),
+        ("totalAuthors", 1),
+        ("campus", REQUIRED),
+        ("dept", REQUIRED),
+        ("bookTitle", REQUIRED),
+        ("paperTitle", REQUIRED),
+        ("proceedings_conference_title", REQUIRED),
+        ("volumeNo", REQUIRED),
+        ("status", None),
+        ("issueNo", REQUIRED),
+        ("year", REQUIRED),
+        ("pageNumber", 0),
+        ("issn", REQUIRED),
+        ("is_affiliating_institution_same", False),
+        ("publisherName", REQUIRED),
+        ("impactFactor", REQUIRED),
+        ("core", "NA"),
+        ("link_of_paper", ""),
+        ("isCapstone", False),
+        ("abstract", REQUIRED),
+        ("keywords", None),
+        ("domain", REQUIRED),
+    ),
+    {"teacherAdminId": "users"},
+)
+CONFERENCE_USER = Table(
+    "conferenceUser",
+    (("id", REQUIRED), ("conferenceId", REQUIRED), ("userId", REQUIRED)),
+    {"conferenceId": "conference", "userId": "users"},
+)
+
+# Load order respects the foreign keys.
+TABLES = (USERS, JOURNAL, JOURNAL_USER, CONFERENCE, CONFERENCE_USER)
+# Publication table -> (join table, join column)
+LINKS = {"journal": (JOURNAL_USER, "journalId"), "conference": (CONFERENCE_USER, "conferenceId")}
+# Entities the loader understands, and the table their records go to.
+BOOTSTRAP_ENTITIES = {
+    "users": "users",
+    "defaultUsers": "users",
+    "journal": "journal",
+    "journal2023": "journal",
+    "conference": "conference",
+    "conference2023": "conference",
+}
+
+_ID_PREFIX = format(random.getrandbits(32), "x")
+_last_tick = 0
+_ID_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def new_id():
+    """
+    Return a unique text id in the spirit of the backend's ``uniqid()``.
+
+    A random per-process prefix followed by a base36 microsecond clock that
+    never repeats within the process.
+    """
+    global _last_tick
+    _last_tick = max(_last_tick + 1, time.time_ns() // 1000)
+    tick, digits = _last_tick, []
+    while tick:
+        tick, digit = divmod(tick, 36)
+        digits.append(_ID_DIGITS[digit])
+    return _ID_PREFIX + "".join(reversed(digits))
+
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_COPY_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def _array_item(item):
+    if item is None:
+        return "NULL"
+    return '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def copy_value(value):
+    """Encode one value for COPY's text format (``\\N`` for NULL, ``t``/``f``, ``{...}`` arrays)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, tuple)):
+        value = "{" + ",".join(_array_item(item) for item in value) + "}"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_line(row):
+    return "\t".join(copy_value(value) for value in row) + "\n"
+
+
+def parse_copy_line(line):
+    """Decode a line produced by :func:`copy_line` back into values (arrays stay literals)."""
+    return [
+        None if value == "\\N" else _ESCAPE.sub(lambda m: _COPY_UNESCAPES.get(m.group(1), m.group(1)), value)
+        for value in line.rstrip("\n").split("\t")
+    ]
+
+
+class BootstrapPlan:
+    """
+    Rows for every bootstrap table, built from seed records.
+
+    Users must be added before publications so owners and co-authors can be
+    resolved against them. Records the API would reject (duplicate ``empId``,
+    an owner or co-author that matches no single user, a column the table
+    requires missing) are reported and skipped.
+
+    Args:
+        hasher (callable, optional): Maps a list of passwords to their hashes, in order.
+            Defaults to hashing across all cores with :func:`hash_passwords`
+    """
+
+    def __init__(self, hasher=None):
+        self.hasher = hasher or hash_passwords
+        self.rows = {table.name: [] for table in TABLES}
+        self.skipped = 0
+        self._users = {}
+        self._emp_ids = set()
+        self._index = None
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.rows.values())
+
+    def add_users(self, records):
+        fresh = []
+        for record in records:
+            if record["empId"] in self._emp_ids:
+                print(f"Skipped user {record['empId']}: User already exists!!")
+                self.skipped += 1
+                continue
+            self._emp_ids.add(record["empId"])
+            fresh.append(record)
+        for record, password in zip(fresh, self.hasher([record["password"] for record in fresh])):
+            values = dict(record, id=new_id(), password=password)
+            try:
+                row = USERS.row(values)
+            except ValueError as e:
+                print(f"Skipped user {record['empId']}: {e}")
+                self.skipped += 1
+                continue
+            self._users[values["id"]] = values
+            self.rows[USERS.name].append(row)
+        self._index = None
+
+    def add_publications(self, table_name, records):
+        if self._index is None:
+            self._index = NameIndex((user_id, user["name"]) for user_id, user in self._users.items())
+        table = next(table for table in TABLES if table.name == table_name)
+        link_table, link_column = LINKS[table_name]
+        for record in records:
+            resolved = self._index.resolve_record(record, "teacherAdminId", "teacherIds")
+            if resolved is None:
+                print(f"Skipped {table_name} by {record.get('name')}: User not found")
+                self.skipped += 1
+                continue
+            owner = self._users[resolved["teacherAdminId"]]
+            values = dict(resolved, id=new_id(), status="Published", campus=owner["campus"], dept=owner["dept"])
+            try:
+                row = table.row(values)
+            except ValueError as e:
+                print(f"Skipped {table_name} by {record.get('name')}: {e}")
+                self.skipped += 1
+                continue
+            self.rows[table_name].append(row)
+            for user_id in dict.fromkeys([*resolved.get("teacherIds", []), owner["id"]]):
+                self.rows[link_table.name].append(link_table.row({"id": new_id(), link_column: values["id"], "userId": user_id}))
+
+    def copy_lines(self, table):
+        return (copy_line(row) for row in self.rows[table.name])
+
+
+def build_plan(entities, options, hasher=None):
+    """
+    Load, validate and convert the given bootstrap entities.
+
+    Args:
+        entities (list): Registered entities whose names are in BOOTSTRAP_ENTITIES
+        options: Parsed CLI options passed to each entity's loader
+        hasher (callable, optional): See :class:`BootstrapPlan`
+
+    Returns:
+        BootstrapPlan: The rows to load
+    """
+    plan = BootstrapPlan(hasher)
+    # Users first, whatever order the entities were given in.
+    for entity in sorted(entities, key=lambda entity: BOOTSTRAP_ENTITIES[entity.name] != "users"):
+        records = []
+        for record in entity.load(options):
+            errors = entity.schema.errors(record) if entity.schema else []
+            if errors:
+                label = entity.describe(record) if entity.describe else entity.name
+                print(f"Invalid {label}: {'; '.join(errors)}")
+                plan.skipped += 1
+                continue
+            records.append(record)
+        if BOOTSTRAP_ENTITIES[entity.name] == "users":
+            plan.add_users(records)
+        else:
+            plan.add_publications(BOOTSTRAP_ENTITIES[entity.name], records)
+    return plan
+
+
+class _LineReader:
+    """File-like view of an iterator of lines, for psycopg2's ``copy_expert``."""
+
+    def __init__(self, lines):
+        self._lines = lines
+        self._buffer = ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    readline = read
+
+
+def _report(table, count, started):
+    print(f"{table.name}: {count} rows in {time.perf_counter() - started:.2f}s.")
+
+
+def load_postgres(dsn, plan):
+    """
+    COPY every table into Postgres, one transaction per table.
+
+    Uses psycopg 3 when installed, otherwise psycopg2.
+
+    Args:
+        dsn (str): Connection string, e.g. the backend's DB_URL
+        plan (BootstrapPlan): Rows to load
+    """
+    try:
+        import psycopg
+    except ImportError:
+        psycopg = None
+    if psycopg is not None:
+        with psycopg.connect(dsn) as connection:
+            for table in TABLES:
+                started = time.perf_counter()
+                with connection.transaction(), connection.cursor() as cursor:
+                    with cursor.copy(table.copy_sql()) as copy:
+                        for line in plan.copy_lines(table):
+                            copy.write(line)
+                _report(table, len(plan.rows[table.name]), started)
+        return
+
+    import psycopg2
+
+    connection = psycopg2.connect(dsn)
+    try:
+        for table in TABLES:
+            started = time.perf_counter()
+            with connection, connection.cursor() as cursor:
+                cursor.copy_expert(table.copy_sql(), _LineReader(plan.copy_lines(table)))
+            _report(table, len(plan.rows[table.name]), started)
+    finally:
+        connection.close()
+
+
+def load_sqlite(path, plan):
+    """
+    Load the COPY streams into a SQLite stand-in, one transaction per table.
+
+    Every line is decoded from the same COPY text that would go to Postgres,
+    so a successful load checks the encoding as well as the foreign keys.
+
+    Args:
+        path (str): Database file, or ``:memory:``
+        plan (BootstrapPlan): Rows to load
+
+    Returns:
+        sqlite3.Connection: The open database, for inspection
+    """
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    for table in TABLES:
+        columns = [f'"{column}" TEXT' + (" PRIMARY KEY" if column == "id" else "") for column in table.column_names]
+        columns.append('"createdAt" TEXT DEFAULT CURRENT_TIMESTAMP')
+        columns += [f'FOREIGN KEY ("{column}") REFERENCES "{ref}" ("id")' for column, ref in table.references.items()]
+        connection.execute(f'CREATE TABLE IF NOT EXISTS "{table.name}" ({", ".join(columns)})')
+    for table in TABLES:
+        started = time.perf_counter()
+        names = ", ".join(f'"{column}"' for column in table.column_names)
+        marks = ", ".join("?" for _ in table.columns)
+        with connection:
+            connection.executemany(
+                f'INSERT INTO "{table.name}" ({names}) VALUES ({marks})',
+                (parse_copy_line(line) for line in plan.copy_lines(table)),
+            )
+        _report(table, len(plan.rows[table.name]), started)
+    return connection
+
+
+def write_copy_files(directory, plan):
+    """
+    Write one ``<table>.copy`` file per table and a ``load.psql`` script.
+
+    ``psql "$DB_URL" -f load.psql`` from that directory loads them, one
+    transaction per table.
+
+    Args:
+        directory (str): Output directory, created if missing
+        plan (BootstrapPlan): Rows to write
+    """
+    os.makedirs(directory, exist_ok=True)
+    script = []
+    for table in TABLES:
+        with open(os.path.join(directory, f"{table.name}.copy"), "w", encoding="utf-8") as f:
+            f.writelines(plan.copy_lines(table))
+        # psql's \copy reads the file client-side, so the server needs no access to it.
+        script += ["BEGIN;", table.copy_sql(f"'{table.name}.copy'", command="\\copy"), "COMMIT;"]
+        print(f"{table.name}: {len(plan.rows[table.name])} rows written.")
+    with open(os.path.join(directory, "load.psql"), "w", encoding="utf-8") as f:
+        f.write("\n".join(script) + "\n")
@@ -0,0 +1,107 @@
+import json
+import os
+
+# Directory holding the bundled seed datasets, one JSON record per line.
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def iter_jsonl(path, start=0, end=None):
+    """
+    Yield the records of a JSONL file one at a time.
+
+    Only one line is held in memory, so sending can start on the first record
+    regardless of the file size. Blank lines are ignored. With a byte range
+    only the lines starting inside it are decoded; the ranges of
+    :func:`jsonl_part` split a file into parts without reading it twice.
+
+    Args:
+        path (str): Path to a file with one JSON object per line
+        start (int, optional): Byte offset; lines starting before it are skipped. Defaults to 0
+        end (int, optional): Byte offset; lines starting at or after it are skipped. Defaults to the end of the file
+
+    Yields:
+        dict: One record per non-empty line
+    """
+    with open(path, "rb") as f:
+        if start:
+            # Skip the rest of the line running into the range; it belongs to the previous one.
+            f.seek(start - 1)
+            f.readline()
+        offset = f.tell()
+        # Line numbers are only known when reading from the start.
+        line_no = 0 if offset == 0 else None
+        for line in f:
+            if end is not None and offset >= end:
+                return
+            where = f"{path}:{line_no + 1}" if line_no is not None else f"{path} at byte {offset}"
+            offset += len(line)
+            if line_no is not None:
+                line_no += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{where}: invalid JSON record: {e}") from e
+
+
+def jsonl_part(path, part, parts):
+    """Return the ``(start, end)`` byte range of part ``part`` of ``parts`` equal parts of a JSONL file."""
+    size = os.path.getsize(path)
+    return size * part // parts, size * (part + 1) // parts
+
+
+def iter_parquet(path, batch_size=10_000, part=None):
+    """
+    Yield the rows of a Parquet file as records, reading ``batch_size`` rows at a time. Needs pyarrow.
+
+    Args:
+        path (str): Path to a Parquet file, e.g. one written by ``python -m seed generate``
+        batch_size (int, optional): Rows decoded at a time. Defaults to 10000
+        part (tuple, optional): ``(part, parts)``: decode only that share of the file's row groups
+
+    Yields:
+        dict: One record per row
+    """
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as parquet:
+        row_groups = None
+        if part is not None:
+            groups = parquet.num_row_groups
+            row_groups = range(groups * part[0] // part[1], groups * (part[0] + 1) // part[1])
+            if not row_groups:
+                return
+        for batch in parquet.iter_batches(batch_size=batch_size, row_groups=row_groups):
+            yield from batch.to_pylist()
+
+
+def dataset_path(name, data_dir=None):
+    """Path of the dataset ``name`` (e.g. ``journal_2023``) in ``data_dir``, default the bundled ``seed/data``."""
+    return os.path.join(data_dir or DATA_DIR, f"{name}.jsonl")
+
+
+def find_dataset(name, data_dir=None):
+    """Path of ``name.jsonl``, else ``name.parquet``, in ``data_dir`` (default ``seed/data``), or None."""
+    path = dataset_path(name, data_dir)
+    for candidate in (path, path[: -len(".jsonl")] + ".parquet"):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def load_dataset(name, data_dir=None, part=None):
+    """
+    Stream the dataset ``name`` (JSONL or Parquet) from ``data_dir``, default the bundled ``seed/data``.
+
+    With ``part=(part, parts)`` only that part of the file is decoded: an equal
+    byte range of a JSONL file, or a share of a Parquet file's row groups.
+    The parts of a file hold every record exactly once.
+    """
+    path = find_dataset(name, data_dir)
+    if path is None:
+        raise FileNotFoundError(f"Dataset '{name}' not found at {dataset_path(name, data_dir)}")
+    if path.endswith(".parquet"):
+        return iter_parquet(path, part=part)
+    return iter_jsonl(path, *(jsonl_part(path, *part) if part else ()))
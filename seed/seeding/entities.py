@@ -0,0 +1,146 @@
+"""Built-in seed entities. Importing this module registers them."""
+import os
+
+from . import schemas
+from .datasets import find_dataset, load_dataset
+from .passwords import prehash_records
+from .registry import register
+from .roster import describe_user, iter_default_user_records, iter_teacher_records
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# /auth/register/bulk (admin only) takes passwords hashed client-side, so the API server skips bcrypt.
+REGISTER_BULK = dict(bulk_path="/auth/register/bulk", bulk_prepare=prehash_records, shard_key="empId")
+
+
+def _from_data_dir(name, dataset, data_dir, part=None):
+    """Records of ``dataset`` in ``data_dir``; none, with a message, when the directory has no such file."""
+    if find_dataset(dataset, data_dir) is None:
+        # `generate` writes no intraSports (nothing to learn from) and no defaultUsers.
+        print(f"{name}: no {dataset} dataset in {data_dir}, skipped.")
+        return []
+    return load_dataset(dataset, data_dir, part)
+
+
+@register("users", "/auth/register", describe=describe_user, schema=schemas.USER, dataset="users", **REGISTER_BULK)
+def users(options):
+    data_dir = getattr(options, "data_dir", None)
+    if data_dir and not options.users_file:
+        return _from_data_dir("users", "users", data_dir)
+    return iter_teacher_records(options.users_file or os.path.join(SEED_DIR, "teachers.csv"))
+
+
+@register(
+    "defaultUsers",
+    "/auth/register",
+    describe=describe_user,
+    schema=schemas.USER,
+    dataset="defaultUsers",
+    # Always through /auth/register: these are the first accounts, so no admin token exists yet for the bulk route.
+    shard_key="empId",
+)
+def default_users(options):
+    data_dir = getattr(options, "data_dir", None)
+    if data_dir and not options.default_users_file:
+        return _from_data_dir("defaultUsers", "defaultUsers", data_dir)
+    return iter_default_user_records(options.default_users_file or os.path.join(SEED_DIR, "default_users.xlsx"))
+
+
+# The /seed endpoints look up the owner and co-authors by name, so those users must be registered first.
+USERS = ("users", "defaultUsers")
+# The /seed routes strip the owner's name, or the ids the seeder resolved it to, before validating the rest.
+PUBLICATION_NAME_FIELDS = ("teacherAdminId", "teacherIds")
+ACTIVITY_NAME_FIELDS = ("userId", None)
+PUBLICATION_SEED_KEYS = ("name", "teacherAdminId")
+ACTIVITY_SEED_KEYS = ("name", "userId")
+
+
+def _dataset_loader(name, dataset):
+    # Also the entity's load_part: sharded runs pass (shard, shards) to decode only their part of the file.
+    def load(options, part=None):
+        data_dir = getattr(options, "data_dir", None)
+        return _from_data_dir(name, dataset, data_dir, part) if data_dir else load_dataset(dataset, part=part)
+
+    return load
+
+
+def _bundled(name, path, schema, dataset=None, depends_on=(), name_fields=None, shard_key=None):
+    # Every /seed route also has a /seed/bulk variant taking {"records": [...]}.
+    bulk_path = f"{path}/bulk" if path.endswith("/seed") else None
+    load = _dataset_loader(name, dataset or name)
+    register(
+        name,
+        path,
+        depends_on=depends_on,
+        schema=schema,
+        name_fields=name_fields,
+        bulk_path=bulk_path,
+        shard_key=shard_key,
+        dataset=dataset or name,
+        load_part=load,
+    )(load)
+
+
+_bundled(
+    "journal",
+    "/journal/seed",
+    schemas.JOURNAL.ignoring(*PUBLICATION_SEED_KEYS),
+    depends_on=USERS,
+    name_fields=PUBLICATION_NAME_FIELDS,
+    shard_key="title",
+)
+_bundled(
+    "conference",
+    "/conference/seed",
+    schemas.CONFERENCE.ignoring(*PUBLICATION_SEED_KEYS),
+    depends_on=USERS,
+    name_fields=PUBLICATION_NAME_FIELDS,
+    shard_key="paperTitle",
+)
+_bundled(
+    "journal2023",
+    "/journal/seed",
+    schemas.JOURNAL.ignoring(*PUBLICATION_SEED_KEYS),
+    "journal_2023",
+    depends_on=USERS,
+    name_fields=PUBLICATION_NAME_FIELDS,
+    shard_key="title",
+)
+_bundled(
+    "conference2023",
+    "/conference/seed",
+    schemas.CONFERENCE.ignoring(*PUBLICATION_SEED_KEYS),
+    "conference_2023",
+    depends_on=USERS,
+    name_fields=PUBLICATION_NAME_FIELDS,
+    shard_key="paperTitle",
+)
+_bundled(
+    "patent",
+    "/patent/seed",
+    schemas.PATENT.ignoring(*PUBLICATION_SEED_KEYS),
+    depends_on=USERS,
+    name_fields=PUBLICATION_NAME_FIELDS,
+    shard_key="patentNumber",
+)
+_bundled("studentEntranceExam", "/studentEntranceExam", schemas.STUDENT_ENTRANCE_EXAM, shard_key="registrationNumber")
+_bundled("studentHigherStudies", "/studentHigherStudies", schemas.STUDENT_HIGHER_STUDIES, shard_key="studentName")
+_bundled("interSports", "/interSports", schemas.INTER_SPORTS)
+_bundled("intraSports", "/intraSports", schemas.INTRA_SPORTS)
+_bundled(
+    "departmentAttended",
+    "/departmentAttendedActivity/seed",
+    schemas.DEPARTMENT_ATTENDED_ACTIVITY.ignoring(*ACTIVITY_SEED_KEYS),
+    depends_on=USERS,
+    name_fields=ACTIVITY_NAME_FIELDS,
+    shard_key="programTitle",
+)
+_bundled(
+    "departmentConducted",
+    "/departmentConductedActivity/seed",
+    schemas.DEPARTMENT_CONDUCTED_ACTIVITY.ignoring(*ACTIVITY_SEED_KEYS),
+    depends_on=USERS,
+    name_fields=ACTIVITY_NAME_FIELDS,
+    shard_key="nameOfProgram",
+)
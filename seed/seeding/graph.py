@@ -0,0 +1,105 @@
+import asyncio
+from itertools import islice
+
+from .checkpoint import record_key
+from .names import resolve_names
+from .registry import topological_order
+
+# Records pulled from a loader per executor call.
+LOAD_CHUNK = 1000
+
+
+async def load_in_executor(load, options, chunk=LOAD_CHUNK):
+    """
+    Yield the records of ``load(options)`` while every read happens in a thread.
+
+    Loaders return lazy iterables that parse spreadsheets or data files as they
+    are consumed, so calling ``load`` in an executor alone would leave the
+    parsing on the loop. Records are pulled ``chunk`` at a time instead, which
+    keeps memory bounded and lets other entities send meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    records = await loop.run_in_executor(None, lambda: iter(load(options)))
+    while True:
+        batch = await loop.run_in_executor(None, list, islice(records, chunk))
+        if not batch:
+            return
+        for record in batch:
+            yield record
+
+
+async def seed_graph(seeder, entities, base_url, options):
+    """
+    Seed ``entities`` as a dependency graph on the seeder's event loop.
+
+    Every entity starts as soon as all of its selected prerequisites have
+    finished, so independent branches (e.g. student records and users) run
+    in parallel while publications wait for users. Prerequisites that are not
+    selected are assumed to be seeded already.
+
+    Args:
+        seeder (Seeder): Seeder whose transport, throttle and checkpoint are shared
+        entities (list): Entities to seed
+        base_url (str): API base URL the entity paths are appended to
+        options (argparse.Namespace): Options passed to each entity loader. When it has a
+            ``name_index`` (SharedNameIndex), names are resolved to user ids client-side
+
+    Returns:
+        dict: Entity name to its SeedSummary, or to the exception that stopped it
+    """
+    loop = asyncio.get_running_loop()
+    tasks = {}
+
+    async def seed_entity(entity):
+        prerequisites = [tasks[name] for name in entity.depends_on if name in tasks]
+        results = await asyncio.gather(*prerequisites, return_exceptions=True)
+        for name, result in zip([n for n in entity.depends_on if n in tasks], results):
+            if isinstance(result, BaseException):
+                raise RuntimeError(f"prerequisite '{name}' did not complete") from result
+            problems = result.failed + result.errors + result.invalid
+            if problems:
+                print(f"Warning: {entity.name} starts although {name} had {problems} failed records.")
+        print(f"Seeding {entity.name}...")
+        url = entity.url(base_url)
+        index = None
+        name_index = getattr(options, "name_index", None)
+        if name_index is not None and entity.name_fields:
+            index = await loop.run_in_executor(None, name_index.get)
+
+        def load(options):
+            # Keys are taken from the records as loaded, before names are resolved, so a resumed
+            # run matches its checkpoint and manifest with or without --resolve-names.
+            for record in entity.load(options):
+                key = record_key(url, record)
+                yield key, record if index is None else resolve_names(record, index, *entity.name_fields)
+
+        # Loaders may parse spreadsheets; keep that off the loop so other branches keep sending.
+        records = load_in_executor(load, options)
+        summary = await seeder.send_async(
+            url,
+            records,
+            describe=entity.describe,
+            schema=entity.schema,
+            bulk_url=entity.bulk_url(base_url),
+            batch_size=getattr(options, "batch_size", None),
+            prepare_batch=entity.bulk_prepare,
+            dataset=entity.name,
+            keyed=True,
+        )
+        print(
+            f"{entity.name}: {summary.sent} sent, {summary.failed} failed, "
+            f"{summary.errors} errors, {summary.invalid} invalid."
+        )
+        return summary
+
+    for entity in topological_order(entities):
+        tasks[entity.name] = asyncio.create_task(seed_entity(entity))
+
+    results = {}
+    for name, task in tasks.items():
+        try:
+            results[name] = await task
+        except Exception as e:
+            print(f"Error: {name} was not seeded: {e}")
+            results[name] = e
+    return results
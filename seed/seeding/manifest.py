@@ -0,0 +1,69 @@
+import json
+import os
+
+
+class Manifest:
+    """
+    Per-dataset set of hashes of the records already seeded.
+
+    Used for incremental seeding: a dataset is compared against the hashes
+    stored for it and only new or modified records are sent. Entries are
+    keyed by dataset name and endpoint, since several datasets can post to
+    the same endpoint (``journal`` and ``journal2023`` both go to
+    ``/journal/seed``) and must not replace each other's hashes. After
+    a run without failures the entry is replaced by the hashes of the whole
+    dataset; after a partial run it keeps only the hashes known to be on the
+    server, so a rerun resends just the records that failed. The file is
+    rewritten atomically.
+
+    Args:
+        path (str): Location of the manifest file. Created on first save
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._datasets = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._datasets = {url: set(keys) for url, keys in json.load(f).get("datasets", {}).items()}
+
+    @staticmethod
+    def entry(url, dataset=None):
+        """Key of the entry for ``dataset`` posted to ``url``; just the URL for unnamed datasets."""
+        return f"{dataset} {url}" if dataset else url
+
+    def known(self, url, dataset=None):
+        """Hashes recorded for ``dataset`` posted to ``url`` by the last successful run."""
+        keys = self._datasets.get(self.entry(url, dataset))
+        if keys is None and dataset:
+            # Manifests written before entries were keyed by dataset hold one entry per URL.
+            keys = self._datasets.get(url)
+        return keys if keys is not None else set()
+
+    def entries(self):
+        """Entry key -> hashes, for every recorded dataset."""
+        return {entry: set(keys) for entry, keys in self._datasets.items()}
+
+    def update(self, url, keys, dataset=None):
+        """Replace the hashes for ``dataset`` posted to ``url`` with ``keys`` and save the manifest."""
+        self.update_entries({self.entry(url, dataset): keys})
+
+    def update_entries(self, entries):
+        """Replace the hashes of every entry in ``entries`` (entry key -> hashes) and save the manifest once."""
+        for entry, keys in entries.items():
+            self._datasets[entry] = set(keys)
+        self.save()
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"datasets": {url: sorted(keys) for url, keys in self._datasets.items()}}, f)
+        os.replace(tmp_path, self.path)
+
+
+def open_manifest(path=None):
+    """Open the manifest at ``path`` or SEED_MANIFEST; returns None when neither is set."""
+    path = path or os.environ.get("SEED_MANIFEST")
+    return Manifest(path) if path else None
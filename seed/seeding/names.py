@@ -0,0 +1,198 @@
+import csv
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+HONORIFICS = frozenset({"dr", "prof", "mr", "mrs", "ms", "miss", "sri", "smt"})
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def name_tokens(name):
+    """Lower-case, accent-free word tokens of ``name`` without honorifics or punctuation."""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii").lower()
+    return [token for token in _NON_WORD.split(text) if token and token not in HONORIFICS]
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    In-memory index resolving faculty names to user ids.
+
+    Built once per run from the registered users. A name is normalized to its
+    tokens (lower case, no honorifics or punctuation) and looked up in three
+    steps: exact token match, then every query token contained in a
+    registered name (what the backend's ``ilike '%name%'`` matches), then
+    trigram similarity for misspellings. A lookup is answered only when a
+    single user clearly wins; otherwise it returns None rather than guessing.
+
+    Args:
+        users (iterable): ``(id, name)`` pairs
+        min_similarity (float, optional): Lowest trigram Jaccard score accepted. Defaults to 0.6
+    """
+
+    def __init__(self, users, min_similarity=0.6):
+        self.min_similarity = min_similarity
+        self._ids = []
+        self._keys = []
+        self._token_sets = []
+        self._grams = []
+        self._by_key = defaultdict(set)
+        self._by_token = defaultdict(set)
+        self._by_gram = defaultdict(set)
+        self._cache = {}
+        for user_id, name in users:
+            tokens = name_tokens(name)
+            if not tokens:
+                continue
+            index = len(self._ids)
+            key = " ".join(tokens)
+            grams = _trigrams(key)
+            self._ids.append(user_id)
+            self._keys.append(key)
+            self._token_sets.append(frozenset(tokens))
+            self._grams.append(grams)
+            self._by_key[key].add(index)
+            for token in tokens:
+                self._by_token[token].add(index)
+            for gram in grams:
+                self._by_gram[gram].add(index)
+
+    def __len__(self):
+        return len(self._ids)
+
+    @classmethod
+    def from_csv(cls, *paths, **kwargs):
+        """Build an index from user exports with ``id`` and ``name`` columns (e.g. seed/teachers.csv)."""
+
+        def rows():
+            for path in paths:
+                with open(path, newline="", encoding="utf-8") as f:
+                    for row in csv.DictReader(f):
+                        if row.get("id") and row.get("name"):
+                            yield row["id"], row["name"]
+
+        return cls(rows(), **kwargs)
+
+    def _unique(self, indexes):
+        ids = {self._ids[i] for i in indexes}
+        return ids.pop() if len(ids) == 1 else None
+
+    def resolve(self, name):
+        """Return the user id for ``name``, or None when it is unknown or ambiguous."""
+        if name in self._cache:
+            return self._cache[name]
+        self._cache[name] = user_id = self._resolve(name)
+        return user_id
+
+    def _resolve(self, name):
+        tokens = name_tokens(name)
+        if not tokens:
+            return None
+        key = " ".join(tokens)
+        if key in self._by_key:
+            return self._unique(self._by_key[key])
+
+        # Every token present in one registered name, e.g. "Suja C M" vs "Dr. Suja C.M."
+        containing = set.intersection(*(self._by_token.get(token, set()) for token in tokens))
+        if containing:
+            return self._unique(containing)
+
+        grams = _trigrams(key)
+        candidates = set()
+        for gram in grams:
+            candidates |= self._by_gram.get(gram, set())
+        scored = sorted(
+            ((len(grams & self._grams[i]) / len(grams | self._grams[i]), i) for i in candidates),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < self.min_similarity:
+            return None
+        best_score, best = scored[0]
+        if len(scored) > 1 and scored[1][0] == best_score and self._ids[scored[1][1]] != self._ids[best]:
+            return None
+        return self._ids[best]
+
+    def resolve_record(self, record, owner_field, co_author_field=None):
+        """
+        Return a copy of ``record`` with the owner's and co-authors' names replaced by user ids.
+
+        The owner's ``name`` is kept (the backend ignores it) and ``owner_field``
+        is added. Returns None if any name cannot be resolved, in which case the
+        record should be sent unchanged for the backend to resolve.
+        """
+        owner = self.resolve(record.get("name", ""))
+        if owner is None:
+            return None
+        resolved = dict(record, **{owner_field: owner})
+        if co_author_field:
+            ids = [self.resolve(name) for name in record.get(co_author_field, [])]
+            if any(user_id is None for user_id in ids):
+                return None
+            resolved[co_author_field] = ids
+        return resolved
+
+    @classmethod
+    def from_api(cls, base_url, cookies=None, **kwargs):
+        """Build an index from the registered users returned by ``GET /user/multiselect``."""
+        import requests
+
+        response = requests.get(base_url.rstrip("/") + "/user/multiselect", cookies=cookies)
+        response.raise_for_status()
+        return cls(((user["id"], user["name"]) for user in response.json()), **kwargs)
+
+
+class SharedNameIndex:
+    """
+    Builds one :class:`NameIndex` per run, on first use, and shares it across entities.
+
+    Building is deferred so that, when users are seeded in the same run, the
+    index is fetched only after they are registered.
+
+    Args:
+        sources (list): CSV exports with ``id`` and ``name`` columns. When empty the
+            registered users are fetched from the API at ``base_url``
+        base_url (str, optional): API base URL
+        cookies (dict, optional): Cookies for the authenticated ``/user`` routes
+    """
+
+    def __init__(self, sources=(), base_url=None, cookies=None):
+        self.sources = list(sources)
+        self.base_url = base_url
+        self.cookies = cookies
+        self._index = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._index is None:
+                if self.sources:
+                    self._index = NameIndex.from_csv(*self.sources)
+                else:
+                    self._index = NameIndex.from_api(self.base_url, cookies=self.cookies)
+                print(f"Name index built with {len(self._index)} users.")
+            return self._index
+
+
+def resolve_names(record, index, owner_field, co_author_field=None):
+    """
+    Return ``record`` with names replaced by user ids where every name resolves.
+
+    A record with an unknown or ambiguous name is returned unchanged so the
+    backend falls back to its own name lookup.
+    """
+    resolved = index.resolve_record(record, owner_field, co_author_field)
+    if resolved is None:
+        print(f"Could not resolve every name of a record by '{record.get('name')}'; the backend will look them up.")
+        return record
+    return resolved
+
+
+def resolve_records(records, index, owner_field, co_author_field=None):
+    """Yield ``records`` passed through :func:`resolve_names`."""
+    for record in records:
+        yield resolve_names(record, index, owner_field, co_author_field)
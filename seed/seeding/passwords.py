@@ -0,0 +1,74 @@
+"""Password hashing compatible with the backend's ``bcrypt.hash(password, 10)``."""
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+BCRYPT_ROUNDS = 10
+BCRYPT_HASH = re.compile(r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def hash_password(password, rounds=BCRYPT_ROUNDS):
+    """
+    Hash one password the way /auth/register does before storing it.
+
+    Values that already are bcrypt hashes (e.g. the ``password`` column of a
+    user export) are returned unchanged.
+
+    Args:
+        password (str): Plain text password
+        rounds (int, optional): bcrypt cost factor. Defaults to 10, as in the backend
+
+    Returns:
+        str: A ``$2b$<rounds>$...`` hash accepted by ``bcrypt.compare``
+    """
+    # bcrypt is only needed when passwords are hashed client-side.
+    import bcrypt
+
+    password = str(password)
+    if BCRYPT_HASH.match(password):
+        return password
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def _shared_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the seeder has transport threads running by the time it hashes.
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def hash_passwords(passwords, executor=None):
+    """
+    Hash many passwords across all cores.
+
+    bcrypt at cost 10 takes tens of milliseconds per password, so hashing a
+    roster in one thread dominates a seeding run. The work is spread over a
+    process pool shared by every call in this process.
+
+    Args:
+        passwords (iterable): Plain text passwords
+        executor (Executor, optional): Pool to use instead of the shared one
+
+    Returns:
+        list: Hashes in the order of ``passwords``
+    """
+    passwords = list(passwords)
+    if len(passwords) < 2:
+        return [hash_password(password) for password in passwords]
+    executor = executor or _shared_pool()
+    chunksize = max(1, len(passwords) // ((os.cpu_count() or 1) * 4))
+    return list(executor.map(hash_password, passwords, chunksize=chunksize))
+
+
+def prehash_records(records):
+    """Return copies of user records with their ``password`` replaced by its bcrypt hash."""
+    records = list(records)
+    hashes = hash_passwords(record["password"] for record in records)
+    return [dict(record, password=password) for record, password in zip(records, hashes)]
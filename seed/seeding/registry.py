@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Entity:
+    """
+    One seedable entity: where its records come from and where they are posted.
+
+    Args:
+        name (str): Name used on the command line, e.g. ``journal``
+        path (str): Endpoint path under the API base URL, e.g. ``/journal/seed``
+        load (callable): Called with the parsed CLI options; returns an iterable of records
+        describe (callable, optional): Maps a record to a label used in status lines
+        depends_on (tuple, optional): Entities whose records must exist before this one is seeded
+        schema (Schema, optional): Client-side mirror of the endpoint's Joi schema
+        name_fields (tuple, optional): ``(owner_field, co_author_field)`` the endpoint accepts
+            instead of names, used when the seeder resolves names to user ids itself
+        bulk_path (str, optional): Endpoint path accepting ``{"records": [...]}`` batches
+        bulk_prepare (callable, optional): Maps a batch of records to the bulk endpoint's payload
+        shard_key (str, optional): Record field that picks a record's shard in sharded runs.
+            Defaults to the whole record
+        dataset (str, optional): Name of the dataset file the loader reads from ``--data-dir``, e.g.
+            ``journal_2023``
+        load_part (callable, optional): Called with the parsed CLI options and ``(shard, shards)``; returns
+            that shard of the records, split by position in the dataset file so the rest is never decoded.
+            Sharded runs filter ``load`` by ``shard_key`` for entities without one
+    """
+
+    name: str
+    path: str
+    load: object
+    describe: object = None
+    depends_on: tuple = ()
+    schema: object = None
+    name_fields: tuple = None
+    bulk_path: str = None
+    bulk_prepare: object = None
+    shard_key: str = None
+    dataset: str = None
+    load_part: object = None
+
+    def url(self, base_url):
+        return base_url.rstrip("/") + self.path
+
+    def bulk_url(self, base_url):
+        return base_url.rstrip("/") + self.bulk_path if self.bulk_path else None
+
+
+ENTITIES = {}
+
+
+def register(
+    name,
+    path,
+    describe=None,
+    depends_on=(),
+    schema=None,
+    name_fields=None,
+    bulk_path=None,
+    bulk_prepare=None,
+    shard_key=None,
+    dataset=None,
+    load_part=None,
+):
+    """Decorator registering a record loader as the entity ``name`` posted to ``path``."""
+
+    def decorator(load):
+        if name in ENTITIES:
+            raise ValueError(f"Entity '{name}' is already registered")
+        ENTITIES[name] = Entity(
+            name=name,
+            path=path,
+            load=load,
+            describe=describe,
+            depends_on=tuple(depends_on),
+            schema=schema,
+            name_fields=name_fields,
+            bulk_path=bulk_path,
+            bulk_prepare=bulk_prepare,
+            shard_key=shard_key,
+            dataset=dataset,
+            load_part=load_part,
+        )
+        return load
+
+    return decorator
+
+
+def get_entity(name):
+    try:
+        return ENTITIES[name]
+    except KeyError:
+        raise KeyError(f"Unknown entity '{name}'. Known entities: {', '.join(ENTITIES)}") from None
+
+
+def with_dependencies(entities):
+    """Return ``entities`` plus every registered entity they depend on, transitively."""
+    selected = {}
+
+    def add(entity):
+        if entity.name in selected:
+            return
+        selected[entity.name] = entity
+        for name in entity.depends_on:
+            add(get_entity(name))
+
+    for entity in entities:
+        add(entity)
+    return list(selected.values())
+
+
+def topological_order(entities):
+    """
+    Order ``entities`` so every entity comes after the ones it depends on.
+
+    Dependencies that are not part of ``entities`` are treated as already
+    seeded. Raises ValueError on a dependency cycle.
+    """
+    by_name = {entity.name: entity for entity in entities}
+    ordered = []
+    state = {}
+
+    def visit(entity, path):
+        if state.get(entity.name) == "done":
+            return
+        if state.get(entity.name) == "visiting":
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [entity.name])}")
+        state[entity.name] = "visiting"
+        for name in entity.depends_on:
+            if name in by_name:
+                visit(by_name[name], path + [entity.name])
+        state[entity.name] = "done"
+        ordered.append(entity)
+
+    for entity in entities:
+        visit(entity, [])
+    return ordered
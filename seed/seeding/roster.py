@@ -0,0 +1,204 @@
+import sys
+
+from .workbook import Workbook
+
+PROFILE_IMG = 'https://static.vecteezy.com/system/resources/previews/005/129/844/non_2x/profile-user-icon-isolated-on-white-background-eps10-free-vector.jpg'
+
+# Fields sent to /auth/register for every user
+TEACHER_FIELDS = ['empId','name', 'password', 'campus', 'qualification', 'expertise', 'panNo', 'phno', 'designation','dept',
+                  'dateofJoining', 'totalExpBfrJoin', 'googleScholarId', 'sId', 'oId','role','accessTo','profileImg','centre_name']
+DEFAULT_USER_FIELDS = ['empId','name', 'password', 'campus', 'qualification', 'expertise', 'panNo', 'phno', 'designation','dept',
+                       'dateofJoining', 'totalExpBfrJoin', 'googleScholarId','role','accessTo','sId', 'oId', 'profileImg','centre_name']
+
+
+# Rows read, transformed and handed to the sender at a time; memory stays bounded by this, not the roster size.
+ROSTER_CHUNK_SIZE = 1000
+
+
+def _read_error(e):
+    print(f"Error reading Excel file: {e}")
+    sys.exit(1)
+
+
+def _excel_chunks(excel_file, chunksize):
+    """Yield DataFrames of up to ``chunksize`` rows from the first sheet, read row by row."""
+    import pandas as pd
+
+    try:
+        workbook = Workbook(excel_file)
+    except Exception as e:
+        _read_error(e)
+    with workbook:
+        rows = (row for row in workbook.iter_rows() if any(value is not None for value in row))
+        header = next(rows, None)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunksize:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+
+
+# Columns every teacher gets regardless of the roster
+TEACHER_CONSTANTS = {
+    'dept': 'CSE',
+    'campus': 'EC',
+    'qualification': 'to_be_filled',
+    'expertise': 'to_be_filled',
+    'totalExpBfrJoin': '5',
+    'googleScholarId': '0001',
+    'sId': '0001',
+    'oId': '0001',
+    'profileImg': PROFILE_IMG,
+    'centre_name': 'to_be_filled',
+}
+DEFAULT_USER_CONSTANTS = {
+    'dept': "Computer Science and Engineering",
+    'profileImg': PROFILE_IMG,
+    'centre_name': "to_be_filled",
+}
+
+
+def _text(column):
+    # Missing cells become None (JSON null) instead of NaN, which is not valid JSON.
+    return column.astype(str).where(column.notna(), None)
+
+
+def _phone(column):
+    import pandas as pd
+
+    # A phone column with blanks is read as floats; don't send "9876543210.0".
+    if pd.api.types.is_float_dtype(column):
+        column = column.round().astype('Int64')
+    return column.astype(str).where(column.notna(), '')
+
+
+def _password_from_emp_id(emp_ids):
+    # Everything before the first "@"; one regex pass is faster than .str.split(...).str[0].
+    return emp_ids.str.replace('@.*', '', regex=True)
+
+
+def _iso_dates(column, date_format):
+    import pandas as pd
+
+    import numpy as np
+
+    dates = pd.to_datetime(column, format=date_format, dayfirst=True, errors='coerce')
+    dates = dates.fillna(pd.Timestamp.today().normalize())
+    # Same text as Timestamp.isoformat(), e.g. 2023-11-05T00:00:00. numpy formats the whole
+    # array at once, an order of magnitude faster than dt.strftime('%Y-%m-%dT%H:%M:%S').
+    iso = np.datetime_as_string(dates.to_numpy(dtype='datetime64[s]'), unit='s')
+    return pd.Series(iso, index=column.index, dtype=object)
+
+
+def _guess_date_format(text):
+    """strptime format of the roster date ``text``, reading ambiguous dates day first."""
+    import warnings
+
+    from pandas.tseries.api import guess_datetime_format
+
+    with warnings.catch_warnings():
+        # pandas warns that dayfirst does not apply when the date is year first (2023-11-05);
+        # the guess is still right, and day first only matters for dd/mm vs mm/dd.
+        warnings.simplefilter('ignore', UserWarning)
+        return guess_datetime_format(text, dayfirst=True)
+
+
+def transform_roster(data, fields, constants=None, derive_passwords=False, parse_dates=False, date_format=None):
+    """
+    Shape a chunk of roster rows into /auth/register payload columns.
+
+    Every column is built with vectorized operations (pandas ``.str``
+    accessors, numpy ``datetime_as_string`` for dates); nothing runs per row
+    in Python.
+
+    Args:
+        data (DataFrame): Roster rows as read from the sheet
+        fields (list): Output columns, e.g. TEACHER_FIELDS
+        constants (dict, optional): Columns set to the same value for every row
+        derive_passwords (bool, optional): Password is the part of ``empId`` before ``@``
+        parse_dates (bool, optional): Parse ``dateofJoining`` (day first, today when missing) into ISO timestamps
+        date_format (str, optional): strptime format of ``dateofJoining``; guessed when None
+
+    Returns:
+        DataFrame: One column per field, in order
+    """
+    import pandas as pd
+
+    constants = constants or {}
+    columns = {}
+    for field in fields:
+        if field in constants:
+            columns[field] = pd.Series(constants[field], index=data.index, dtype=object)
+        elif field == 'password' and derive_passwords:
+            columns[field] = _password_from_emp_id(data['empId'])
+        elif field == 'phno':
+            columns[field] = _phone(data[field])
+        elif field == 'dateofJoining' and parse_dates:
+            columns[field] = _iso_dates(data[field], date_format)
+        else:
+            columns[field] = _text(data[field])
+    return pd.DataFrame(columns, index=data.index)
+
+
+def _teacher_chunk(data, date_format):
+    return transform_roster(
+        data, TEACHER_FIELDS, TEACHER_CONSTANTS, derive_passwords=True, parse_dates=True, date_format=date_format
+    )
+
+
+def _default_user_chunk(data):
+    return transform_roster(data, DEFAULT_USER_FIELDS, DEFAULT_USER_CONSTANTS)
+
+
+def iter_teacher_records(csv_file, chunksize=ROSTER_CHUNK_SIZE):
+    """
+    Stream the teacher roster CSV as /auth/register payloads.
+
+    The CSV is read ``chunksize`` rows at a time and each chunk is shaped and
+    yielded before the next one is read.
+
+    Args:
+        csv_file (str): Path to the roster, e.g. seed/teachers.csv
+        chunksize (int, optional): Rows per chunk. Defaults to ROSTER_CHUNK_SIZE
+
+    Yields:
+        dict: One record per teacher with the fields in TEACHER_FIELDS
+    """
+    # pandas is imported here so the seeders that never parse spreadsheets don't pay for it.
+    import pandas as pd
+
+    try:
+        chunks = pd.read_csv(csv_file, chunksize=chunksize)
+    except Exception as e:
+        _read_error(e)
+    # pandas guesses the date format from the first date of the column; guess it once
+    # for the whole file so every chunk parses dates the same way.
+    date_format = None
+    with chunks:
+        for data in chunks:
+            if date_format is None:
+                first = data['dateofJoining'].dropna()
+                date_format = _guess_date_format(str(first.iloc[0])) if len(first) else None
+            yield from _teacher_chunk(data, date_format).to_dict(orient='records')
+
+
+def iter_default_user_records(excel_file, chunksize=ROSTER_CHUNK_SIZE):
+    """
+    Stream the default users workbook as /auth/register payloads.
+
+    Args:
+        excel_file (str): Path to the workbook, e.g. seed/default_users.xlsx
+        chunksize (int, optional): Rows per chunk. Defaults to ROSTER_CHUNK_SIZE
+
+    Yields:
+        dict: One record per user with the fields in DEFAULT_USER_FIELDS
+    """
+    for data in _excel_chunks(excel_file, chunksize):
+        yield from _default_user_chunk(data).to_dict(orient='records')
+
+
+def describe_user(record):
+    return f"user {record['empId']}"
@@ -0,0 +1,157 @@
+"""Python mirrors of the Joi schemas in backend_new/src/routes/*/schema.ts. Keep them in sync."""
+from .validation import Array, Boolean, Date, Number, Schema, String
+
+# types/shared.ts
+CAMPUS = ('EC', 'RR', 'HN')
+DEPARTMENTS = ('ECE', 'CSE', 'Science & Humanities', 'Commerce & Management', 'Pharmaceutical Sciences')
+
+# routes/auth/schema.ts
+USER = Schema({
+    'empId': String(required=True),
+    'name': String(required=True),
+    'password': String(required=True),
+    'phno': String(required=True),
+    'dept': String(valid=DEPARTMENTS, required=True),
+    'campus': String(valid=CAMPUS, required=True),
+    'panNo': String(required=True),
+    'qualification': String(required=True),
+    'designation': String(required=True),
+    'expertise': String(required=True),
+    'dateofJoining': Date(required=True),
+    'totalExpBfrJoin': String(required=True),
+    'googleScholarId': String(required=True),
+    'role': String(),
+    'accessTo': String(),
+    'sId': String(required=True),
+    'oId': String(required=True),
+    'profileImg': String(),
+    'centre_name': String(required=True),
+})
+
+# routes/journal/schema.ts
+JOURNAL = Schema({
+    'title': String(required=True),
+    'teacherIds': Array(String()),
+    'journalName': String(required=True),
+    'month': String(required=True),
+    'year': String(required=True),
+    'volumeNo': String(required=True),
+    'issueNo': String(required=True),
+    'issn': String(required=True),
+    'websiteLink': String(allow_empty=True),
+    'articleLink': String(allow_empty=True),
+    'status': String(allow_empty=True),
+    'isUGC': Boolean(),
+    'isScopus': Boolean(),
+    'isWOS': Boolean(),
+    'qNo': String(required=True),
+    'impactFactor': String(),
+    'isCapstone': Boolean(),
+    'isAffiliating': Boolean(),
+    'pageNumber': Number(integer=True),
+    'abstract': String(required=True),
+    'keywords': Array(String()),
+    'domain': String(required=True),
+})
+
+# routes/conference/schema.ts
+CONFERENCE = Schema({
+    'teacherIds': Array(String()),
+    'totalAuthors': Number(),
+    'bookTitle': String(required=True),
+    'paperTitle': String(required=True),
+    'proceedings_conference_title': String(required=True),
+    'volumeNo': String(required=True),
+    'issueNo': String(required=True),
+    'year': String(required=True),
+    'pageNumber': Number(integer=True),
+    'status': String(allow_empty=True),
+    'issn': String(required=True),
+    'is_affiliating_institution_same': Boolean(),
+    'publisherName': String(required=True),
+    'impactFactor': String(required=True),
+    'core': String(required=True),
+    'link_of_paper': String(allow_empty=True),
+    'isCapstone': Boolean(),
+    'abstract': String(required=True),
+    'keywords': Array(String()),
+    'domain': String(required=True),
+})
+
+# routes/patent/schema.ts
+PATENT = Schema({
+    'teacherIds': Array(String()),
+    'patentNumber': String(required=True),
+    'patentTitle': String(required=True),
+    'isCapstone': Boolean(),
+    'status': String(allow_empty=True),
+    'year': String(required=True),
+    'documentLink': String(uri=True, required=True),
+})
+
+# routes/studentEntranceExam/schema.ts
+STUDENT_ENTRANCE_EXAM = Schema({
+    'year': String(required=True),
+    'registrationNumber': String(required=True),
+    'studentName': String(required=True),
+    'isNET': Boolean(),
+    'isSLET': Boolean(),
+    'isGATE': Boolean(),
+    'isGMAT': Boolean(),
+    'isCAT': Boolean(),
+    'isGRE': Boolean(),
+    'isJAM': Boolean(),
+    'isIELTS': Boolean(),
+    'isTOEFL': Boolean(),
+    'documentLink': String(allow_empty=True),
+})
+
+# routes/studentHigherStudies/schema.ts
+STUDENT_HIGHER_STUDIES = Schema({
+    'studentName': String(required=True),
+    'programGraduatedFrom': String(required=True),
+    'institutionAdmittedTo': String(required=True),
+    'programmeAdmittedTo': String(required=True),
+    'documentLink': String(allow_empty=True),
+    'year': String(required=True),
+})
+
+# routes/interSports/schema.ts
+INTER_SPORTS = Schema({
+    'nameOfStudent': String(required=True),
+    'nameOfEvent': String(required=True),
+    'link': String(required=True),
+    'nameOfUniv': String(required=True),
+    'yearOfEvent': String(required=True),
+    'teamOrIndi': String(required=True),
+    'level': String(required=True),
+    'nameOfAward': String(required=True),
+})
+
+# routes/intraSports/schema.ts
+INTRA_SPORTS = Schema({
+    'event': String(required=True),
+    'startDate': Date(required=True),
+    'endDate': Date(required=True),
+    'link': String(required=True),
+    'yearOfEvent': String(required=True),
+})
+
+# routes/departmentAttendedActivity/schema.ts
+DEPARTMENT_ATTENDED_ACTIVITY = Schema({
+    'programTitle': String(required=True),
+    'durationStartDate': Date(required=True),
+    'durationEndDate': Date(required=True),
+    'documentLink': String(allow_empty=True),
+    'year': String(required=True),
+})
+
+# routes/departmentConductedActivity/schema.ts
+DEPARTMENT_CONDUCTED_ACTIVITY = Schema({
+    'nameOfProgram': String(required=True),
+    'noOfParticipants': Number(integer=True, required=True),
+    'durationStartDate': Date(required=True),
+    'durationEndDate': Date(required=True),
+    'documentLink': String(allow_empty=True),
+    'year': String(required=True),
+})
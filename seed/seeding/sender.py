@@ -0,0 +1,382 @@
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+
+from .checkpoint import open_checkpoint, record_key
+from .manifest import open_manifest
+from .throttle import RateLimitThrottle, backoff_delay
+from .transport import RequestTimeout, Response, make_transport
+
+# Number of requests kept in flight at once. Override with SEED_CONCURRENCY.
+DEFAULT_CONCURRENCY = 8
+# Records per request the /seed/bulk endpoints accept (MAX_BULK_RECORDS in backend_new/src/utils/seed-bulk.ts).
+MAX_BULK_RECORDS = 500
+# Times one record is resent after a 429 or a timeout before it is counted as an error. Override with SEED_MAX_RETRIES.
+DEFAULT_MAX_RETRIES = 8
+
+
+def default_concurrency():
+    """Return the in-flight request limit from SEED_CONCURRENCY (or the default)."""
+    try:
+        return max(1, int(os.environ.get("SEED_CONCURRENCY", DEFAULT_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_CONCURRENCY
+
+
+def default_max_retries():
+    """Return the retry limit per record from SEED_MAX_RETRIES (or the default)."""
+    try:
+        return max(0, int(os.environ.get("SEED_MAX_RETRIES", DEFAULT_MAX_RETRIES)))
+    except ValueError:
+        return DEFAULT_MAX_RETRIES
+
+
+class RateLimited(Exception):
+    """A record was still answered with 429 after the retry limit."""
+
+
+@dataclass
+class SeedSummary:
+    """Counts collected while sending one dataset."""
+
+    sent: int = 0
+    failed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    timed_out: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    invalid: int = 0
+
+    @property
+    def total(self):
+        return self.sent + self.failed + self.errors
+
+
+def _report(summary, record, describe, response=None, error=None):
+    subject = f" {describe(record)}" if describe else ""
+    if error is not None:
+        summary.errors += 1
+        print(f"Error{subject}: {error}")
+    elif response.status_code == 201:
+        summary.sent += 1
+        print(f"Seeded{subject} successfully.")
+    else:
+        summary.failed += 1
+        print(f"Failed{subject}: {response.text}")
+
+
+async def _post_until_accepted(url, record, transport, throttle, summary, max_retries=None):
+    # A 429 waits for the server window to reset and resends; without a reset time, and after a
+    # timeout, back off exponentially. Give up after max_retries so a stuck server cannot hang the run.
+    max_retries = default_max_retries() if max_retries is None else max_retries
+    attempt = 0
+    while True:
+        await throttle.acquire()
+        try:
+            response = await transport.post_json(url, record)
+        except RequestTimeout as e:
+            summary.timed_out += 1
+            attempt += 1
+            if attempt > max_retries:
+                raise
+            wait = backoff_delay(attempt)
+            print(f"Timed out ({e}), retrying in {wait:.1f}s.")
+            await asyncio.sleep(wait)
+            continue
+        throttle.update(response)
+        if response.status_code != 429:
+            return response
+        summary.rate_limited += 1
+        attempt += 1
+        if attempt > max_retries:
+            raise RateLimited(f"still rate limited after {max_retries} retries")
+        wait = throttle.delay()
+        if wait:
+            print(f"Rate limited, retrying in {wait:.1f}s.")
+        else:
+            wait = backoff_delay(attempt)
+            print(f"Rate limited without a reset time, retrying in {wait:.1f}s.")
+            await asyncio.sleep(wait)
+
+
+async def _iterate(records):
+    if hasattr(records, "__aiter__"):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
+
+
+async def send_records(
+    url,
+    records,
+    transport,
+    concurrency=None,
+    describe=None,
+    throttle=None,
+    checkpoint=None,
+    manifest=None,
+    schema=None,
+    bulk_url=None,
+    batch_size=None,
+    prepare_batch=None,
+    dataset=None,
+    keyed=False,
+):
+    """
+    POST every record to ``url`` keeping up to ``concurrency`` requests in flight.
+
+    Records are pulled lazily from ``records`` so generators are never fully
+    materialized; at most ``2 * concurrency`` records wait in the queue.
+    Requests are paced by the backend's RateLimit-* headers and records that
+    get a 429 are retried after the window resets (or an exponential backoff
+    when the server gives no reset time), up to SEED_MAX_RETRIES times;
+    requests that time out are retried the same way.
+    With a checkpoint, records acknowledged by an earlier run are skipped
+    and every new 201 is logged as soon as it arrives. With a manifest only
+    records that are new or changed since the last successful run are sent.
+    With ``bulk_url`` and ``batch_size``, records are packed ``batch_size`` per
+    request as ``{"records": [...]}`` and the per-record statuses of the
+    response are reported as if each record had been sent on its own; a record
+    the response has no result for counts as an error.
+
+    Args:
+        url (str): Endpoint the records are posted to
+        records (iterable or async iterable): JSON-serializable dicts
+        transport (Transport): Pooled HTTP client the requests go through
+        concurrency (int, optional): In-flight request limit. Defaults to SEED_CONCURRENCY or 8
+        describe (callable, optional): Maps a record to a label used in status lines
+        throttle (RateLimitThrottle, optional): Shared rate-limit state. A new one is used if omitted
+        checkpoint (Checkpoint, optional): Log of acknowledged records; records found in it are skipped
+        manifest (Manifest, optional): Hashes from the last successful run; only new or changed records are sent
+        schema (Schema, optional): Client-side validation; invalid records are reported and never sent
+        bulk_url (str, optional): ``/seed/bulk`` endpoint accepting batches of records
+        batch_size (int, optional): Records per bulk request; batching is used only when this and bulk_url are set
+        prepare_batch (callable, optional): Maps the records of a batch to what the bulk endpoint expects
+            (e.g. pre-hashed passwords); runs in a thread, after keys are taken from the original records
+        dataset (str, optional): Name the manifest keeps this dataset's hashes under, next to ``url``; needed
+            when several datasets post to the same endpoint
+        keyed (bool, optional): ``records`` are ``(key, record)`` pairs whose keys the caller computed, e.g.
+            from the record before it was rewritten, so checkpoints and manifests keep matching
+
+    Returns:
+        SeedSummary: Number of records sent, rejected and errored
+    """
+    concurrency = concurrency or default_concurrency()
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    throttle = throttle or RateLimitThrottle()
+    summary = SeedSummary()
+    batching = bool(bulk_url and batch_size and batch_size > 1)
+    batch_size = batch_size if batching else 1
+
+    def acknowledge(key):
+        acknowledged.add(key)
+        if checkpoint is not None:
+            checkpoint.mark(key, url)
+
+    async def send_one(key, record):
+        try:
+            response = await _post_until_accepted(url, record, transport, throttle, summary)
+        except Exception as e:
+            _report(summary, record, describe, error=e)
+            return
+        _report(summary, record, describe, response=response)
+        if response.status_code == 201:
+            acknowledge(key)
+
+    async def send_batch(batch):
+        try:
+            payload = [record for _, record in batch]
+            if prepare_batch is not None:
+                payload = await asyncio.get_running_loop().run_in_executor(None, prepare_batch, payload)
+            response = await _post_until_accepted(bulk_url, {"records": payload}, transport, throttle, summary)
+            results = json.loads(response.text)["results"] if response.status_code == 200 else None
+        except Exception as e:
+            for _, record in batch:
+                _report(summary, record, describe, error=e)
+            return
+        if results is None:
+            if response.status_code == 413:
+                print(f"A batch of {len(batch)} records is over the backend's 100kb body limit; lower --batch-size.")
+            for _, record in batch:
+                _report(summary, record, describe, response=response)
+            return
+        answered = set()
+        for result in results:
+            key, record = batch[result["index"]]
+            answered.add(result["index"])
+            item = Response(result["status"], result.get("message", ""), response.headers)
+            _report(summary, record, describe, response=item)
+            if item.status_code == 201:
+                acknowledge(key)
+        for index, (_, record) in enumerate(batch):
+            if index not in answered:
+                _report(summary, record, describe, error="no result for this record in the bulk response")
+
+    async def worker():
+        while True:
+            batch = await queue.get()
+            try:
+                if batch is None:
+                    return
+                if batching:
+                    await send_batch(batch)
+                else:
+                    await send_one(*batch[0])
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    known = manifest.known(url, dataset) if manifest is not None else set()
+    seen = set()
+    acknowledged = set()
+    pending = []
+    async for item in _iterate(records):
+        key, record = item if keyed else (None, item)
+        if schema is not None:
+            errors = schema.errors(record)
+            if errors:
+                summary.invalid += 1
+                subject = f" {describe(record)}" if describe else ""
+                print(f"Invalid{subject}: {'; '.join(errors)}")
+                continue
+        if key is None:
+            key = record_key(url, record)
+        if manifest is not None:
+            seen.add(key)
+            if key in known:
+                summary.unchanged += 1
+                continue
+        if checkpoint is not None and key in checkpoint:
+            summary.skipped += 1
+            continue
+        pending.append((key, record))
+        if len(pending) == batch_size:
+            await queue.put(pending)
+            pending = []
+    if pending:
+        await queue.put(pending)
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    if summary.skipped:
+        print(f"Skipped {summary.skipped} records already acknowledged in {checkpoint.path}.")
+    if manifest is not None:
+        if summary.unchanged:
+            print(f"Skipped {summary.unchanged} records unchanged since the last run.")
+        if not summary.failed and not summary.errors and not summary.invalid:
+            manifest.update(url, seen, dataset)
+        else:
+            # Keep what is known to be on the server so a rerun only resends the failures.
+            manifest.update(url, (known & seen) | acknowledged, dataset)
+    return summary
+
+
+class Seeder:
+    """
+    Runs several datasets through one event loop and one pooled transport.
+
+    Use as a context manager so the connection pool is reused across every
+    ``send`` call of a script and closed once at the end. Pass ``checkpoint``
+    (or set SEED_CHECKPOINT) to make the run resumable, and ``manifest`` (or
+    SEED_MANIFEST) to only send records changed since the last run::
+
+        with Seeder() as seeder:
+            seeder.send(journal_api_url, journal)
+            seeder.send(conference_api_url, conference)
+    """
+
+    def __init__(self, concurrency=None, transport=None, checkpoint=None, manifest=None, **transport_options):
+        self.concurrency = concurrency
+        self.checkpoint = open_checkpoint(checkpoint)
+        self.manifest = open_manifest(manifest)
+        self.throttle = RateLimitThrottle()
+        self._loop = asyncio.new_event_loop()
+        self.transport = transport or self._loop.run_until_complete(self._make_transport(transport_options))
+
+    @staticmethod
+    async def _make_transport(options):
+        # Built inside the loop so async clients bind to it.
+        return make_transport(**options)
+
+    def send_async(
+        self,
+        url,
+        records,
+        describe=None,
+        schema=None,
+        bulk_url=None,
+        batch_size=None,
+        prepare_batch=None,
+        dataset=None,
+        keyed=False,
+    ):
+        """Coroutine sending one dataset; lets several datasets share the loop via :meth:`run`."""
+        return send_records(
+            url,
+            records,
+            self.transport,
+            concurrency=self.concurrency,
+            describe=describe,
+            throttle=self.throttle,
+            checkpoint=self.checkpoint,
+            manifest=self.manifest,
+            schema=schema,
+            bulk_url=bulk_url,
+            batch_size=batch_size,
+            prepare_batch=prepare_batch,
+            dataset=dataset,
+            keyed=keyed,
+        )
+
+    def send(
+        self,
+        url,
+        records,
+        describe=None,
+        schema=None,
+        bulk_url=None,
+        batch_size=None,
+        prepare_batch=None,
+        dataset=None,
+        keyed=False,
+    ):
+        """Send one dataset and return its :class:`SeedSummary`."""
+        return self.run(
+            self.send_async(
+                url,
+                records,
+                describe=describe,
+                schema=schema,
+                bulk_url=bulk_url,
+                batch_size=batch_size,
+                prepare_batch=prepare_batch,
+                dataset=dataset,
+                keyed=keyed,
+            )
+        )
+
+    def run(self, coroutine):
+        """Run ``coroutine`` on the seeder's event loop and return its result."""
+        return self._loop.run_until_complete(coroutine)
+
+    def close(self):
+        self._loop.run_until_complete(self.transport.aclose())
+        self._loop.close()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def send_all(url, records, concurrency=None, describe=None):
+    """Send a single dataset with its own :class:`Seeder`."""
+    with Seeder(concurrency=concurrency) as seeder:
+        return seeder.send(url, records, describe=describe)
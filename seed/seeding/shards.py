@@ -0,0 +1,399 @@
+"""
+Sharded seeding across processes and machines.
+
+Every selected dataset is partitioned into K shards. Datasets read from
+JSONL or Parquet files (``load_part`` in the registry) are split by position
+before decoding: shard n of K decodes only the n-th K-th of the file's bytes
+(or row groups), so workers do not each parse the whole dataset. Other
+loaders, and ``--shard-key``, split by a stable hash of a record key
+(``empId``, ``title``, ... see ``shard_key`` in the registry), which every
+worker computes over every record. Either way each record is in exactly one
+shard; checkpoints and manifests are keyed by record content, not by shard,
+so a rerun skips what was sent whichever shard it lands in. The work is a
+grid of (stage, shard) items, where a stage is a set of entities whose
+prerequisites are in earlier stages: all users are registered before any
+shard starts on publications.
+
+Items are handed out through a small JSON work-queue file guarded by
+``flock``. The local coordinator starts worker processes that claim items
+until none are left, each with its own Seeder and connection pool; other
+hosts join by running the same command with the same ``--queue`` on a shared
+filesystem. Workers log to per-shard checkpoint and manifest files, which the
+coordinator merges into the main ones once every item is done.
+
+Only claims of dead processes on the local host are reclaimed: whether a
+process on another host is alive cannot be told from here, so an item
+claimed by a host that went down stays claimed until the same command is
+run again on a host with that hostname.
+"""
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, replace
+
+from .checkpoint import Checkpoint, iter_entries
+from .graph import seed_graph
+from .manifest import Manifest
+from .names import SharedNameIndex
+from .registry import get_entity, topological_order
+from .sender import Seeder, SeedSummary
+
+# Seconds between checks while waiting for another worker to finish a stage.
+POLL_INTERVAL = 0.5
+
+
+def shard_of(value, shards):
+    """Return the shard (0 to ``shards`` - 1) of a key; unlike ``hash()`` it is the same in every process."""
+    digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def record_shard(record, shards, key=None):
+    """Return the shard of ``record`` by its ``key`` field, or by its whole content when the field is missing."""
+    value = record.get(key) if key else None
+    if value is None:
+        value = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return shard_of(value, shards)
+
+
+def shard_records(records, shard, shards, key=None):
+    """Yield the records of ``records`` that fall in ``shard``."""
+    for record in records:
+        if record_shard(record, shards, key) == shard:
+            yield record
+
+
+def stages(entities):
+    """
+    Group ``entities`` into stages that can each be seeded in one go.
+
+    An entity's stage is one more than the latest stage of its selected
+    prerequisites, so every stage only depends on earlier ones.
+
+    Returns:
+        list: Lists of entity names, one per stage
+    """
+    level = {}
+    for entity in topological_order(entities):
+        level[entity.name] = 1 + max((level[name] for name in entity.depends_on if name in level), default=-1)
+    grouped = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for name, stage in level.items():
+        grouped[stage].append(name)
+    return grouped
+
+
+def _shard_path(path, shard):
+    return f"{path}.shard{shard}" if path else None
+
+
+def _owner():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _is_stale(owner):
+    """True when ``owner`` is a process on this host that no longer runs; owners on other hosts never are."""
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except (PermissionError, ValueError):
+        return False
+    return False
+
+
+class WorkQueue:
+    """
+    Work-queue file shared by every worker of a sharded run.
+
+    Holds the stages, the shard count and the state of every ``"<stage>/<shard>"``
+    item: claimed by ``host:pid``, done with per-entity results, or absent when
+    still pending. Every access holds an exclusive ``flock`` on ``<path>.lock``
+    and rewrites the file atomically. A claim left by a dead process on the
+    same host is handed out again; claims from other hosts are never taken
+    over, since their processes cannot be checked from here.
+
+    Args:
+        path (str): Location of the queue file
+    """
+
+    WAIT = "wait"
+
+    def __init__(self, path):
+        self.path = path
+
+    @contextmanager
+    def _locked(self):
+        # POSIX only; imported here so the rest of the CLI still loads elsewhere.
+        import fcntl
+
+        with open(f"{self.path}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                text = None
+                if os.path.exists(self.path):
+                    with open(self.path, encoding="utf-8") as f:
+                        text = f.read()
+                # Callers mutate or replace box[0]; it is written back when it changed.
+                box = [json.loads(text) if text else None]
+                yield box
+                if box[0] is not None and json.dumps(box[0]) != text:
+                    temp = f"{self.path}.{os.getpid()}.tmp"
+                    with open(temp, "w", encoding="utf-8") as f:
+                        json.dump(box[0], f)
+                    os.replace(temp, self.path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def create(self, stages, shards):
+        """
+        Create the queue, or join an existing one for the same work.
+
+        Raises:
+            ValueError: If the file holds a queue for other entities or another shard count
+        """
+        with self._locked() as box:
+            if box[0] is None:
+                box[0] = {"shards": shards, "stages": stages, "items": {}, "merged": False}
+            elif box[0]["shards"] != shards or box[0]["stages"] != stages:
+                raise ValueError(
+                    f"Work queue {self.path} was created for {box[0]['shards']} shards of {box[0]['stages']}, "
+                    f"not {shards} shards of {stages}"
+                )
+
+    def state(self):
+        with self._locked() as box:
+            return box[0]
+
+    def claim(self):
+        """
+        Claim the next pending item.
+
+        Returns:
+            tuple or str or None: ``(stage, shard)``; :attr:`WAIT` when the remaining items wait on
+            an earlier stage or are claimed by others; None when every item is claimed or done
+        """
+        with self._locked() as box:
+            state = box[0]
+            waiting = False
+            for stage in range(len(state["stages"])):
+                for shard in range(state["shards"]):
+                    item = state["items"].get(f"{stage}/{shard}")
+                    if item is None or (not item["done"] and _is_stale(item["owner"])):
+                        state["items"][f"{stage}/{shard}"] = {"owner": _owner(), "done": False, "results": None}
+                        return stage, shard
+                    if not item["done"]:
+                        waiting = True
+                if waiting:
+                    # Later stages depend on this one; without later stages there is nothing left to claim.
+                    return self.WAIT if stage < len(state["stages"]) - 1 else None
+            return None
+
+    def complete(self, stage, shard, results):
+        """Mark an item done with its ``{entity: counts or error}`` results."""
+        with self._locked() as box:
+            box[0]["items"][f"{stage}/{shard}"].update(done=True, results=results)
+
+    @contextmanager
+    def finishing(self):
+        """
+        Hold the lock over a finished queue; yields True to the one caller that should merge.
+
+        Yields False while items are still open, or once another coordinator has merged.
+        """
+        with self._locked() as box:
+            state = box[0]
+            total = len(state["stages"]) * state["shards"]
+            done = sum(1 for item in state["items"].values() if item["done"])
+            should_merge = done == total and not state["merged"]
+            yield should_merge
+            if should_merge:
+                box[0] = dict(state, merged=True)
+
+
+def _sharded(entity, shard, shards, key=None):
+    """Return ``entity`` loading only ``shard``: by position when it has a ``load_part`` and no ``key`` is forced."""
+    if entity.load_part is not None and key is None:
+        load_part = entity.load_part
+        return replace(entity, load=lambda options: load_part(options, (shard, shards)))
+    load = entity.load
+    shard_key = key or entity.shard_key
+    return replace(entity, load=lambda options: shard_records(load(options), shard, shards, shard_key))
+
+
+def _seed_item(options, names, shard, shards):
+    checkpoint_path = options.checkpoint or os.environ.get("SEED_CHECKPOINT")
+    manifest_path = options.manifest or os.environ.get("SEED_MANIFEST")
+    checkpoint = None
+    if checkpoint_path:
+        known = (key for key, _ in iter_entries(checkpoint_path)) if os.path.exists(checkpoint_path) else ()
+        checkpoint = Checkpoint(_shard_path(checkpoint_path, shard), known=known)
+    shard_manifest = _shard_path(manifest_path, shard)
+    if manifest_path and os.path.exists(manifest_path) and not os.path.exists(shard_manifest):
+        # Start from the merged manifest; a leftover shard file from an interrupted run is newer.
+        shutil.copyfile(manifest_path, shard_manifest)
+
+    entities = [_sharded(get_entity(name), shard, shards, options.shard_key) for name in names]
+    cookies = {"accessToken": options.token} if options.token else None
+    if options.resolve_names:
+        options.name_index = SharedNameIndex(options.names_from, base_url=options.base_url, cookies=cookies)
+    with Seeder(
+        concurrency=options.concurrency,
+        checkpoint=checkpoint,
+        manifest=shard_manifest,
+        pool_size=options.pool_size,
+        http2=options.http2,
+        cookies=cookies,
+    ) as seeder:
+        results = seeder.run(seed_graph(seeder, entities, options.base_url, options))
+    return {
+        name: {"error": str(result)} if isinstance(result, Exception) else asdict(result)
+        for name, result in results.items()
+    }
+
+
+def run_worker(options, queue_path):
+    """
+    Claim and seed work items from the queue at ``queue_path`` until none are left.
+
+    The entry point of every worker process, local or on another host.
+    """
+    from . import entities  # noqa: F401  (registers the built-in entities in spawned workers)
+
+    for module in getattr(options, "plugin", ()):
+        importlib.import_module(module)
+    queue = WorkQueue(queue_path)
+    stage_names = queue.state()["stages"]
+    while True:
+        item = queue.claim()
+        if item is None:
+            return
+        if item == WorkQueue.WAIT:
+            time.sleep(POLL_INTERVAL)
+            continue
+        stage, shard = item
+        shards = queue.state()["shards"]
+        print(f"Shard {shard + 1}/{shards}: seeding {', '.join(stage_names[stage])}...")
+        try:
+            results = _seed_item(options, stage_names[stage], shard, shards)
+        except Exception as e:
+            results = {name: {"error": str(e)} for name in stage_names[stage]}
+        queue.complete(stage, shard, results)
+
+
+def merge_shards(checkpoint_path, manifest_path, shards):
+    """
+    Fold the per-shard checkpoint and manifest files into the main ones and delete them.
+
+    Checkpoint keys are appended to the main checkpoint. A shard manifest starts as
+    a copy of the main one and keeps, per dataset, the hashes on the server from
+    that shard, so the union over all shards is the new main manifest.
+    """
+    if checkpoint_path:
+        checkpoint = Checkpoint(checkpoint_path)
+        for shard in range(shards):
+            path = _shard_path(checkpoint_path, shard)
+            if os.path.exists(path):
+                checkpoint.merge(path)
+                os.remove(path)
+        checkpoint.close()
+    if manifest_path:
+        paths = [_shard_path(manifest_path, shard) for shard in range(shards)]
+        paths = [path for path in paths if os.path.exists(path)]
+        if paths:
+            merged = {}
+            for path in paths:
+                for entry, keys in Manifest(path).entries().items():
+                    merged.setdefault(entry, set()).update(keys)
+            Manifest(manifest_path).update_entries(merged)
+            for path in paths:
+                os.remove(path)
+
+
+def _totals(state):
+    """Sum the per-shard results of every entity into one SeedSummary, or the first error."""
+    totals = {}
+    for item in state["items"].values():
+        for name, result in (item["results"] or {}).items():
+            if "error" in result:
+                totals[name] = RuntimeError(result["error"])
+            elif not isinstance(totals.get(name), Exception):
+                summary = totals.setdefault(name, SeedSummary())
+                for field, count in result.items():
+                    setattr(summary, field, getattr(summary, field) + count)
+    return totals
+
+
+def run_sharded(options, entities):
+    """
+    Seed ``entities`` in ``options.shards`` shards with ``options.workers`` local processes.
+
+    With ``options.queue`` the queue file is shared with other hosts running the same
+    command; this coordinator then waits for their items too before merging.
+
+    Returns:
+        dict: Entity name to its SeedSummary over all shards, or to the exception that stopped it
+    """
+    grouped = stages(entities)
+    temp_dir = None
+    queue_path = options.queue
+    if queue_path is None:
+        temp_dir = tempfile.mkdtemp(prefix="seed-queue-")
+        queue_path = os.path.join(temp_dir, "queue.json")
+    queue = WorkQueue(queue_path)
+    try:
+        queue.create(grouped, options.shards)
+        workers = options.workers or min(options.shards, os.cpu_count() or 1)
+        # spawn, not fork: each worker builds its own event loop and connection pool.
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=run_worker, args=(options, queue_path)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        announced = False
+        while True:
+            state = queue.state()
+            open_items = [key for key, item in state["items"].items() if not item["done"]]
+            pending = len(state["stages"]) * state["shards"] - len(state["items"])
+            if not open_items and not pending:
+                break
+            if any(_is_stale(state["items"][key]["owner"]) for key in open_items):
+                # A local worker died mid-item; redo it here.
+                run_worker(options, queue_path)
+                continue
+            if not announced:
+                print(f"Waiting for {len(open_items) + pending} work items on other hosts...")
+                announced = True
+            time.sleep(POLL_INTERVAL)
+
+        with queue.finishing() as should_merge:
+            if should_merge:
+                merge_shards(
+                    options.checkpoint or os.environ.get("SEED_CHECKPOINT"),
+                    options.manifest or os.environ.get("SEED_MANIFEST"),
+                    options.shards,
+                )
+        results = _totals(queue.state())
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            print(f"Error: {name} was not seeded: {result}")
+        else:
+            print(
+                f"{name} ({options.shards} shards): {result.sent} sent, {result.failed} failed, "
+                f"{result.errors} errors, {result.invalid} invalid."
+            )
+    return results
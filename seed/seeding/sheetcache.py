@@ -0,0 +1,265 @@
+"""
+On-disk cache of parsed worksheets.
+
+Each parsed sheet is stored as an Arrow IPC file keyed by the SHA-256 of the
+workbook's bytes and the sheet name, so an unchanged workbook is never parsed
+twice and an edited one can never be served stale. Sheets mix types within a
+column (a text header above numbers), so the file holds one entry per
+non-empty cell: its column number, and its value in the one typed column
+(``int``, ``str``, ...) matching its Python type; an entry with column -1
+starts each row and carries its width. Sheets are written and read back in
+record batches of BATCH_ROWS rows, so caching a sheet while it is parsed and
+reading it back both keep memory flat. When the cache grows past its size
+limit, the least recently used sheets are deleted.
+
+Configured with SEED_SHEET_CACHE (a directory, or ``off``) and
+SEED_SHEET_CACHE_MB (size limit, default 512). Needs pyarrow.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+from datetime import datetime
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pesu-research-portal", "sheets")
+DEFAULT_MAX_MB = 512
+
+# Python type -> value column. bool before int: bool is a subclass of int.
+_KINDS = ((bool, "bool"), (int, "int"), (float, "float"), (datetime, "datetime"), (str, "str"))
+_KIND_NAMES = [kind for _, kind in _KINDS]
+_KIND_INDEX = {kind: index for index, kind in enumerate(_KIND_NAMES)}
+_INT64 = range(-(2**63), 2**63)
+# Column number of the entry that starts a row; its ``int`` value is the row's width.
+_ROW_START = -1
+# Sheet rows per Arrow record batch; bounds memory while a sheet is cached or read back.
+BATCH_ROWS = 4096
+
+
+def _schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("col", pa.int32()),
+            ("kind", pa.int8()),
+            ("bool", pa.bool_()),
+            ("int", pa.int64()),
+            ("float", pa.float64()),
+            ("datetime", pa.timestamp("us")),
+            ("str", pa.string()),
+        ]
+    )
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of the file at ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _kind(value):
+    for python_type, kind in _KINDS:
+        if isinstance(value, python_type):
+            if kind == "int" and value not in _INT64:
+                return "str"
+            return kind
+    # Anything else (times, durations) is kept as its text.
+    return "str"
+
+
+def _read_rows(reader):
+    for index in range(reader.num_record_batches):
+        batch = reader.get_batch(index)
+        columns = batch.column("col").to_pylist()
+        kinds = batch.column("kind").to_pylist()
+        values = [batch.column(kind).to_pylist() for kind in _KIND_NAMES]
+        widths = values[_KIND_INDEX["int"]]
+        row = None
+        for position, column in enumerate(columns):
+            if column == _ROW_START:
+                if row is not None:
+                    yield tuple(row)
+                row = [None] * widths[position]
+            else:
+                row[column] = values[kinds[position]][position]
+        # Batches end on a row boundary.
+        if row is not None:
+            yield tuple(row)
+
+
+class SheetWriter:
+    """
+    Writes one sheet to the cache one record batch at a time, as its rows are parsed.
+
+    Use as a context manager: the file only replaces the cache entry when the
+    block completes, so a sheet whose reading stopped early (or failed) is
+    never cached half-written.
+    """
+
+    def __init__(self, cache, path):
+        import pyarrow as pa
+
+        self.cache = cache
+        self.path = path
+        self._schema = _schema()
+        os.makedirs(cache.directory, exist_ok=True)
+        self._temp = f"{path}.{os.getpid()}.tmp"
+        self._writer = pa.ipc.new_file(self._temp, self._schema)
+        self._columns = {name: [] for name in self._schema.names}
+        self._rows = 0
+
+    def append(self, row):
+        """Add the next row (a tuple) of the sheet."""
+        self._add(_ROW_START, "int", len(row))
+        for column, value in enumerate(row):
+            if value is None:
+                continue
+            kind = _kind(value)
+            if kind == "str" and not isinstance(value, str):
+                value = str(value)
+            self._add(column, kind, value)
+        self._rows += 1
+        if self._rows == BATCH_ROWS:
+            self._flush()
+
+    def _add(self, column, kind, value):
+        columns = self._columns
+        columns["col"].append(column)
+        columns["kind"].append(_KIND_INDEX[kind])
+        for name in _KIND_NAMES:
+            columns[name].append(value if name == kind else None)
+
+    def _flush(self):
+        import pyarrow as pa
+
+        if self._rows:
+            arrays = [pa.array(self._columns[field.name], type=field.type) for field in self._schema]
+            self._writer.write_batch(pa.record_batch(arrays, schema=self._schema))
+            for cells in self._columns.values():
+                cells.clear()
+            self._rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        completed = exc_type is None
+        try:
+            if completed:
+                self._flush()
+            self._writer.close()
+        except BaseException:
+            completed = False
+            raise
+        finally:
+            if completed:
+                os.replace(self._temp, self.path)
+                self.cache.evict()
+            else:
+                try:
+                    os.remove(self._temp)
+                except FileNotFoundError:
+                    pass
+
+
+class SheetCache:
+    """
+    Directory of cached sheets with LRU eviction by total size.
+
+    Args:
+        directory (str): Cache directory, created on first write
+        max_bytes (int): Size the cache is trimmed to after every write
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, digest, suffix):
+        return os.path.join(self.directory, f"{digest}{suffix}")
+
+    def _sheet_path(self, digest, sheet):
+        return self._path(digest, "-" + hashlib.sha256(sheet.encode()).hexdigest()[:16] + ".cells.arrow")
+
+    def _write(self, path, write):
+        os.makedirs(self.directory, exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        write(temp)
+        os.replace(temp, path)
+        self.evict()
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def sheet_names(self, digest):
+        """Return the cached sheet names of the workbook ``digest``, or None."""
+        path = self._path(digest, ".sheets.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                names = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        self._touch(path)
+        return names
+
+    def put_sheet_names(self, digest, names):
+        def write(temp):
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump(list(names), f)
+
+        self._write(self._path(digest, ".sheets.json"), write)
+
+    def rows(self, digest, sheet):
+        """Return an iterator over the cached rows of ``sheet`` as tuples, or None on a miss."""
+        import pyarrow as pa
+
+        path = self._sheet_path(digest, sheet)
+        try:
+            reader = pa.ipc.open_file(pa.memory_map(path))
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return _read_rows(reader)
+
+    def writer(self, digest, sheet):
+        """Return a :class:`SheetWriter` caching ``sheet`` of the workbook ``digest`` as its rows are parsed."""
+        return SheetWriter(self, self._sheet_path(digest, sheet))
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith((".arrow", ".sheets.json")):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def default_cache():
+    """
+    Return the SheetCache configured by the environment, or None when caching is off.
+
+    Caching is off when SEED_SHEET_CACHE is ``off`` or pyarrow is not installed.
+    """
+    directory = os.environ.get("SEED_SHEET_CACHE", DEFAULT_CACHE_DIR)
+    if directory.lower() in ("off", "0", "") or importlib.util.find_spec("pyarrow") is None:
+        return None
+    max_mb = float(os.environ.get("SEED_SHEET_CACHE_MB", DEFAULT_MAX_MB))
+    return SheetCache(directory, int(max_mb * 1024 * 1024))
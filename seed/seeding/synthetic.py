@@ -0,0 +1,380 @@
+"""
+Synthetic datasets shaped like the bundled seed data, of any size.
+
+Each entity's generator is learned from the records its loader returns (the
+bundled ``seed/data`` files, the teacher roster for ``users``), field by
+field:
+
+* low-cardinality fields (flags such as ``isScopus``/``isWOS`` or the exam
+  ``is*`` flags, ``qNo``, ``month``, ``domain``, ``level``, counts, years) are
+  copied together from one real record picked at random, so their joint
+  distribution is the real one: an entrance exam record still has exactly the
+  flags a real one has
+* free text (titles, journal and student names) is drawn from a word-level
+  Markov chain over the field's real values
+* identifiers (registration and patent numbers) and links keep their shape
+  with fresh digits, and fresh letters in link ids
+* dates are shifted by a random number of days within their year, keeping the
+  span between a record's start and end dates
+* ``keywords`` are taken from the generated title as in the real data, and
+  fields that always equal another one (``proceedings_conference_title``)
+  stay equal to it
+* teacher names (``name``, ``teacherIds``, keeping the real co-author counts)
+  come from a pool of synthetic teachers, the ones the ``users`` generator
+  registers, so generated publications resolve to generated users
+
+Output depends only on the entity, the seed and the teacher pool size, and the
+first N records are the same whatever the total, so a 10x and a 100x dataset
+share a prefix. Records are generated one at a time and written as they are
+made, so memory stays flat at any size. Parquet output needs pyarrow.
+"""
+import json
+import os
+import random
+import re
+from argparse import Namespace
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from .registry import get_entity
+from .schemas import USER
+
+FORMATS = ("jsonl", "parquet")
+DEFAULT_TEACHERS = 100
+# Rows per Parquet row group; also how many records are held at a time while writing one.
+PARQUET_BATCH_SIZE = 10_000
+
+# Fields with at most this share of distinct values are copied from a real record.
+CATEGORICAL_SHARE = 0.5
+# Free-text values with at least this many digits are identifiers: only their digits are redrawn.
+IDENTIFIER_DIGITS = 5
+TEACHER_FIELDS = ("name", "teacherIds")
+TITLE_FIELDS = ("title", "paperTitle")
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$")
+_LINK = re.compile(r"^(https?://[^/]+)(.*)$")
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_UPPER = _LOWER.upper()
+_DIGITS = "0123456789"
+
+
+def _pick(rng, sequence):
+    # random.choice without its rejection sampling: a third of the cost, and these lists are far below 2**53.
+    return sequence[int(rng.random() * len(sequence))]
+
+
+class _Chain:
+    """Word-level first-order Markov chain over a field's real values."""
+
+    def __init__(self, values):
+        self.next = {}
+        self.longest = 1
+        for value in values:
+            words = value.split()
+            self.longest = max(self.longest, len(words))
+            for previous, word in zip([None] + words, words + [None]):
+                self.next.setdefault(previous, []).append(word)
+
+    def sample(self, rng):
+        words = []
+        word = _pick(rng, self.next[None])
+        # Cap runaway walks through cycles at twice the longest real value.
+        while word is not None and len(words) < 2 * self.longest:
+            words.append(word)
+            word = _pick(rng, self.next[word])
+        return " ".join(words)
+
+
+def _redraw(rng, text, letters=False):
+    """Replace every digit of ``text`` (and every letter, if ``letters``) by a random one of its kind."""
+    characters = []
+    for character in text:
+        if character.isdigit():
+            character = _pick(rng, _DIGITS)
+        elif letters and character.isascii() and character.isalpha():
+            character = _pick(rng, _UPPER if character.isupper() else _LOWER)
+        characters.append(character)
+    return "".join(characters)
+
+
+def _link(rng, url):
+    """Same host and path shape, with every path segment holding a digit (an id) redrawn."""
+    match = _LINK.match(url)
+    if match is None:
+        return _redraw(rng, url)
+    segments = re.split(r"([/?=&])", match.group(2))
+    return match.group(1) + "".join(
+        _redraw(rng, segment, letters=True) if any(c.isdigit() for c in segment) else segment for segment in segments
+    )
+
+
+def _keywords(title, count):
+    return _WORD.findall(title)[:count]
+
+
+def _kind(values):
+    """Pick how ``field`` is generated from its real ``values``."""
+    present = [value for value in values if value not in (None, "")]
+    if not present or not all(isinstance(value, str) for value in present):
+        return "template"
+    if all(_DATE.match(value) for value in present):
+        return "date"
+    if len(set(values)) <= CATEGORICAL_SHARE * len(values):
+        return "template"
+    if all(_LINK.match(value) for value in present):
+        return "link"
+    if sum(c.isdigit() for c in present[0]) >= IDENTIFIER_DIGITS:
+        return "identifier"
+    return "text"
+
+
+class Generator:
+    """
+    Record generator for one entity, learned from real records.
+
+    Args:
+        name (str): Entity name, used in the random seed
+        templates (list): Real records of the entity
+        key (str, optional): Text field made unique by appending the record number, e.g. the entity's shard key
+        names (list, optional): Real teacher names the synthetic teacher names are drawn like
+        teachers (int, optional): Size of the synthetic teacher pool names are drawn from. Defaults to
+            DEFAULT_TEACHERS
+        owners (bool, optional): Draw ``name`` and ``teacherIds`` from the teacher pool. Defaults to False
+        users (bool, optional): Generate /auth/register payloads for the teacher pool instead. Defaults to False
+        seed (int, optional): Random seed. Defaults to 0
+    """
+
+    def __init__(self, name, templates, key=None, names=(), teachers=DEFAULT_TEACHERS, owners=False, users=False,
+                 seed=0):
+        if not templates:
+            raise ValueError(f"no records to learn '{name}' from")
+        self.name = name
+        self.templates = templates
+        self.key = key
+        self.teachers = teachers
+        self.owners = owners
+        self.users = users
+        self.seed = seed
+        fields = list(templates[0])
+        columns = {field: [record.get(field) for record in templates] for field in fields}
+        self.kinds = {field: _kind(columns[field]) for field in fields}
+        self.mirrors = {}
+        for index, field in enumerate(fields):
+            for other in fields[:index]:
+                if self.kinds[field] != "template" and columns[field] == columns[other]:
+                    self.mirrors[field] = other
+                    break
+        self.chains = {
+            field: _Chain([value for value in columns[field] if value])
+            for field, kind in self.kinds.items()
+            if kind == "text" and any(columns[field])
+        }
+        self._names = _Chain([name for name in names if name]) if owners or users else None
+        self._pool = {}
+        self._initials = 1
+        while 26**self._initials < teachers:
+            self._initials += 1
+
+    def teacher_name(self, number):
+        """
+        Name of synthetic teacher ``number``; the same in every generator with the same seed and pool size.
+
+        A real-looking name followed by initials spelling out ``number``, so no two teachers share a name
+        and the backend's name lookups stay unambiguous.
+        """
+        name = self._pool.get(number)
+        if name is None:
+            name = self._names.sample(random.Random(f"{self.seed}:teacher:{number}"))
+            initials = []
+            for index in range(self._initials):
+                initials.append(_UPPER[number // 26**index % 26])
+            name = self._pool[number] = " ".join([name] + initials[::-1])
+        return name
+
+    def _random_teacher(self, rng):
+        return self.teacher_name(int(rng.random() * self.teachers))
+
+    def _user(self, rng, number, template):
+        record = dict(template)
+        name = self.teacher_name(number)
+        login = ".".join(word.lower() for word in _WORD.findall(name) if word.lower() != "dr") or "teacher"
+        record.update(
+            name=name,
+            empId=f"{login}{number}@pes.edu",
+            password=f"{login}{number}",
+            panNo=_redraw(rng, template["panNo"], letters=True),
+            phno=_redraw(rng, template["phno"]),
+        )
+        return record
+
+    def record(self, rng, number):
+        """Generate record ``number`` from ``rng``."""
+        template = _pick(rng, self.templates)
+        if self.users:
+            return self._user(rng, number, template)
+        record = dict(template)
+        shift = None
+        for field, kind in self.kinds.items():
+            value = template[field]
+            if field in self.mirrors:
+                continue
+            if self.owners and field in TEACHER_FIELDS:
+                if isinstance(value, list):
+                    record[field] = [self._random_teacher(rng) for _ in value]
+                else:
+                    record[field] = self._random_teacher(rng)
+            elif kind == "text" and field in self.chains:
+                record[field] = self.chains[field].sample(rng) if value else value
+            elif kind == "identifier" and value:
+                record[field] = _redraw(rng, value)
+            elif kind == "link" and value:
+                record[field] = _link(rng, value)
+            elif kind == "date" and value:
+                if shift is None:
+                    # Anywhere in the same year; one shift per record keeps its start-to-end span.
+                    day = _parse_date(value).timetuple().tm_yday
+                    shift = timedelta(days=rng.randrange(1 - day, 366 - day))
+                record[field] = _shift(value, shift)
+        for field, other in self.mirrors.items():
+            record[field] = record[other]
+        title = next((field for field in TITLE_FIELDS if field in record), None)
+        if title and isinstance(record.get("keywords"), list):
+            record["keywords"] = _keywords(record[title], len(template["keywords"]))
+        # Redrawn identifiers are unique enough already; text keys get the record number so shards stay even.
+        if self.kinds.get(self.key) == "text":
+            record[self.key] = f"{record[self.key]} {number + 1}"
+        return record
+
+    def __call__(self, count):
+        """
+        Return a generator of ``count`` records, made one at a time.
+
+        Raises:
+            ValueError: If this generates users and ``count`` is larger than the teacher pool; initials
+                are sized for the pool, so further users would repeat its names
+        """
+        if self.users and count > self.teachers:
+            raise ValueError(
+                f"cannot generate {count} users from a pool of {self.teachers} teachers; pass teachers={count}"
+            )
+        return self._records(count)
+
+    def _records(self, count):
+        rng = random.Random(f"{self.seed}:{self.name}")
+        for number in range(count):
+            yield self.record(rng, number)
+
+
+def _parse_date(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _shift(value, delta):
+    """Shift an ISO timestamp by ``delta``, keeping its format (milliseconds, ``Z``)."""
+    shifted = (_parse_date(value) + delta).strftime("%Y-%m-%dT%H:%M:%S")
+    fraction = re.search(r"\.\d+", value)
+    return shifted + (fraction.group() if fraction else "") + ("Z" if value.endswith("Z") else "")
+
+
+# Options pointing every loader at the bundled sources: seed/data, seed/teachers.csv, seed/default_users.xlsx.
+_BUNDLED = Namespace(users_file=None, default_users_file=None, data_dir=None)
+
+
+@lru_cache(maxsize=None)
+def _roster_names():
+    return tuple(record["name"] for record in get_entity("users").load(_BUNDLED))
+
+
+def generator(name, teachers=DEFAULT_TEACHERS, seed=0):
+    """
+    Build the :class:`Generator` of the registered entity ``name`` from its real records.
+
+    Entities that depend on ``users`` draw their teacher names from the synthetic teacher pool; user
+    entities (``users``, ``defaultUsers``) generate that pool, so seed only one of them.
+    """
+    entity = get_entity(name)
+    users = entity.schema is USER
+    owners = "users" in entity.depends_on
+    templates = list(entity.load(_BUNDLED))
+    names = _roster_names() if users or owners else ()
+    return Generator(name, templates, entity.shard_key, names, teachers, owners=owners, users=users, seed=seed)
+
+
+def write_jsonl(records, path):
+    """Write ``records`` to ``path`` one JSON object per line as they come; returns how many were written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def write_parquet(records, path, batch_size=PARQUET_BATCH_SIZE):
+    """
+    Write ``records`` to a Parquet file at ``path``, one row group per ``batch_size`` records.
+
+    The column types come from the first batch; list columns that are empty there are written as
+    lists of strings. Needs pyarrow.
+
+    Returns:
+        int: Number of records written
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    count = 0
+    batch = []
+
+    def flush():
+        nonlocal writer
+        if writer is None:
+            schema = pa.Table.from_pylist(batch).schema
+            for index, field in enumerate(schema):
+                if pa.types.is_list(field.type) and pa.types.is_null(field.type.value_type):
+                    schema = schema.set(index, pa.field(field.name, pa.list_(pa.string())))
+            writer = pq.ParquetWriter(path, schema)
+        writer.write_table(pa.Table.from_pylist(batch, schema=writer.schema))
+        batch.clear()
+
+    try:
+        for record in records:
+            batch.append(record)
+            count += 1
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_dataset(name, count, out_dir, format="jsonl", teachers=DEFAULT_TEACHERS, seed=0):
+    """
+    Generate ``count`` records of the entity ``name`` into ``out_dir``, named so ``--data-dir`` reads them.
+
+    Args:
+        name (str): Registered entity name
+        count (int): Records to generate
+        out_dir (str): Output directory, created when missing
+        format (str, optional): ``jsonl`` or ``parquet``. Defaults to jsonl
+        teachers (int, optional): Teacher pool size. Defaults to DEFAULT_TEACHERS
+        seed (int, optional): Random seed. Defaults to 0
+
+    Returns:
+        str: Path of the file written
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format '{format}', expected one of {', '.join(FORMATS)}")
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{get_entity(name).dataset or name}.{format}")
+    records = generator(name, teachers, seed)(count)
+    if format == "parquet":
+        write_parquet(records, path)
+    else:
+        write_jsonl(records, path)
+    return path
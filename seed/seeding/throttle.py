@@ -0,0 +1,94 @@
+import asyncio
+import random
+import time
+
+# Backoff for a 429 that says neither Retry-After nor RateLimit-Reset: starts at
+# BACKOFF_BASE seconds and doubles per retry up to BACKOFF_CAP.
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+
+def _header_number(headers, name):
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """
+    Seconds to wait before retry number ``attempt`` (from 1) when the server gave no reset time.
+
+    Exponential with equal jitter: half of ``base * 2 ** (attempt - 1)`` (at most
+    ``cap``) plus a random share of the other half, so workers rate limited
+    together do not all come back at the same moment.
+    """
+    ceiling = min(cap, base * 2 ** (attempt - 1))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class RateLimitThrottle:
+    """
+    Client-side token bucket kept in sync with the backend's express-rate-limit window.
+
+    The backend answers with the standard ``RateLimit-Limit``,
+    ``RateLimit-Remaining`` and ``RateLimit-Reset`` headers (and ``Retry-After``
+    on a 429). Every request takes a token; once the server says the window is
+    spent, callers wait until the advertised reset instead of collecting 429s.
+    Until the first response arrives the bucket is unlimited.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self.limit = None
+        self.tokens = None
+        self.reset_at = None
+
+    def delay(self):
+        """Seconds to wait before the next request may be sent (0 if one can go now)."""
+        if self.reset_at is not None and self._clock() >= self.reset_at:
+            # The server window rolled over; start a fresh bucket.
+            self.tokens = self.limit
+            self.reset_at = None
+        if self.tokens is None or self.tokens > 0:
+            return 0
+        if self.reset_at is None:
+            return 0
+        return max(0.0, self.reset_at - self._clock())
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            wait = self.delay()
+            if not wait:
+                break
+            await asyncio.sleep(wait)
+        if self.tokens is not None:
+            self.tokens -= 1
+
+    def update(self, response):
+        """Sync the bucket with the rate-limit headers of ``response``."""
+        headers = response.headers
+        now = self._clock()
+        limit = _header_number(headers, "RateLimit-Limit")
+        remaining = _header_number(headers, "RateLimit-Remaining")
+        reset = _header_number(headers, "RateLimit-Reset")
+        if response.status_code == 429:
+            retry_after = _header_number(headers, "Retry-After")
+            reset = retry_after if retry_after is not None else reset
+            remaining = 0
+        if limit is not None:
+            self.limit = int(limit)
+        if reset is None:
+            return
+        reset_at = now + reset
+        if self.reset_at is None or reset_at > self.reset_at + 1:
+            # First response of a new server window.
+            self.reset_at = reset_at
+            self.tokens = None if remaining is None else int(remaining)
+        elif remaining is not None:
+            # Responses from the same window arrive out of order; keep the lowest count.
+            self.tokens = min(self.tokens, int(remaining)) if self.tokens is not None else int(remaining)
@@ -0,0 +1,205 @@
+import abc
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Connections kept open per host. Override with SEED_POOL_SIZE.
+DEFAULT_POOL_SIZE = 16
+# Seconds an idle connection is kept alive; 0 disables keep-alive. Override with SEED_KEEPALIVE.
+DEFAULT_KEEPALIVE = 30
+# Seconds to wait for a connection or a response before giving up on a request. Override with SEED_TIMEOUT.
+DEFAULT_TIMEOUT = 30
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class RequestTimeout(Exception):
+    """A request got no connection or no response within the transport's timeout."""
+
+
+class Response:
+    """Minimal response shared by every transport backend."""
+
+    def __init__(self, status_code, text, headers):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+
+class Transport(abc.ABC):
+    """
+    Pooled HTTP client shared by every request of a seed run.
+
+    Connections are reused across records and datasets instead of opening a new
+    TCP connection per ``requests.post``. Each host additionally gets its own
+    semaphore so one slow host cannot take every connection.
+
+    Args:
+        pool_size (int, optional): Connections kept per host. Defaults to SEED_POOL_SIZE or 16
+        keepalive (int, optional): Idle keep-alive in seconds, 0 to close after each request.
+            Defaults to SEED_KEEPALIVE or 30
+        per_host (int, optional): In-flight request limit per host. Defaults to SEED_PER_HOST or pool_size
+        headers (dict, optional): Extra headers sent with every request
+        cookies (dict, optional): Cookies sent with every request
+        timeout (float, optional): Seconds to wait for a connection or a response; a request that times
+            out raises :class:`RequestTimeout`. Defaults to SEED_TIMEOUT or 30
+    """
+
+    def __init__(self, pool_size=None, keepalive=None, per_host=None, headers=None, cookies=None, timeout=None):
+        self.pool_size = pool_size or _env_int("SEED_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self.keepalive = _env_int("SEED_KEEPALIVE", DEFAULT_KEEPALIVE) if keepalive is None else keepalive
+        self.per_host = per_host or _env_int("SEED_PER_HOST", self.pool_size)
+        self.headers = {'Content-Type': 'application/json', **(headers or {})}
+        if not self.keepalive:
+            self.headers['Connection'] = 'close'
+        self.cookies = cookies or {}
+        self.timeout = _env_float("SEED_TIMEOUT", DEFAULT_TIMEOUT) if timeout is None else timeout
+        self._host_limits = {}
+
+    def _limit(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def post_json(self, url, record):
+        """POST ``record`` as JSON and return a :class:`Response`."""
+        async with self._limit(url):
+            return await self._post(url, json.dumps(record))
+
+    @abc.abstractmethod
+    async def _post(self, url, body):
+        """Send ``body`` (a JSON string) to ``url`` and return a :class:`Response`; raise RequestTimeout on a timeout."""
+
+    async def aclose(self):
+        pass
+
+
+def _idle_expiring(pool_class, keepalive):
+    """Subclass of a urllib3 connection pool that closes connections idle for more than ``keepalive`` seconds."""
+
+    class IdleExpiringPool(pool_class):
+        def _get_conn(self, timeout=None):
+            conn = super()._get_conn(timeout)
+            idle_since = getattr(conn, "_seed_idle_since", None)
+            if idle_since is not None and time.monotonic() - idle_since > keepalive:
+                # urllib3 reconnects a closed connection on its next request.
+                conn.close()
+            return conn
+
+        def _put_conn(self, conn):
+            if conn is not None:
+                conn._seed_idle_since = time.monotonic()
+            super()._put_conn(conn)
+
+    return IdleExpiringPool
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by one ``requests.Session`` with a sized connection pool.
+
+    urllib3 keeps pooled connections open indefinitely, so the pools are
+    wrapped to close a connection that sat idle for more than ``keepalive``
+    seconds before it is reused.
+    """
+
+    def __init__(self, **kwargs):
+        # Imported on first use so tooling that never sends (e.g. validation) starts faster.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        super().__init__(**kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, pool_block=True)
+        if self.keepalive:
+            manager = adapter.poolmanager
+            manager.pool_classes_by_scheme = {
+                scheme: _idle_expiring(pool_class, self.keepalive)
+                for scheme, pool_class in manager.pool_classes_by_scheme.items()
+            }
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        self.session.cookies.update(self.cookies)
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size)
+
+    async def _post(self, url, body):
+        import requests
+
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(
+                self._executor, lambda: self.session.post(url, data=body, timeout=self.timeout)
+            )
+        except requests.Timeout:
+            raise RequestTimeout(f"no response from {url} within {self.timeout:g}s") from None
+        return Response(response.status_code, response.text, response.headers)
+
+    async def aclose(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """Async transport backed by ``httpx.AsyncClient``; the only backend that speaks HTTP/2."""
+
+    def __init__(self, http2=True, **kwargs):
+        import httpx
+
+        super().__init__(**kwargs)
+        limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size if self.keepalive else 0,
+            keepalive_expiry=self.keepalive or None,
+        )
+        self.client = httpx.AsyncClient(
+            http2=http2, limits=limits, headers=self.headers, cookies=self.cookies, timeout=self.timeout
+        )
+
+    async def _post(self, url, body):
+        import httpx
+
+        try:
+            response = await self.client.post(url, content=body)
+        except httpx.TimeoutException:
+            raise RequestTimeout(f"no response from {url} within {self.timeout:g}s") from None
+        return Response(response.status_code, response.text, response.headers)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+def make_transport(http2=None, **kwargs):
+    """
+    Build the transport for a seed run.
+
+    HTTP/2 is used when requested (or SEED_HTTP2=1) and ``httpx`` with its
+    ``h2`` extra is installed; otherwise a pooled ``requests.Session`` is used.
+    """
+    if http2 is None:
+        http2 = os.environ.get("SEED_HTTP2", "") not in ("", "0")
+    if http2:
+        try:
+            import h2  # noqa: F401
+            import httpx  # noqa: F401
+        except ImportError:
+            print("HTTP/2 requested but httpx[http2] is not installed; falling back to HTTP/1.1.")
+        else:
+            return HttpxTransport(http2=True, **kwargs)
+    return RequestsTransport(**kwargs)
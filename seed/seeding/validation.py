@@ -0,0 +1,195 @@
+"""
+Minimal mirror of the Joi rules used by the backend schemas.
+
+Only the rules that appear in ``backend_new/src/routes/*/schema.ts`` are
+supported. Messages follow Joi's wording so a local report reads the same as
+the backend's validation log. Each :class:`Schema` compiles its fields into a
+list of checks once, so validating a record is a handful of dict lookups and
+``isinstance`` calls.
+"""
+import abc
+import math
+import re
+from datetime import datetime
+
+_URI = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:[^\s]+$")
+_NUMERIC = re.compile(r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$")
+# Besides ISO 8601, the common layouts JavaScript's Date parser (behind Joi.date()) reads, and the
+# dd-mm-yyyy / dd/mm/yyyy of the rosters. Time zone names and offsets are cut off before matching.
+_DATE_FORMATS = (
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%Y/%m/%d",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %d %Y",
+    "%B %d %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%a %b %d %Y",
+    "%a, %d %b %Y",
+)
+_DATE_TIME = re.compile(r"[ T,]+\d{1,2}:\d{2}(:\d{2}(\.\d+)?)?.*$")
+
+
+class Rule(abc.ABC):
+    """Base Joi-like rule. ``check`` returns an error message or None."""
+
+    type_name = "any"
+
+    def __init__(self, required=False, allow_empty=False, valid=None):
+        self.required = required
+        self.allow_empty = allow_empty
+        self.valid = tuple(valid) if valid else None
+
+    @abc.abstractmethod
+    def check(self, label, value):
+        """Return the Joi error message for ``value`` of field ``label``, or None when it is valid."""
+
+
+class String(Rule):
+    """``Joi.string()``; ``allow_empty`` mirrors ``.allow('')``, ``uri`` mirrors ``.uri()``."""
+
+    def __init__(self, uri=False, **kwargs):
+        super().__init__(**kwargs)
+        self.uri = uri
+
+    def check(self, label, value):
+        if not isinstance(value, str):
+            return f'"{label}" must be a string'
+        if value == "":
+            return None if self.allow_empty else f'"{label}" is not allowed to be empty'
+        if self.valid is not None and value not in self.valid:
+            return f'"{label}" must be one of [{", ".join(self.valid)}]'
+        if self.uri and not _URI.match(value):
+            return f'"{label}" must be a valid uri'
+        return None
+
+
+class Number(Rule):
+    """``Joi.number()``; numeric strings are accepted as Joi converts them."""
+
+    def __init__(self, integer=False, **kwargs):
+        super().__init__(**kwargs)
+        self.integer = integer
+
+    def check(self, label, value):
+        if isinstance(value, str) and _NUMERIC.match(value):
+            value = float(value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return f'"{label}" must be a number'
+        if self.integer and value != int(value):
+            return f'"{label}" must be an integer'
+        return None
+
+
+class Boolean(Rule):
+    """``Joi.boolean()``; the strings ``true``/``false`` are accepted as Joi converts them."""
+
+    def check(self, label, value):
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            return None
+        return f'"{label}" must be a boolean'
+
+
+def _parses_as_date(text):
+    text = text.strip()
+    if _NUMERIC.match(text):
+        # Joi reads a numeric string as a millisecond timestamp.
+        return True
+    try:
+        datetime.fromisoformat(text.replace("Z", "+00:00"))
+        return True
+    except ValueError:
+        pass
+    day = _DATE_TIME.sub("", text)
+    for date_format in _DATE_FORMATS:
+        try:
+            datetime.strptime(day, date_format)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+class Date(Rule):
+    """
+    ``Joi.date()``; accepts timestamps, ISO 8601 and the other common date layouts.
+
+    Joi passes strings to JavaScript's ``Date`` parser, which reads far more
+    than ISO 8601. The check errs on the side of accepting: a date the
+    backend still rejects is reported by the backend, while one rejected here
+    would never be sent.
+    """
+
+    def check(self, label, value):
+        if isinstance(value, bool):
+            return f'"{label}" must be a valid date'
+        if isinstance(value, (int, float, datetime)):
+            return None
+        if isinstance(value, str) and _parses_as_date(value):
+            return None
+        return f'"{label}" must be a valid date'
+
+
+class Array(Rule):
+    """``Joi.array().items(rule)``."""
+
+    def __init__(self, items=None, **kwargs):
+        super().__init__(**kwargs)
+        self.items = items
+
+    def check(self, label, value):
+        if not isinstance(value, list):
+            return f'"{label}" must be an array'
+        if self.items is not None:
+            for index, item in enumerate(value):
+                error = self.items.check(f"{label}[{index}]", item)
+                if error:
+                    return error
+        return None
+
+
+class Schema:
+    """
+    ``Joi.object({...})`` validated with ``abortEarly: false``.
+
+    Unknown keys are rejected like Joi does, except the ones listed in
+    ``ignore`` (e.g. ``name``, which the /seed routes strip before validating).
+
+    Args:
+        fields (dict): Field name to :class:`Rule`
+        ignore (tuple, optional): Keys removed from the record before validation
+    """
+
+    def __init__(self, fields, ignore=()):
+        self.fields = fields
+        self.ignore = frozenset(ignore)
+        self._required = [name for name, rule in fields.items() if rule.required]
+        self._checks = [(name, rule.check) for name, rule in fields.items()]
+
+    def errors(self, record):
+        """Return every validation error of ``record`` (an empty list when it is valid)."""
+        if not isinstance(record, dict):
+            return ['"value" must be of type object']
+        errors = []
+        for name in self._required:
+            if name not in record:
+                errors.append(f'"{name}" is required')
+        for name, check in self._checks:
+            if name in record:
+                error = check(name, record[name])
+                if error:
+                    errors.append(error)
+        for name in record:
+            if name not in self.fields and name not in self.ignore:
+                errors.append(f'"{name}" is not allowed')
+        return errors
+
+    def ignoring(self, *keys):
+        """Copy of this schema that also ignores ``keys``."""
+        return Schema(self.fields, ignore=self.ignore | set(keys))
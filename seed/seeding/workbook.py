@@ -0,0 +1,189 @@
+"""
+Streaming, read-only access to ``.xlsx`` workbooks.
+
+Rows are yielded one at a time as tuples of plain Python values instead of
+building a DataFrame of the whole workbook. Two backends are supported:
+
+* ``calamine`` (``pip install python-calamine``): a native Rust parser, several
+  times faster than openpyxl; used automatically when installed.
+* ``openpyxl`` in read-only mode: pure Python, streams the sheet XML so memory
+  stays flat however large the sheet is.
+
+``SEED_XLSX_ENGINE`` (or the ``engine`` argument) forces one of them. Both
+backends yield the same values: empty cells are None, whole-number floats are
+ints, and rows are positioned as in the sheet, starting at row 1 and column A.
+
+Parsed sheets are cached on disk (see ``seeding/sheetcache.py``) when pyarrow
+is installed, so rereading an unchanged workbook skips parsing altogether.
+The cache is written while the rows are yielded and read back in batches, so
+rows stream with flat memory either way.
+"""
+import os
+from datetime import date, datetime
+
+from .sheetcache import default_cache, file_digest
+
+ENGINES = ("calamine", "openpyxl")
+
+
+def default_engine():
+    """Return the backend named by SEED_XLSX_ENGINE, else calamine when installed, else openpyxl."""
+    engine = os.environ.get("SEED_XLSX_ENGINE")
+    if engine:
+        if engine not in ENGINES:
+            raise ValueError(f"SEED_XLSX_ENGINE must be one of {', '.join(ENGINES)}, not '{engine}'")
+        return engine
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    return "calamine"
+
+
+def _cell(value):
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    # calamine returns dates for date-only cells, openpyxl (and pandas) datetimes.
+    if type(value) is date:
+        return datetime.combine(value, datetime.min.time())
+    return value
+
+
+_DEFAULT_CACHE = object()
+
+
+class Workbook:
+    """
+    A workbook opened for streaming reads. Use as a context manager.
+
+    The file itself is only parsed when a sheet is not in the cache.
+
+    Args:
+        path (str): Path to the ``.xlsx`` file
+        engine (str, optional): ``calamine`` or ``openpyxl``. Defaults to :func:`default_engine`
+        cache (SheetCache, optional): Parsed-sheet cache; None disables it. Defaults to :func:`default_cache`
+    """
+
+    def __init__(self, path, engine=None, cache=_DEFAULT_CACHE):
+        self.path = path
+        self.engine = engine or default_engine()
+        if self.engine not in ENGINES:
+            raise ValueError(f"Unknown workbook engine '{self.engine}', expected one of {', '.join(ENGINES)}")
+        self.cache = default_cache() if cache is _DEFAULT_CACHE else cache
+        self._digest = file_digest(path) if self.cache is not None else None
+        self._book = None
+        self._names = None
+
+    def _open(self):
+        if self._book is None:
+            if self.engine == "calamine":
+                from python_calamine import CalamineWorkbook
+
+                self._book = CalamineWorkbook.from_path(self.path)
+            else:
+                import openpyxl
+
+                self._book = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        return self._book
+
+    @property
+    def sheet_names(self):
+        if self._names is None:
+            names = self.cache.sheet_names(self._digest) if self.cache is not None else None
+            if names is None:
+                book = self._open()
+                names = list(book.sheet_names if self.engine == "calamine" else book.sheetnames)
+                if self.cache is not None:
+                    self.cache.put_sheet_names(self._digest, names)
+            self._names = names
+        return list(self._names)
+
+    def iter_rows(self, sheet=None):
+        """
+        Yield every row of ``sheet`` (name or index, default the first sheet) as a tuple.
+
+        Raises:
+            KeyError: If the sheet does not exist
+        """
+        name = self._sheet_name(sheet)
+        if self.cache is None:
+            yield from self._parse_rows(name)
+            return
+        rows = self.cache.rows(self._digest, name)
+        if rows is not None:
+            yield from rows
+            return
+        # Only a sheet read to the end is cached; stopping early discards the partial file.
+        with self.cache.writer(self._digest, name) as writer:
+            for row in self._parse_rows(name):
+                writer.append(row)
+                yield row
+
+    def _parse_rows(self, name):
+        if self.engine == "calamine":
+            yield from self._calamine_rows(name)
+        else:
+            for row in self._open()[name].iter_rows(values_only=True):
+                yield tuple(_cell(value) for value in row)
+
+    def _calamine_rows(self, name):
+        sheet = self._open().get_sheet_by_name(name)
+        # calamine's rows start at row 1 but at the first used column; pad so positions match openpyxl.
+        padding = (None,) * (sheet.start or (0, 0))[1]
+        for row in sheet.iter_rows():
+            yield padding + tuple(_cell(value) for value in row)
+
+    def iter_records(self, sheet=None, header_row=None):
+        """
+        Yield the rows after the header row as dicts keyed by header.
+
+        Args:
+            sheet (str or int, optional): Sheet name or index. Defaults to the first sheet
+            header_row (int, optional): 0-based index of the header row. Defaults to the first non-blank row
+
+        Yields:
+            dict: Header -> value, skipping blank rows and blank-header columns
+        """
+        header = None
+        for index, row in enumerate(self.iter_rows(sheet)):
+            if header is None:
+                if (header_row is None and any(value is not None for value in row)) or index == header_row:
+                    header = [None if value is None else str(value).strip() for value in row]
+                continue
+            if any(value is not None for value in row):
+                yield {key: value for key, value in zip(header, row) if key}
+
+    def _sheet_name(self, sheet):
+        names = self.sheet_names
+        if sheet is None:
+            return names[0]
+        if isinstance(sheet, int):
+            return names[sheet]
+        if sheet not in names:
+            raise KeyError(f"Worksheet '{sheet}' not found in {self.path}; sheets: {', '.join(names)}")
+        return sheet
+
+    def close(self):
+        if self._book is not None:
+            self._book.close()
+            self._book = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_rows(path, sheet=None, engine=None):
+    """Yield the rows of one sheet of the workbook at ``path``; see :meth:`Workbook.iter_rows`."""
+    with Workbook(path, engine) as workbook:
+        yield from workbook.iter_rows(sheet)
+
+
+def iter_records(path, sheet=None, header_row=None, engine=None):
+    """Yield the rows of one sheet as dicts; see :meth:`Workbook.iter_records`."""
+    with Workbook(path, engine) as workbook:
+        yield from workbook.iter_records(sheet, header_row)
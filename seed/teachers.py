@@ -1,86 +1,31 @@
-import sys
 import os
-import pandas as pd
-import requests
-from datetime import datetime
-import numpy as np
-import json
-
-# Check if the necessary arguments are passed
-if len(sys.argv) != 3:
-    print("Usage: python seed.py <path_to_excel_file> <api_url>")
-    sys.exit(1)
-
-# Get the Excel file path and API URL from the command-line arguments
-excel_file = sys.argv[1]
-api_url = sys.argv[2]
+import sys
 
-# Check if the file exists
-if not os.path.isfile(excel_file):
-    print(f"Error: File '{excel_file}' not found!")
-    sys.exit(1)
+from seeding import Seeder
+from seeding.roster import describe_user, iter_teacher_records
 
 
-# Read Excel file
-try:
-    data = pd.read_csv(excel_file)
-except Exception as e:
-    print(f"Error reading Excel file: {e}")
-    sys.exit(1)
-print(data)
-# Transform data
-data['empId'] = data['empId']
-data['name'] = data['name']
-data['password'] = data['empId'].apply(lambda x: x.split('@')[0] if '@' in x else x)
-data['panNo'] = data['panNo']
-data['phno'] = data['phno'].fillna('').astype(str)
-data['designation'] = data['designation']
-data['dept'] = 'CSE'
-data['campus'] = 'EC'
-data['qualification'] = 'to_be_filled'
-data['expertise'] = 'to_be_filled'
-data['dateofJoining'] = pd.to_datetime(data['dateofJoining'], dayfirst=True, errors='coerce').fillna(datetime.today().date())
-data['dateofJoining'] = data['dateofJoining'].apply(lambda x: x.isoformat() if pd.notnull(x) else None)
-data['totalExpBfrJoin'] = '5'
-data['googleScholarId'] = '0001'
-data['sId'] = '0001'
-data['oId'] = '0001'
-data['role'] = data['role'] 
-data['accessTo'] = data['accessTo']
-data['profileImg'] = 'https://static.vecteezy.com/system/resources/previews/005/129/844/non_2x/profile-user-icon-isolated-on-white-background-eps10-free-vector.jpg'
-data['centre_name']= "to_be_filled"
+def main():
+    # Check if the necessary arguments are passed
+    if len(sys.argv) != 3:
+        print("Usage: python teachers.py <path_to_csv_file> <api_url>")
+        sys.exit(1)
 
-# Select only the required fields
-fields = ['empId','name', 'password', 'campus', 'qualification', 'expertise', 'panNo', 'phno', 'designation','dept',
-          'dateofJoining', 'totalExpBfrJoin', 'googleScholarId', 'sId', 'oId','role','accessTo','profileImg','centre_name']
+    # Get the CSV file path and API URL from the command-line arguments
+    csv_file = sys.argv[1]
+    api_url = sys.argv[2]
 
-# Create a list of dictionaries with only these fields
-data_list = data[fields].to_dict(orient='records')
+    # Check if the file exists
+    if not os.path.isfile(csv_file):
+        print(f"Error: File '{csv_file}' not found!")
+        sys.exit(1)
 
-# Print the resulting list
-print(data_list)
+    records = iter_teacher_records(csv_file)
 
+    with Seeder() as seeder:
+        # Rows are read and transformed as the sender consumes them.
+        seeder.send(api_url, records, describe=describe_user, dataset="users")
 
-try:
-    print(f"Transformed data successfully.")
-except Exception as e:
-    print(f"Error writing data to CSV file: {e}")
 
-for record in data_list:
-    try:
-        # Use custom JSON dumps to handle serialization
-        response = requests.post(
-            api_url, 
-            data=json.dumps(record),
-            headers={'Content-Type': 'application/json'}
-        )
-        
-        if response.status_code == 201:
-            print(f"User {record['empId']} registered successfully.")
-        else:
-            print(f"Failed to register user {record['empId']}: {response.text}")
-    except Exception as e:
-        print(f"Error sending data for user {record['empId']}: {e}")
-        
-        
-        
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import json
+import os
+import sys
+
+import pytest
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# seeding/ is imported the way the seed scripts import it; the CLI as the seed package.
+sys.path.insert(0, SEED_DIR)
+sys.path.insert(1, os.path.dirname(SEED_DIR))
+
+from seeding.transport import Response, Transport  # noqa: E402
+
+
+class RecordingTransport(Transport):
+    """Transport answering every POST from ``respond(url, body)`` and recording what was sent."""
+
+    def __init__(self, respond=None):
+        super().__init__(pool_size=4)
+        self.respond = respond or (lambda url, body: Response(201, "{}", {}))
+        self.sent = []
+
+    async def _post(self, url, body):
+        self.sent.append((url, json.loads(body)))
+        return self.respond(url, body)
+
+
+@pytest.fixture
+def recording_transport():
+    return RecordingTransport
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from seed.cli import build_parser
+from seeding import Seeder
+from seeding.transport import Response
+
+URL = "http://api.test/patent/seed"
+RECORDS = [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+
+
+def test_records_missing_from_bulk_results_are_errors(recording_transport):
+    def respond(url, body):
+        # Answer for the first record only.
+        return Response(200, json.dumps({"results": [{"index": 0, "status": 201}]}), {})
+
+    with Seeder(transport=recording_transport(respond)) as seeder:
+        summary = seeder.send(URL, RECORDS, bulk_url=f"{URL}/bulk", batch_size=3)
+    assert summary.sent == 1
+    assert summary.errors == 2
+
+
+@pytest.mark.parametrize("size", ["0", "501"])
+def test_batch_size_is_capped(size):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run", "--batch-size", size])
+
+
+def test_batch_size_up_to_the_bulk_limit():
+    assert build_parser().parse_args(["run", "--batch-size", "500"]).batch_size == 500
+
+
+def test_default_users_never_need_an_admin_token():
+    from seeding import entities  # noqa: F401
+    from seeding.registry import get_entity
+
+    assert get_entity("defaultUsers").bulk_url("http://api.test") is None
+    assert get_entity("users").bulk_url("http://api.test") == "http://api.test/auth/register/bulk"
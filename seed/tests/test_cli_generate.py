@@ -0,0 +1,28 @@
+import os
+import sys
+
+from seed.cli import main
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench"))
+from stub_backend import StubBackend  # noqa: E402
+
+# Entities the stub backend has routes for.
+STUB_ENTITIES = ["users", "journal", "conference", "journal2023", "conference2023", "patent", "departmentAttended"]
+
+
+def test_generated_datasets_validate_and_seed(tmp_path, capsys):
+    out = str(tmp_path / "synthetic")
+    main(["generate", "--out", out, "--records", "20", "--teachers", "10"])
+    assert not os.path.exists(os.path.join(out, "intraSports.jsonl"))
+
+    main(["validate", "--data-dir", out])
+    assert "intraSports: no intraSports dataset in" in capsys.readouterr().out
+
+    with StubBackend() as backend:
+        base_url = backend.start()
+        main(
+            ["run", *STUB_ENTITIES, "--data-dir", out, "--base-url", base_url, "--batch-size", "50", "--token", "t"]
+        )
+    report = capsys.readouterr().out
+    assert "journal: 20 sent, 0 failed, 0 errors, 0 invalid." in report
+    assert "users: 10 sent" in report
@@ -0,0 +1,113 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# convert2.py is a script in the repository's test/ folder, next to the spreadsheets it converts.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "test"))
+
+import convert2  # noqa: E402
+from seeding.names import NameIndex  # noqa: E402
+
+HIGHER_STUDIES = [
+    ("Criterion 5",),
+    (None, "5.2.3 Number of outgoing students progressing to higher education"),
+    (),
+    ("Name of student", "Program graduated from", "Name of institution admitted to",
+     "Name of programme admitted to", "Link to the relevant document", "Graduation Year"),
+    ("Asha", "B.Tech", "IISc", "M.Tech", "https://example.com/a", 2024),
+    (None, None, None, None, None, None),
+    ("Ravi", "B.Tech", "IIT Madras", "MS", None, datetime(2023, 6, 1)),
+    (None, None, None, None, "Total", 2),
+]
+
+
+def test_detect_criterion_reads_the_title_and_header_rows():
+    criterion_id, criterion, columns = convert2.detect_criterion(iter(HIGHER_STUDIES))
+    assert criterion_id == "5.2.3"
+    assert criterion.entity == "studentHigherStudies"
+    assert columns == {
+        0: "studentName",
+        1: "programGraduatedFrom",
+        2: "institutionAdmittedTo",
+        3: "programmeAdmittedTo",
+        4: "documentLink",
+        5: "year",
+    }
+
+
+def test_detect_criterion_ignores_unknown_sheets():
+    assert convert2.detect_criterion(iter([("9.9.9 Not a criterion we seed",), ("Year", "Name")])) is None
+    assert convert2.detect_criterion(iter([("Name", "Year"), ("Asha", 2024)])) is None
+
+
+def test_iter_criterion_records_types_rows_and_skips_blanks_and_totals():
+    criterion_id, entity, records = convert2.iter_criterion_records(HIGHER_STUDIES)
+    assert (criterion_id, entity) == ("5.2.3", "studentHigherStudies")
+    records = list(records)
+    assert [number for number, _ in records] == [5, 7]
+    assert records[0][1] == {
+        "studentName": "Asha",
+        "programGraduatedFrom": "B.Tech",
+        "institutionAdmittedTo": "IISc",
+        "programmeAdmittedTo": "M.Tech",
+        "documentLink": "https://example.com/a",
+        "year": "2024",
+    }
+    assert records[1][1]["year"] == "2023"
+    assert records[1][1]["documentLink"] == ""
+
+
+def test_iter_criterion_records_merges_a_second_header_row_and_picks_teacher_owners():
+    rows = [
+        ("3.4.5 Number of research papers per teacher in the Journals notified on UGC website",),
+        ("Title of paper", "Name of the author/s", "Department of the teacher", "Name of journal",
+         "Year of publication", "ISSN number", "Link to the recognition in UGC enlistment of the Journal"),
+        (None, None, None, None, None, None, "Link to website of the Journal", "Link to article"),
+        ("Graph sampling", "Student One, Suja C M", "CSE", "J. Graphs", 2024, "1234-5678",
+         "https://example.com/j", "https://example.com/p"),
+    ]
+    names = NameIndex([("1", "Dr. Suja C.M."), ("2", "Ramesh Kumar")])
+    _, entity, records = convert2.iter_criterion_records(rows, names)
+    assert entity == "journal"
+    [(number, record)] = list(records)
+    assert number == 4
+    assert record["name"] == "Suja C M"
+    assert record["teacherIds"] == []
+    assert record["articleLink"] == "https://example.com/p"
+    assert record["year"] == "2024"
+
+
+def test_iter_criterion_records_fills_merged_cells_from_the_row_above():
+    rows = [
+        ("5.3.1 Number of awards/medals for outstanding performance in sports",),
+        ("Year", "Name of the award/medal", "Team / Individual", "Inter-university / state / National",
+         "Name of the event", "Name of the student", "Link to the relevant document"),
+        (2024, "Gold", "Team", "National", "Kabaddi", "Asha", None),
+        (None, None, None, None, None, "Ravi", None),
+    ]
+    _, _, records = convert2.iter_criterion_records(rows)
+    [(_, first), (_, second)] = list(records)
+    assert second["nameOfStudent"] == "Ravi"
+    assert (second["nameOfAward"], second["nameOfEvent"]) == ("Gold", "Kabaddi")
+    assert second["yearOfEvent"] == first["yearOfEvent"]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["book.xlsx", "--roster"],
+        ["book.xlsx", "--workers"],
+        ["book.xlsx", "--workers", "many"],
+        ["book.xlsx", "--bogus"],
+        ["book.xlsx", "out", "extra"],
+        ["book.xlsx", "--roster", "teachers.csv"],
+        [],
+    ],
+)
+def test_main_rejects_bad_arguments(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        convert2.main(argv)
+    assert exit_info.value.code == 2
+    assert "usage:" in capsys.readouterr().err
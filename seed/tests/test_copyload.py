@@ -0,0 +1,95 @@
+from seeding import schemas
+from seeding.copyload import CONFERENCE, build_plan, load_sqlite
+from seeding.registry import Entity
+
+
+def user(emp_id, name):
+    return {
+        "empId": emp_id,
+        "name": name,
+        "password": "secret",
+        "phno": "9999999999",
+        "dept": "CSE",
+        "campus": "RR",
+        "panNo": "ABCDE1234F",
+        "qualification": "PhD",
+        "designation": "Professor",
+        "expertise": "Networks",
+        "dateofJoining": "2015-06-01",
+        "totalExpBfrJoin": "5",
+        "googleScholarId": "NA",
+        "sId": "NA",
+        "oId": "NA",
+        "centre_name": "NA",
+    }
+
+
+def conference(title, owner, co_authors=()):
+    # No link_of_paper: Joi defaults it to ''.
+    return {
+        "name": owner,
+        "teacherIds": list(co_authors),
+        "bookTitle": "Proceedings",
+        "paperTitle": title,
+        "proceedings_conference_title": "Proceedings",
+        "volumeNo": "1",
+        "issueNo": "1",
+        "year": "2024",
+        "issn": "NA",
+        "publisherName": "IEEE",
+        "impactFactor": "0",
+        "core": "NA",
+        "abstract": "NA",
+        "domain": "Networks",
+    }
+
+
+def entity(name, records, schema):
+    return Entity(name=name, path=f"/{name}", load=lambda options: iter(records), schema=schema)
+
+
+def plan_for(users, conferences, conference_schema=schemas.CONFERENCE.ignoring("name")):
+    return build_plan(
+        [entity("conference", conferences, conference_schema), entity("users", users, schemas.USER)],
+        options=None,
+        hasher=lambda passwords: [f"hashed-{password}" for password in passwords],
+    )
+
+
+def test_plan_resolves_owners_and_skips_unknown_or_duplicate_records():
+    plan = plan_for(
+        [user("E1", "Suja C M"), user("E2", "Ramesh Kumar"), user("E1", "Suja Again")],
+        [conference("A", "Suja C M", ["Ramesh Kumar"]), conference("B", "Nobody Known")],
+    )
+    assert plan.skipped == 2
+    assert len(plan.rows["users"]) == 2
+    (row,) = plan.rows["conference"]
+    values = dict(zip(CONFERENCE.column_names, row))
+    assert values["link_of_paper"] == ""
+    assert values["totalAuthors"] == 1
+    assert len(plan.rows["conferenceUser"]) == 2
+
+
+def test_record_missing_a_required_column_is_skipped():
+    incomplete = conference("C", "Suja C M")
+    del incomplete["abstract"]
+    plan = plan_for([user("E1", "Suja C M")], [incomplete, conference("D", "Suja C M")], conference_schema=None)
+    assert plan.skipped == 1
+    assert len(plan.rows["conference"]) == 1
+
+
+def test_sqlite_stand_in_loads_the_plan():
+    plan = plan_for(
+        [user("E1", "Suja C M"), user("E2", "Ramesh Kumar")],
+        [conference("A", "Suja C M", ["Ramesh Kumar"])],
+    )
+    connection = load_sqlite(":memory:", plan)
+    assert connection.execute('SELECT COUNT(*) FROM "users"').fetchone() == (2,)
+    assert connection.execute('SELECT "password" FROM "users" WHERE "empId" = ?', ("E1",)).fetchone() == (
+        "hashed-secret",
+    )
+    owner = connection.execute(
+        'SELECT u."empId" FROM "conference" c JOIN "users" u ON u."id" = c."teacherAdminId"'
+    ).fetchone()
+    assert owner == ("E1",)
+    assert connection.execute('SELECT COUNT(*) FROM "conferenceUser"').fetchone() == (2,)
@@ -0,0 +1,60 @@
+import csv
+import os
+import sys
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+# distexcel.py is a script in the repository's test/ folder, next to the spreadsheets it splits.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "test"))
+
+import distexcel  # noqa: E402
+
+
+@pytest.fixture
+def book(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEED_SHEET_CACHE", "off")
+    path = tmp_path / "book.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Papers"
+    sheet.append(["Papers published in 2024"])
+    sheet.append(["Title", "Year"])
+    for number in range(7):
+        sheet.append([f"Paper {number}", 2024])
+    # A cell spanning lines stays one row.
+    sheet["A5"] = "Paper 2\nwith a subtitle"
+    workbook.create_sheet("Notes").append(["only one cell per row"])
+    workbook.save(path)
+    return str(path)
+
+
+def _rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_files_splits_consecutive_rows_reading_the_sheet_once(book, tmp_path, monkeypatch):
+    reads = []
+    iter_rows = distexcel.Workbook.iter_rows
+
+    def counting_iter_rows(self, sheet=None):
+        reads.append(sheet)
+        return iter_rows(self, sheet)
+
+    monkeypatch.setattr(distexcel.Workbook, "iter_rows", counting_iter_rows)
+    shards = list(distexcel.iter_shards(book, str(tmp_path / "out"), "Papers", num_files=3))
+    assert reads == ["Papers"]
+    assert [len(_rows(shard)) - 1 for shard in shards] == [2, 2, 3]
+    assert all(_rows(shard)[0] == ["Title", "Year"] for shard in shards)
+    titles = [row[0] for shard in shards for row in _rows(shard)[1:]]
+    assert titles == ["Paper 0", "Paper 1", "Paper 2\nwith a subtitle", "Paper 3", "Paper 4", "Paper 5", "Paper 6"]
+
+
+@pytest.mark.parametrize("sheet", ["Notes", "Missing"])
+def test_main_reports_unusable_sheets(book, tmp_path, sheet, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        distexcel.main([book, str(tmp_path / "out"), "--sheet", sheet, "--files", "2"])
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith("Error: ")
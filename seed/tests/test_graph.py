@@ -0,0 +1,46 @@
+import argparse
+import threading
+
+from seeding import Seeder
+from seeding.graph import seed_graph
+from seeding.names import SharedNameIndex
+from seeding.registry import Entity
+
+
+def test_loader_is_consumed_off_the_event_loop(recording_transport):
+    loop_thread = threading.get_ident()
+    threads = set()
+
+    def load(options):
+        for number in range(2500):
+            threads.add(threading.get_ident())
+            yield {"title": str(number)}
+
+    entity = Entity(name="patent", path="/patent/seed", load=load)
+    transport = recording_transport()
+    with Seeder(transport=transport) as seeder:
+        results = seeder.run(seed_graph(seeder, [entity], "http://api.test", argparse.Namespace()))
+    assert results["patent"].sent == 2500
+    assert loop_thread not in threads
+
+
+def test_resolving_names_on_a_resumed_run_sends_nothing_again(tmp_path, recording_transport):
+    roster = tmp_path / "teachers.csv"
+    roster.write_text("id,name\n1,Suja C M\n2,Ramesh Kumar\n")
+    records = [{"title": "A", "name": "Suja C M", "teacherIds": ["Ramesh Kumar"]}]
+    entity = Entity(
+        name="patent",
+        path="/patent/seed",
+        load=lambda options: iter(records),
+        name_fields=("teacherAdminId", "teacherIds"),
+    )
+    checkpoint = str(tmp_path / "ck.jsonl")
+
+    def run(options):
+        transport = recording_transport()
+        with Seeder(transport=transport, checkpoint=checkpoint) as seeder:
+            seeder.run(seed_graph(seeder, [entity], "http://api.test", options))
+        return transport.sent
+
+    assert len(run(argparse.Namespace())) == 1
+    assert run(argparse.Namespace(name_index=SharedNameIndex([str(roster)]))) == []
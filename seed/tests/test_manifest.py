@@ -0,0 +1,34 @@
+from seeding import Manifest, Seeder
+
+URL = "http://api.test/journal/seed"
+JOURNAL = [{"title": "A", "year": 2022}, {"title": "B", "year": 2022}]
+JOURNAL_2023 = [{"title": "C", "year": 2023}]
+
+
+def seed_both(transport, manifest_path):
+    with Seeder(transport=transport, manifest=manifest_path) as seeder:
+        seeder.send(URL, JOURNAL, dataset="journal")
+        seeder.send(URL, JOURNAL_2023, dataset="journal2023")
+
+
+def test_datasets_sharing_a_url_keep_separate_entries(tmp_path, recording_transport):
+    manifest_path = str(tmp_path / "manifest.json")
+    first = recording_transport()
+    seed_both(first, manifest_path)
+    assert len(first.sent) == 3
+
+    rerun = recording_transport()
+    seed_both(rerun, manifest_path)
+    assert rerun.sent == []
+
+    manifest = Manifest(manifest_path)
+    assert len(manifest.known(URL, "journal")) == 2
+    assert len(manifest.known(URL, "journal2023")) == 1
+
+
+def test_legacy_url_entries_are_still_read(tmp_path):
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    manifest.update(URL, {"abc"})
+    assert manifest.known(URL, "journal") == {"abc"}
+    manifest.update(URL, {"def"}, "journal")
+    assert manifest.known(URL, "journal") == {"def"}
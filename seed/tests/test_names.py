@@ -0,0 +1,32 @@
+from seeding.names import NameIndex, name_tokens, resolve_records
+
+USERS = [("1", "Dr. Suja C.M."), ("2", "Prof. Ramesh Kumar"), ("3", "Anitha Rao"), ("4", "Anitha Rao Nair")]
+
+
+def test_name_tokens_drop_honorifics_and_punctuation():
+    assert name_tokens("Dr. Suja C.M.") == ["suja", "c", "m"]
+
+
+def test_resolve_exact_contained_and_misspelled_names():
+    index = NameIndex(USERS)
+    assert index.resolve("suja c m") == "1"
+    assert index.resolve("Ramesh") == "2"
+    assert index.resolve("Ramesh Kumarr") == "2"
+
+
+def test_ambiguous_and_unknown_names_are_not_guessed():
+    index = NameIndex(USERS)
+    # Both Anitha Rao and Anitha Rao Nair contain "anitha".
+    assert index.resolve("Anitha") is None
+    assert index.resolve("Venkatesh") is None
+
+
+def test_resolve_records_keeps_unresolved_records_unchanged():
+    index = NameIndex(USERS)
+    records = [
+        {"name": "Suja C M", "teacherIds": ["Ramesh Kumar"]},
+        {"name": "Suja C M", "teacherIds": ["Somebody Else"]},
+    ]
+    resolved = list(resolve_records(records, index, "teacherAdminId", "teacherIds"))
+    assert resolved[0] == {"name": "Suja C M", "teacherAdminId": "1", "teacherIds": ["2"]}
+    assert resolved[1] is records[1]
@@ -0,0 +1,133 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from seeding import entities  # noqa: F401  (registers the built-in entities)
+from seeding.checkpoint import Checkpoint, iter_entries
+from seeding.datasets import iter_jsonl, jsonl_part, load_dataset
+from seeding.manifest import Manifest
+from seeding.registry import get_entity
+from seeding.shards import WorkQueue, _shard_path, _sharded, merge_shards
+
+RECORDS = [{"title": f"Paper {number}", "abstract": "x" * (number * 7 % 40)} for number in range(50)]
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    lines = [json.dumps(record) for record in RECORDS]
+    lines.insert(10, "")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 64])
+def test_jsonl_parts_hold_every_record_once(jsonl, parts):
+    shards = [list(iter_jsonl(jsonl, *jsonl_part(jsonl, part, parts))) for part in range(parts)]
+    assert [record for shard in shards for record in shard] == RECORDS
+
+
+def test_a_part_decodes_only_its_own_lines(jsonl):
+    with open(jsonl, "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+    first = list(load_dataset("journal", data_dir=os.path.dirname(jsonl), part=(0, 2)))
+    assert first == RECORDS[: len(first)]
+    with pytest.raises(ValueError, match="at byte"):
+        list(load_dataset("journal", data_dir=os.path.dirname(jsonl), part=(1, 2)))
+
+
+def test_parquet_parts_split_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "journal.parquet"
+    with pq.ParquetWriter(path, pa.Table.from_pylist(RECORDS[:1]).schema) as writer:
+        for start in range(0, len(RECORDS), 10):
+            writer.write_table(pa.Table.from_pylist(RECORDS[start:start + 10]))
+    shards = [list(load_dataset("journal", str(tmp_path), part=(part, 3))) for part in range(3)]
+    assert [len(shard) for shard in shards] == [10, 20, 20]
+    assert [record for shard in shards for record in shard] == RECORDS
+
+
+def test_sharded_entities_load_their_part(jsonl):
+    options = SimpleNamespace(data_dir=os.path.dirname(jsonl))
+    journal = get_entity("journal")
+    by_position = [list(_sharded(journal, shard, 4).load(options)) for shard in range(4)]
+    assert [record for shard in by_position for record in shard] == RECORDS
+    by_key = [list(_sharded(journal, shard, 4, key="title").load(options)) for shard in range(4)]
+    assert sorted(record["title"] for shard in by_key for record in shard) == sorted(r["title"] for r in RECORDS)
+    assert by_key != by_position
+
+
+def _dead_owner():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return f"{socket.gethostname()}:{process.pid}"
+
+
+def test_work_queue_hands_out_stages_in_order(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.json"))
+    queue.create([["users"], ["journal", "patent"]], 2)
+    # Joining with the same work is fine, with other work it is not.
+    queue.create([["users"], ["journal", "patent"]], 2)
+    with pytest.raises(ValueError):
+        queue.create([["users"]], 2)
+
+    assert queue.claim() == (0, 0)
+    assert queue.claim() == (0, 1)
+    # Stage 1 waits until every shard of stage 0 is done.
+    assert queue.claim() == WorkQueue.WAIT
+    queue.complete(0, 0, {"users": {"sent": 1}})
+    queue.complete(0, 1, {"users": {"sent": 2}})
+    assert queue.claim() == (1, 0)
+    assert queue.claim() == (1, 1)
+    assert queue.claim() is None
+    with queue.finishing() as should_merge:
+        assert not should_merge
+    queue.complete(1, 0, {})
+    queue.complete(1, 1, {})
+    with queue.finishing() as should_merge:
+        assert should_merge
+    with queue.finishing() as should_merge:
+        assert not should_merge
+
+
+def test_work_queue_reclaims_only_dead_local_claims(tmp_path):
+    path = tmp_path / "queue.json"
+    queue = WorkQueue(str(path))
+    queue.create([["users"]], 3)
+    assert [queue.claim() for _ in range(3)] == [(0, 0), (0, 1), (0, 2)]
+    state = json.loads(path.read_text())
+    state["items"]["0/0"]["owner"] = _dead_owner()
+    state["items"]["0/1"]["owner"] = "another-host:1"
+    path.write_text(json.dumps(state))
+
+    assert queue.claim() == (0, 0)
+    # Shard 1 stays with the other host and shard 2 with this live process; no later stage waits on them.
+    assert queue.claim() is None
+    assert queue.state()["items"]["0/1"]["owner"] == "another-host:1"
+
+
+def test_merge_shards_folds_and_removes_shard_files(tmp_path):
+    checkpoint_path = str(tmp_path / "seed.ckpt")
+    manifest_path = str(tmp_path / "manifest.json")
+    Manifest(manifest_path).update("http://api.test/patent/seed", {"old"}, "patent")
+    for shard, keys in enumerate((["a", "b"], ["c"])):
+        checkpoint = Checkpoint(_shard_path(checkpoint_path, shard))
+        for key in keys:
+            checkpoint.mark(key, "http://api.test/journal/seed")
+        checkpoint.close()
+        Manifest(_shard_path(manifest_path, shard)).update("http://api.test/journal/seed", keys, "journal")
+
+    merge_shards(checkpoint_path, manifest_path, 3)
+
+    assert sorted(key for key, _ in iter_entries(checkpoint_path)) == ["a", "b", "c"]
+    assert Manifest(manifest_path).entries() == {
+        "journal http://api.test/journal/seed": {"a", "b", "c"},
+        "patent http://api.test/patent/seed": {"old"},
+    }
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["manifest.json", "seed.ckpt"]
@@ -0,0 +1,40 @@
+import os
+from datetime import datetime
+
+from seeding import sheetcache
+from seeding.sheetcache import SheetCache
+from seeding.workbook import Workbook
+
+SEED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROWS = [
+    ("Title", None, "Year"),
+    (),
+    ("A", True, 2023, 1.5, datetime(2023, 11, 5), 2**70),
+    (None, None, None),
+]
+
+
+def cache_rows(cache, rows):
+    with cache.writer("digest", "Sheet1") as writer:
+        for row in rows:
+            writer.append(row)
+    return list(cache.rows("digest", "Sheet1"))
+
+
+def test_rows_round_trip_across_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(sheetcache, "BATCH_ROWS", 3)
+    rows = ROWS * 5
+    expected = [tuple(str(v) if isinstance(v, int) and v > 2**63 else v for v in row) for row in rows]
+    assert cache_rows(SheetCache(str(tmp_path)), rows) == expected
+
+
+def test_sheet_read_partly_is_not_cached(tmp_path):
+    cache = SheetCache(str(tmp_path))
+    workbook = Workbook(os.path.join(SEED_DIR, "test.xlsx"), engine="openpyxl", cache=cache)
+    rows = workbook.iter_rows()
+    next(rows)
+    rows.close()
+    assert cache.rows(workbook._digest, workbook.sheet_names[0]) is None
+    assert list(workbook.iter_rows()) == list(Workbook(workbook.path, engine="openpyxl", cache=None).iter_rows())
+    assert list(workbook.iter_rows()) == list(cache.rows(workbook._digest, workbook.sheet_names[0]))
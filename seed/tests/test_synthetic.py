@@ -0,0 +1,24 @@
+import pytest
+
+from seeding import entities  # noqa: F401  (registers the built-in entities)
+from seeding.synthetic import generator
+
+
+@pytest.mark.parametrize("teachers", [26, 27, 700])
+def test_generated_user_names_are_unique_and_deterministic(teachers):
+    names = [user["name"] for user in generator("users", teachers=teachers, seed=3)(teachers)]
+    assert len(set(names)) == teachers
+    assert names == [user["name"] for user in generator("users", teachers=teachers, seed=3)(teachers)]
+    assert names != [user["name"] for user in generator("users", teachers=teachers, seed=4)(teachers)]
+
+
+def test_publications_name_generated_users():
+    users = {user["name"] for user in generator("users", teachers=40, seed=1)(40)}
+    for record in generator("journal", teachers=40, seed=1)(50):
+        assert record["name"] in users
+        assert set(record["teacherIds"]) <= users
+
+
+def test_more_users_than_the_teacher_pool_is_an_error():
+    with pytest.raises(ValueError, match="pool of 10 teachers"):
+        generator("users", teachers=10)(11)
@@ -0,0 +1,27 @@
+from seeding import Seeder
+from seeding import sender
+from seeding.throttle import backoff_delay
+from seeding.transport import Response
+
+
+def test_backoff_doubles_up_to_the_cap():
+    for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (20, 30.0)]:
+        delay = backoff_delay(attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_429_without_reset_backs_off_and_gives_up(monkeypatch, recording_transport):
+    waits = []
+
+    async def sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(sender.asyncio, "sleep", sleep)
+    monkeypatch.setenv("SEED_MAX_RETRIES", "3")
+    transport = recording_transport(lambda url, body: Response(429, "Too many requests", {}))
+    with Seeder(transport=transport) as seeder:
+        summary = seeder.send("http://api.test/patent/seed", [{"title": "A"}])
+    assert len(transport.sent) == 4
+    assert len(waits) == 3
+    assert summary.errors == 1
+    assert summary.rate_limited == 4
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from seeding import Seeder, sender
+from seeding.transport import RequestsTransport, RequestTimeout, Response, Transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.ports.add(self.client_address[1])
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.ports = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def post_twice(keepalive, pause):
+    server, url = serve()
+
+    async def run():
+        transport = RequestsTransport(pool_size=1, keepalive=keepalive)
+        try:
+            await transport.post_json(url, {})
+            await asyncio.sleep(pause)
+            await transport.post_json(url, {})
+        finally:
+            await transport.aclose()
+
+    asyncio.run(run())
+    server.shutdown()
+    return len(server.ports)
+
+
+def test_connection_is_reused_within_the_keepalive():
+    assert post_twice(keepalive=30, pause=0) == 1
+
+
+def test_connection_idle_past_the_keepalive_is_replaced():
+    assert post_twice(keepalive=0.05, pause=0.2) == 2
+
+
+class _SlowHandler(_Handler):
+    def do_POST(self):
+        time.sleep(0.5)
+        super().do_POST()
+
+
+def test_timeout_raises_request_timeout():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    server.daemon_threads = True
+    server.ports = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    async def run():
+        transport = RequestsTransport(pool_size=1, timeout=0.1)
+        try:
+            await transport.post_json(f"http://127.0.0.1:{server.server_address[1]}/", {})
+        finally:
+            await transport.aclose()
+
+    with pytest.raises(RequestTimeout):
+        asyncio.run(run())
+    server.shutdown()
+
+
+def test_timed_out_record_is_retried(monkeypatch):
+    async def sleep(seconds):
+        pass
+
+    monkeypatch.setattr(sender.asyncio, "sleep", sleep)
+    answers = iter([RequestTimeout("no response"), Response(201, "{}", {})])
+
+    class FlakyTransport(Transport):
+        async def _post(self, url, body):
+            answer = next(answers)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+    with Seeder(transport=FlakyTransport()) as seeder:
+        summary = seeder.send("http://api.test/patent/seed", [{"title": "A"}])
+    assert (summary.sent, summary.timed_out, summary.errors) == (1, 1, 0)
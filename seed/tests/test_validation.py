@@ -0,0 +1,76 @@
+import pytest
+
+from seeding import schemas
+from seeding.validation import Date, Schema, String
+
+CONFERENCE = {
+    "bookTitle": "Proceedings",
+    "paperTitle": "A paper",
+    "proceedings_conference_title": "Proceedings",
+    "volumeNo": "1",
+    "issueNo": "1",
+    "year": "2024",
+    "issn": "NA",
+    "publisherName": "IEEE",
+    "impactFactor": "0",
+    "core": "NA",
+    "abstract": "NA",
+    "domain": "Networks",
+}
+
+
+def test_fields_with_a_joi_default_may_be_left_out():
+    # teacherIds, totalAuthors, pageNumber, link_of_paper, isCapstone, ... all have .default().
+    assert schemas.CONFERENCE.errors(CONFERENCE) == []
+
+
+def test_required_fields_and_unknown_keys_are_reported():
+    record = dict(CONFERENCE, extra="x")
+    del record["paperTitle"]
+    assert schemas.CONFERENCE.errors(record) == ['"paperTitle" is required', '"extra" is not allowed']
+
+
+def test_allow_empty_mirrors_allow_blank():
+    assert schemas.CONFERENCE.errors(dict(CONFERENCE, link_of_paper="")) == []
+    assert schemas.CONFERENCE.errors(dict(CONFERENCE, domain="")) == ['"domain" is not allowed to be empty']
+
+
+def test_ignoring_accepts_the_keys_the_seed_routes_strip():
+    record = dict(CONFERENCE, name="Suja C M", teacherAdminId="1")
+    assert len(schemas.CONFERENCE.errors(record)) == 2
+    assert schemas.CONFERENCE.ignoring("name", "teacherAdminId").errors(record) == []
+
+
+def test_conversions_follow_joi():
+    schema = schemas.CONFERENCE
+    assert schema.errors(dict(CONFERENCE, pageNumber="12", isCapstone="true")) == []
+    assert schema.errors(dict(CONFERENCE, pageNumber="1.5")) == ['"pageNumber" must be an integer']
+    assert Schema({"dept": String(valid=schemas.DEPARTMENTS)}).errors({"dept": "Physics"}) == [
+        '"dept" must be one of [ECE, CSE, Science & Humanities, Commerce & Management, Pharmaceutical Sciences]'
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2015-06-01",
+        "2015-06-01T00:00:00",
+        "2015-06-01T00:00:00.000Z",
+        "21-01-2025",
+        "21/01/2025",
+        "06/01/2015",
+        "2015/06/01",
+        "1 Jun 2015",
+        "June 1, 2015",
+        "Mon Jun 01 2015 00:00:00 GMT+0530 (India Standard Time)",
+        "1433116800000",
+        1433116800000,
+    ],
+)
+def test_dates_joi_accepts(value):
+    assert Date().check("dateofJoining", value) is None
+
+
+@pytest.mark.parametrize("value", ["", "not a date", "2015-13-45", True, None])
+def test_dates_joi_rejects(value):
+    assert Date().check("dateofJoining", value) == '"dateofJoining" must be a valid date'
@@ -0,0 +1,70 @@
+import sys
+from datetime import date, datetime
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from seeding.workbook import ENGINES, Workbook, default_engine, iter_records  # noqa: E402
+
+
+@pytest.fixture
+def book(tmp_path):
+    path = tmp_path / "book.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Papers"
+    # Column A and row 1 are left empty, as in the portal's exported sheets.
+    sheet["B2"], sheet["C2"], sheet["D2"] = "Title", "Year", "Published"
+    sheet["B3"], sheet["C3"], sheet["D3"] = "Graphs", 2024.0, date(2024, 3, 1)
+    sheet["B5"], sheet["C5"] = "Trees", 2023
+    workbook.create_sheet("Empty")
+    workbook.save(path)
+    return str(path)
+
+
+def test_default_engine_falls_back_to_openpyxl_without_calamine(monkeypatch):
+    monkeypatch.delenv("SEED_XLSX_ENGINE", raising=False)
+    # A None entry makes the import raise ImportError.
+    monkeypatch.setitem(sys.modules, "python_calamine", None)
+    assert default_engine() == "openpyxl"
+
+
+def test_seed_xlsx_engine_overrides_and_is_validated(monkeypatch):
+    monkeypatch.setenv("SEED_XLSX_ENGINE", "openpyxl")
+    assert default_engine() == "openpyxl"
+    monkeypatch.setenv("SEED_XLSX_ENGINE", "pandas")
+    with pytest.raises(ValueError, match="SEED_XLSX_ENGINE"):
+        default_engine()
+
+
+def test_unknown_engine_is_rejected(book):
+    with pytest.raises(ValueError):
+        Workbook(book, engine="xlrd", cache=None)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_yield_the_same_normalised_rows(book, engine):
+    if engine == "calamine":
+        pytest.importorskip("python_calamine")
+    with Workbook(book, engine=engine, cache=None) as workbook:
+        assert workbook.sheet_names == ["Papers", "Empty"]
+        rows = [row[:4] for row in workbook.iter_rows("Papers")]
+        with pytest.raises(KeyError):
+            list(workbook.iter_rows("Missing"))
+    assert rows[1:] == [
+        (None, "Title", "Year", "Published"),
+        (None, "Graphs", 2024, datetime(2024, 3, 1)),
+        (None, None, None, None),
+        (None, "Trees", 2023, None),
+    ]
+    assert isinstance(rows[2][2], int)
+
+
+def test_iter_records_skips_blank_rows_and_headers(book, monkeypatch):
+    monkeypatch.setitem(sys.modules, "python_calamine", None)
+    monkeypatch.delenv("SEED_XLSX_ENGINE", raising=False)
+    monkeypatch.setenv("SEED_SHEET_CACHE", "off")
+    records = list(iter_records(book, "Papers"))
+    assert [record["Title"] for record in records] == ["Graphs", "Trees"]
+    assert all(None not in record for record in records)
@@ -1,16 +1,89 @@
 #!/usr/bin/env python3
-import pandas as pd
+import argparse
+import csv
+import json
 import os
+import re
 import sys
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-def excel_to_csv(excel_file_path, output_dir=None):
+SEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "seed")
+sys.path.insert(0, SEED_DIR)
+from seeding import entities  # noqa: E402,F401  (registers the entity schemas)
+from seeding.names import NameIndex  # noqa: E402
+from seeding.registry import get_entity  # noqa: E402
+from seeding.workbook import Workbook  # noqa: E402
+
+
+def csv_header(cells):
+    """Name blank and repeated header cells the way pandas does ("Unnamed: 3", "Year.1")."""
+    header, seen = [], {}
+    for index, cell in enumerate(cells):
+        name = cell or f"Unnamed: {index}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def write_sheet_csv(rows, csv_path):
+    """
+    Write worksheet rows to a CSV file without holding the sheet in memory.
+
+    Rows are spooled to a temporary file while the sheet's used width is
+    measured, then written padded to that width with trailing blank rows
+    dropped, so the output matches what ``pd.read_excel(...).to_csv()`` wrote.
+
+    Args:
+        rows (iterable): Row tuples, e.g. from ``Workbook.iter_rows``; the first row is the header
+        csv_path (str): Output file
+    """
+    width = used_rows = 0
+    with tempfile.TemporaryFile("w+", newline="", encoding="utf-8") as spool:
+        writer = csv.writer(spool)
+        for count, row in enumerate(rows, start=1):
+            cells = ["" if value is None else str(value) for value in row]
+            while cells and cells[-1] == "":
+                cells.pop()
+            writer.writerow(cells)
+            if cells:
+                width = max(width, len(cells))
+                used_rows = count
+        spool.seek(0)
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            for index, cells in enumerate(csv.reader(spool)):
+                if index == used_rows:
+                    break
+                cells += [""] * (width - len(cells))
+                writer.writerow(csv_header(cells) if index == 0 else cells)
+
+def convert_sheet(excel_file_path, sheet_name, csv_path):
+    """
+    Convert one sheet to CSV. Opens the workbook itself so it can run in a worker process.
+    
+    Returns:
+        str: csv_path
+    """
+    with Workbook(excel_file_path) as workbook:
+        write_sheet_csv(workbook.iter_rows(sheet_name), csv_path)
+    return csv_path
+
+def excel_to_csv(excel_file_path, output_dir=None, workers=1):
     """
     Convert each sheet of an Excel file to a separate CSV file.
     
     Args:
         excel_file_path (str): Path to the Excel file
         output_dir (str, optional): Directory to save CSV files. If None, uses same directory as Excel file
+        workers (int, optional): Sheets converted in parallel, each in its own process. 0 uses every core. Defaults to 1
     
     Returns:
         list: List of paths to created CSV files
@@ -29,24 +102,25 @@ def excel_to_csv(excel_file_path, output_dir=None):
         # Get the base filename without extension
         base_filename = Path(excel_file_path).stem
         
-        # Read Excel file
-        excel_file = pd.ExcelFile(excel_file_path)
-        created_files = []
+        with Workbook(excel_file_path) as workbook:
+            sheet_names = workbook.sheet_names
         
-        # Convert each sheet to CSV
-        for sheet_name in excel_file.sheet_names:
-            # Read the sheet
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            
-            # Create CSV filename
+        # Create CSV filenames
+        csv_paths = []
+        for sheet_name in sheet_names:
             safe_sheet_name = "".join(c if c.isalnum() else "_" for c in sheet_name)
-            csv_filename = f"{base_filename}_{safe_sheet_name}.csv"
-            csv_path = os.path.join(output_dir, csv_filename)
-            
-            # Save to CSV
-            df.to_csv(csv_path, index=False)
-            created_files.append(csv_path)
-            
+            csv_paths.append(os.path.join(output_dir, f"{base_filename}_{safe_sheet_name}.csv"))
+        
+        workers = min(workers or os.cpu_count() or 1, len(sheet_names))
+        paths = [excel_file_path] * len(sheet_names)
+        if workers > 1:
+            # Every worker opens the workbook on its own, so the total time tracks the largest sheet.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                created_files = list(executor.map(convert_sheet, paths, sheet_names, csv_paths))
+        else:
+            created_files = list(map(convert_sheet, paths, sheet_names, csv_paths))
+        
+        for csv_path in created_files:
             print(f"Created CSV file: {csv_path}")
             
         return created_files
@@ -55,15 +129,537 @@ def excel_to_csv(excel_file_path, output_dir=None):
         print(f"Error converting Excel to CSV: {str(e)}")
         return []
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python excel_to_csv.py <excel_file_path> [output_directory]")
-        sys.exit(1)
-        
-    excel_file = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    created_files = excel_to_csv(excel_file, output_dir)
+# NAAC criterion sheets start with a title row such as "3.4.5 Number of research papers ...";
+# sub-criteria ("3.4.5.1: ...") only repeat it.
+CRITERION_ID = re.compile(r"^\s*(\d+\.\d+\.\d+)(?![.\d])")
+
+# Required fields the NAAC sheets have no column for, filled the way the bundled datasets are.
+PUBLICATION_DEFAULTS = {
+    "teacherIds": [],
+    "volumeNo": "1",
+    "issueNo": "1",
+    "pageNumber": 0,
+    "impactFactor": "0",
+    "isCapstone": False,
+    "abstract": "Not provided",
+    "domain": "CSE",
+}
+UNIVERSITY = "PES University"
+LEVELS = ("Inter-University", "State", "National", "International")
+EXAMS = ("NET", "SLET", "GATE", "GMAT", "CAT", "GRE", "JAM", "IELTS", "TOEFL")
+DATE_FORMATS = ("%d-%m-%Y", "%d-%m-%y", "%d/%m/%Y", "%d.%m.%Y", "%m/%d/%Y", "%Y-%m-%d", "%d %B %Y", "%d %b %Y")
+# The portal stores dates picked in the browser, i.e. midnight IST in UTC.
+IST = timezone(timedelta(hours=5, minutes=30))
+_DATE_RANGE = re.compile(r"\s+(?:to|–|-)\s+", re.IGNORECASE)
+# "29-31 July 2024": a range of days within one month.
+_DAY_RANGE = re.compile(r"^(\d{1,2})\s*[-–]\s*(\d{1,2})\s+([A-Za-z]+\.?\s+\d{4})$")
+_URL = re.compile(r"https?://\S+")
+
+# fill: cell keys that are blank below the first row of a merged cell and take the value above.
+Criterion = namedtuple("Criterion", ["entity", "labels", "build", "fill"], defaults=((),))
+
+
+def _label(value):
+    return " ".join(str(value).lower().split()) if value is not None else ""
+
+
+def _text(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    return str(value).strip() or None
+
+
+def _year(value):
+    return str(value.year) if isinstance(value, datetime) else _text(value)
+
+
+def _flag(value):
+    return _label(value) in ("yes", "y", "true")
+
+
+def _keywords(title):
+    words = (word.strip(".,:;()[]\"'") for word in title.split())
+    return [word for word in words if len(word) > 3][:5]
+
+
+def _date(value):
+    if isinstance(value, datetime):
+        return value
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _iso(moment):
+    return moment.replace(tzinfo=IST).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _duration(value):
+    """Return the ISO start and end of a "from – to" cell; a single date is both."""
+    if value is None:
+        return None, None
+    if isinstance(value, datetime):
+        parts = [value]
+    else:
+        text = " ".join(str(value).split())
+        days = _DAY_RANGE.match(text)
+        parts = [f"{day} {days.group(3)}" for day in days.group(1, 2)] if days else _DATE_RANGE.split(text, maxsplit=1)
+    dates = [_date(part) for part in parts]
+    if None in dates:
+        return None, None
+    return _iso(dates[0]), _iso(dates[-1])
+
+
+def _authors(value):
+    return [name.strip() for name in re.split(r"[,;&]|\band\b", _text(value) or "") if name.strip()]
+
+
+def _owner(authors, names):
+    """Return the paper's owner and co-author teachers: authors who are not registered teachers are students."""
+    teachers = [author for author in authors if names is not None and names.resolve(author)]
+    owner = teachers[0] if teachers else authors[0]
+    return owner, [teacher for teacher in teachers if teacher != owner]
+
+
+def _journal(cells, names):
+    title = _text(cells.get("title"))
+    authors = _authors(cells.get("authors"))
+    if not title or not authors:
+        return None
+    owner, co_authors = _owner(authors, names)
+    return dict(
+        PUBLICATION_DEFAULTS,
+        title=title,
+        name=owner,
+        teacherIds=co_authors,
+        journalName=_text(cells.get("journalName")),
+        month="January",
+        year=_year(cells.get("year")),
+        issn=" ".join((_text(cells.get("issn")) or "NA").split()),
+        websiteLink=_text(cells.get("websiteLink")) or "",
+        articleLink=_text(cells.get("articleLink")) or "",
+        isUGC=_flag(cells.get("isUGC")),
+        isScopus=False,
+        isWOS=False,
+        qNo="NA",
+        isAffiliating=False,
+        keywords=_keywords(title),
+        domain=_text(cells.get("domain")) or PUBLICATION_DEFAULTS["domain"],
+    )
+
+
+def _conference(cells, names):
+    authors = _authors(cells.get("name"))
+    paper_title = _text(cells.get("paperTitle"))
+    if not authors or not paper_title:
+        return None
+    owner, co_authors = _owner(authors, names)
+    proceedings = _text(cells.get("proceedings")) or _text(cells.get("bookTitle")) or "NA"
+    # The paper's DOI link is often pasted into the proceedings cell.
+    link = _URL.search(proceedings)
+    if link:
+        proceedings = (proceedings[: link.start()] + proceedings[link.end() :]).strip(" \n,") or "NA"
+    return dict(
+        PUBLICATION_DEFAULTS,
+        name=owner,
+        teacherIds=co_authors,
+        totalAuthors=len(authors),
+        bookTitle=proceedings,
+        paperTitle=paper_title,
+        proceedings_conference_title=proceedings,
+        year=_year(cells.get("year")),
+        issn=" ".join((_text(cells.get("issn")) or "NA").split()),
+        is_affiliating_institution_same=_flag(cells.get("affiliating")),
+        publisherName=_text(cells.get("publisher")) or "NA",
+        core="NA",
+        link_of_paper=link.group(0) if link else "",
+        keywords=_keywords(paper_title),
+    )
+
+
+def _patent(cells, names):
+    name = _text(cells.get("name"))
+    if not name or cells.get("patentNumber") is None:
+        return None
+    return {
+        "name": name,
+        "teacherIds": [],
+        "patentNumber": _text(cells.get("patentNumber")),
+        "patentTitle": _text(cells.get("patentTitle")),
+        "year": _year(cells.get("year")),
+        "documentLink": _text(cells.get("documentLink")),
+    }
+
+
+def _entrance_exam(cells, names):
+    student = _text(cells.get("studentName"))
+    if not student:
+        return None
+    record = {
+        "year": _year(cells.get("year")),
+        "registrationNumber": _text(cells.get("registrationNumber")) or "NA",
+        "studentName": student,
+    }
+    # An exam column holds the exam's name in the rows of students who qualified in it.
+    record.update((f"is{exam}", cells.get(exam) is not None) for exam in EXAMS)
+    record["documentLink"] = _text(cells.get("documentLink")) or ""
+    return record
+
+
+def _higher_studies(cells, names):
+    student = _text(cells.get("studentName"))
+    if not student:
+        return None
+    return {
+        "studentName": student,
+        "programGraduatedFrom": _text(cells.get("programGraduatedFrom")),
+        "institutionAdmittedTo": _text(cells.get("institutionAdmittedTo")),
+        "programmeAdmittedTo": _text(cells.get("programmeAdmittedTo")),
+        "documentLink": _text(cells.get("documentLink")) or "",
+        "year": _year(cells.get("year")),
+    }
+
+
+def _inter_sports(cells, names):
+    student = _text(cells.get("nameOfStudent"))
+    if not student:
+        return None
+    level = _label(cells.get("level")).replace("-", " ")
+    return {
+        "nameOfStudent": student,
+        "nameOfEvent": _text(cells.get("nameOfEvent")),
+        "link": _text(cells.get("link")),
+        "yearOfEvent": _year(cells.get("yearOfEvent")),
+        "teamOrIndi": _text(cells.get("teamOrIndi")),
+        # The level cell often names the host too ("Inter University, Christ University").
+        "level": next((known for known in LEVELS if level.startswith(_label(known).replace("-", " "))), _text(cells.get("level"))),
+        "nameOfAward": re.sub(r"\s*-\s*", "-", _text(cells.get("nameOfAward")) or ""),
+        "nameOfUniv": UNIVERSITY,
+    }
+
+
+def _department_attended(cells, names):
+    name = _text(cells.get("name"))
+    if not name:
+        return None
+    # An unreadable duration ("8 Days Offline") is left out for schema validation to report.
+    start, end = _duration(cells.get("duration"))
+    return {
+        "name": name,
+        "programTitle": _text(cells.get("programTitle")),
+        "durationStartDate": start,
+        "durationEndDate": end,
+        "documentLink": _text(cells.get("documentLink")) or "",
+        "year": _year(cells.get("year")),
+    }
+
+
+def _department_conducted(cells, names):
+    program = _text(cells.get("nameOfProgram"))
+    if not program:
+        return None
+    start, end = _duration(cells.get("duration"))
+    record = {
+        "nameOfProgram": program,
+        "noOfParticipants": cells.get("noOfParticipants"),
+        "durationStartDate": start,
+        "durationEndDate": end,
+        "documentLink": _text(cells.get("documentLink")) or "",
+        "year": _year(cells.get("year")),
+    }
+    # The NAAC template has no organiser column, but the seed route needs the teacher who ran the event.
+    if _text(cells.get("name")):
+        record["name"] = _text(cells.get("name"))
+    return record
+
+
+# Criterion id -> backend entity, header label prefixes (normalized) -> cell keys, record builder.
+CRITERIA = {
+    "3.3.2": Criterion(
+        "departmentConducted",
+        (
+            ("year", "year"),
+            ("name of the workshop", "nameOfProgram"),
+            ("number of participants", "noOfParticipants"),
+            ("date from", "duration"),
+            ("link to the activity report", "documentLink"),
+            ("name of the teacher", "name"),
+            ("coordinator", "name"),
+        ),
+        _department_conducted,
+    ),
+    "3.4.3": Criterion(
+        "patent",
+        (
+            ("name of the teacher", "name"),
+            ("patent number", "patentNumber"),
+            ("title of the patent", "patentTitle"),
+            ("year of award", "year"),
+            ("link to document", "documentLink"),
+        ),
+        _patent,
+    ),
+    "3.4.5": Criterion(
+        "journal",
+        (
+            ("title of paper", "title"),
+            ("name of the author", "authors"),
+            ("department of the teacher", "domain"),
+            ("name of journal", "journalName"),
+            ("year of publication", "year"),
+            ("issn number", "issn"),
+            ("link to website of the journal", "websiteLink"),
+            ("link to article", "articleLink"),
+            ("is it listed in ugc care", "isUGC"),
+        ),
+        _journal,
+    ),
+    "3.4.6": Criterion(
+        "conference",
+        (
+            ("name of the teacher", "name"),
+            ("title of the book", "bookTitle"),
+            ("title of the paper", "paperTitle"),
+            ("title of the proceedings", "proceedings"),
+            ("year of publication", "year"),
+            ("isbn/issn number", "issn"),
+            ("whether at the time of publication affiliating", "affiliating"),
+            ("name of the publisher", "publisher"),
+        ),
+        _conference,
+    ),
+    "5.2.1": Criterion(
+        "studentEntranceExam",
+        (
+            ("year", "year"),
+            ("registration number", "registrationNumber"),
+            ("names of students", "studentName"),
+            ("link to the relevant document", "documentLink"),
+            *((exam.lower(), exam) for exam in EXAMS),
+        ),
+        _entrance_exam,
+    ),
+    "5.2.3": Criterion(
+        "studentHigherStudies",
+        (
+            ("name of student", "studentName"),
+            ("program graduated from", "programGraduatedFrom"),
+            ("name of institution admitted to", "institutionAdmittedTo"),
+            ("name of programme admitted to", "programmeAdmittedTo"),
+            ("link to the relevant document", "documentLink"),
+            ("graduation year", "year"),
+        ),
+        _higher_studies,
+    ),
+    "5.3.1": Criterion(
+        "interSports",
+        (
+            ("year", "yearOfEvent"),
+            ("name of the award", "nameOfAward"),
+            ("team / individual", "teamOrIndi"),
+            ("inter-university / state", "level"),
+            ("name of the event", "nameOfEvent"),
+            ("name of the student", "nameOfStudent"),
+            ("link to the relevant document", "link"),
+        ),
+        _inter_sports,
+        fill=("yearOfEvent", "nameOfAward", "teamOrIndi", "level", "nameOfEvent"),
+    ),
+    "6.3.4": Criterion(
+        "departmentAttended",
+        (
+            ("year", "year"),
+            ("name of teacher", "name"),
+            ("title of the program", "programTitle"),
+            ("duration", "duration"),
+            ("link to the relevant document", "documentLink"),
+        ),
+        _department_attended,
+    ),
+}
+
+
+def _header_columns(criterion, row, columns=None):
+    """Map the cells of ``row`` that carry one of the criterion's labels to cell keys, by column."""
+    columns = dict(columns or {})
+    taken = set(columns.values())
+    for index, cell in enumerate(row):
+        label = _label(cell)
+        if not label or index in columns:
+            continue
+        for prefix, key in criterion.labels:
+            if key not in taken and (label == prefix or label.startswith(prefix + " ") or label.startswith(prefix + "/")
+                                     or (len(prefix) > 4 and label.startswith(prefix))):
+                columns[index] = key
+                taken.add(key)
+                break
+    return columns
+
+
+def detect_criterion(rows):
+    """
+    Find the NAAC criterion and the header row of a sheet.
+
+    Reads only as far as the header: the criterion id comes from the title
+    row ("3.4.5 Number of research papers ..."), and the header is the first
+    row that carries at least half of that criterion's column labels.
+
+    Args:
+        rows (iterator): Sheet rows, e.g. from ``Workbook.iter_rows``; consumed up to the header
+
+    Returns:
+        tuple: ``(criterion_id, Criterion, columns)`` where columns maps column index -> cell key,
+        or None when the sheet is not a known criterion sheet
+    """
+    criterion_id = None
+    for row in rows:
+        if criterion_id is None:
+            for cell in row:
+                match = CRITERION_ID.match(cell) if isinstance(cell, str) else None
+                if match:
+                    criterion_id = match.group(1)
+                    break
+            if criterion_id is not None and criterion_id not in CRITERIA:
+                return None
+            continue
+        criterion = CRITERIA[criterion_id]
+        columns = _header_columns(criterion, row)
+        if len(columns) >= max(2, len(criterion.labels) // 2):
+            return criterion_id, criterion, columns
+    return None
+
+
+def iter_criterion_records(rows, names=None):
+    """
+    Turn the rows of a NAAC criterion sheet into backend records in one pass.
+
+    A second header row (e.g. the link columns of 3.4.5, which sit one row
+    below the rest) is merged into the header. Rows are mapped to the
+    entity's fields and typed (years as text, flags as booleans, durations as
+    ISO dates); rows without the fields a record needs, such as totals and
+    notes, are skipped.
+
+    Args:
+        rows (iterable): Sheet rows, e.g. from ``Workbook.iter_rows``
+        names (NameIndex, optional): Teachers, used to pick a paper's owner among its authors
+
+    Returns:
+        tuple: ``(criterion_id, entity, records)`` with ``records`` a generator of
+        ``(row number, record)`` pairs, or None when the sheet is not a known criterion sheet
+    """
+    # Row numbers as the spreadsheet shows them, for messages.
+    rows = enumerate(rows, start=1)
+    detected = detect_criterion(row for _, row in rows)
+    if detected is None:
+        return None
+    criterion_id, criterion, columns = detected
+
+    def records():
+        merged = columns
+        first = True
+        above = {}
+        for number, row in rows:
+            if not any(value is not None for value in row):
+                continue
+            if first:
+                first = False
+                more = _header_columns(criterion, row, merged)
+                if len(more) > len(merged):
+                    merged = more
+                    continue
+            cells = {key: row[index] for index, key in merged.items() if index < len(row)}
+            for key in criterion.fill:
+                if cells.get(key) is None:
+                    cells[key] = above.get(key)
+            above = cells
+            record = criterion.build(cells, names)
+            if record is not None:
+                yield number, record
+
+    return criterion_id, criterion.entity, records()
+
+
+def extract_records(excel_file_path, output_dir=None, roster=None):
+    """
+    Extract every NAAC criterion sheet of an Excel file to ``<entity>.jsonl`` record files.
+
+    Records are validated against the backend schemas as they stream out;
+    invalid ones are reported and left out. Sheets of the same criterion are
+    appended to one file, which ``python -m seed run --data-dir`` seeds as is.
+
+    Args:
+        excel_file_path (str): Path to the Excel file
+        output_dir (str, optional): Directory for the record files. If None, uses same directory as Excel file
+        roster (str, optional): Teacher export with ``id`` and ``name`` columns. Defaults to seed/teachers.csv
+
+    Returns:
+        list: Paths of the record files written
+    """
+    if output_dir is None:
+        output_dir = os.path.dirname(os.path.abspath(excel_file_path))
+    else:
+        os.makedirs(output_dir, exist_ok=True)
+    roster = roster or os.path.join(SEED_DIR, "teachers.csv")
+    names = NameIndex.from_csv(roster) if os.path.isfile(roster) else None
+
+    files = {}
+    try:
+        with Workbook(excel_file_path) as workbook:
+            for sheet_name in workbook.sheet_names:
+                extracted = iter_criterion_records(workbook.iter_rows(sheet_name), names)
+                if extracted is None:
+                    print(f"Skipped sheet '{sheet_name}': no known NAAC criterion header")
+                    continue
+                criterion_id, entity_name, records = extracted
+                schema = get_entity(entity_name).schema
+                if entity_name not in files:
+                    files[entity_name] = open(os.path.join(output_dir, f"{entity_name}.jsonl"), "w", encoding="utf-8")
+                written = invalid = 0
+                for number, record in records:
+                    errors = schema.errors(record)
+                    if errors:
+                        invalid += 1
+                        print(f"  {sheet_name}, row {number}: skipped: {'; '.join(errors)}")
+                        continue
+                    files[entity_name].write(json.dumps(record, ensure_ascii=False) + "\n")
+                    written += 1
+                print(f"Extracted {written} {entity_name} records from '{sheet_name}' (criterion {criterion_id})"
+                      + (f", {invalid} invalid" if invalid else ""))
+    finally:
+        for f in files.values():
+            f.close()
+    return [f.name for f in files.values()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert every sheet of an Excel file to CSV, or to seed records.")
+    parser.add_argument("excel_file", help="workbook to convert")
+    parser.add_argument("output_dir", nargs="?", default=None, help="output directory (default: next to the workbook)")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="sheets converted in parallel processes, 0 for every core (default 1)"
+    )
+    parser.add_argument(
+        "--records", action="store_true", help="extract NAAC criterion sheets to <entity>.jsonl seed records"
+    )
+    parser.add_argument(
+        "--roster", metavar="CSV", default=None, help="teacher roster for --records (default seed/teachers.csv)"
+    )
+    options = parser.parse_args(argv)
+    if options.roster and not options.records:
+        parser.error("--roster only applies with --records")
+
+    if options.records:
+        record_files = extract_records(options.excel_file, options.output_dir, options.roster)
+        print(f"\nNumber of record files created: {len(record_files)}")
+        if not record_files:
+            sys.exit(1)
+        return
+
+    created_files = excel_to_csv(options.excel_file, options.output_dir, options.workers)
     
     if created_files:
         print("\nConversion completed successfully!")
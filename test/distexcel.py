@@ -1,30 +1,226 @@
-import pandas as pd
+#!/usr/bin/env python3
+import argparse
+import csv
+import io
 import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-def split_xlsx_to_csv(input_file, output_folder, sheet_name="2024 Published or Accepted", rows_per_file=30):
-    # Read the specified sheet from the Excel file into a DataFrame
-    df = pd.read_excel(input_file, sheet_name=sheet_name)
-    
-    # Get the total number of rows
-    total_rows = len(df)
-    num_files = 7
-    rows_per_file = total_rows // num_files  # Distribute rows evenly
-    
-    for i in range(num_files):
-        start_idx = i * rows_per_file
-        end_idx = start_idx + rows_per_file if i < num_files - 1 else total_rows
-        chunk = df.iloc[start_idx:end_idx]
-
-        # Create output file name
-        output_file = f"{output_folder}/output_file_{i+1}.csv"
-        chunk.to_csv(output_file, index=False)
-        print(f"Saved {output_file} with rows {start_idx+1} to {end_idx}.")
-
-# Example usage
-input_file = "./input.xlsx"  # Replace with your XLSX file
-output_folder = "./output_csv_files"  # Replace with your desired output folder
-
-# Ensure the output folder exists
-os.makedirs(output_folder, exist_ok=True)
-
-split_xlsx_to_csv(input_file, output_folder)
+SEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "seed")
+sys.path.insert(0, SEED_DIR)
+from convert2 import csv_header  # noqa: E402
+from seeding.workbook import Workbook  # noqa: E402
+
+
+def _cells(row):
+    cells = ["" if value is None else str(value) for value in row]
+    while cells and cells[-1] == "":
+        cells.pop()
+    return cells
+
+
+def _line(cells):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(cells)
+    return buffer.getvalue()
+
+
+def _data_lines(workbook, input_file, sheet_name, header_row):
+    """Return the header and a generator of CSV lines for the non-blank data rows of the sheet."""
+    rows = enumerate(workbook.iter_rows(sheet_name))
+    header = None
+    for index, row in rows:
+        cells = _cells(row)
+        if index == header_row or (header_row is None and sum(cell != "" for cell in cells) >= 2):
+            header = csv_header(cells)
+            break
+    if header is None:
+        raise ValueError(f"No header row found in sheet '{sheet_name}' of {input_file}")
+
+    def lines():
+        for _, row in rows:
+            cells = _cells(row)
+            if cells:
+                yield _line(cells + [""] * (len(header) - len(cells)))
+
+    return header, lines()
+
+
+class _Shard:
+    """One output CSV being written, starting with the header line."""
+
+    def __init__(self, path, header_line):
+        self.path = path
+        self.rows = 0
+        self.bytes = 0
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._write(header_line)
+
+    def _write(self, line):
+        self._file.write(line)
+        self.bytes += len(line.encode("utf-8"))
+
+    def write(self, line):
+        self._write(line)
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+def iter_shards(input_file, output_folder, sheet_name="2024 Published or Accepted", rows_per_file=30,
+                max_bytes=None, num_files=None, header_row=None):
+    """
+    Split one sheet into CSV shards while reading it, yielding each shard as soon as it is complete.
+
+    Only the current row is held in memory. Shards are cut by one of:
+
+    * ``num_files``: exactly that many shards of consecutive rows, ``rows // num_files`` each (at
+      least one) and the remainder in the last one; the rows are spooled to a temporary file while
+      they are counted, so the sheet is still read once
+    * ``max_bytes``: a new shard starts before the current one would grow past this size
+    * ``rows_per_file``: a new shard every that many data rows
+
+    Every shard starts with the header row. Blank rows are dropped.
+
+    Args:
+        input_file (str): Path to the Excel file
+        output_folder (str): Directory for the ``output_file_<n>.csv`` shards
+        sheet_name (str, optional): Sheet to split
+        rows_per_file (int, optional): Data rows per shard. Defaults to 30
+        max_bytes (int, optional): Largest shard size in bytes; takes precedence over ``rows_per_file``
+        num_files (int, optional): Number of shards, e.g. one per seeding worker; takes precedence over both
+        header_row (int, optional): 0-based header row. Defaults to the first row with two or more
+            cells filled, which skips the notes above the table
+
+    Yields:
+        str: Path of each completed shard
+
+    Raises:
+        KeyError: If the sheet does not exist
+        ValueError: If the sheet has no header row
+    """
+    os.makedirs(output_folder, exist_ok=True)
+
+    def open_shard(number):
+        return _Shard(os.path.join(output_folder, f"output_file_{number}.csv"), header_line)
+
+    with Workbook(input_file) as workbook, tempfile.TemporaryFile("w+", newline="", encoding="utf-8") as spool:
+        header, lines = _data_lines(workbook, input_file, sheet_name, header_row)
+        header_line = _line(header)
+        if num_files:
+            total = 0
+            for line in lines:
+                spool.write(line)
+                total += 1
+            rows_per_file = max(1, total // num_files)
+            spool.seek(0)
+            # Read back by CSV record, not by line: cells may span lines.
+            lines = (_line(cells) for cells in csv.reader(spool))
+
+        def full(shard, line):
+            if num_files:
+                return count < num_files and shard.rows >= rows_per_file
+            if max_bytes is None:
+                return shard.rows >= rows_per_file
+            return shard.bytes + len(line.encode("utf-8")) > max_bytes
+
+        shard = None
+        count = 0
+        for line in lines:
+            if shard is not None and full(shard, line):
+                shard.close()
+                yield shard.path
+                shard = None
+            if shard is None:
+                count += 1
+                shard = open_shard(count)
+            shard.write(line)
+        if shard is not None:
+            shard.close()
+            yield shard.path
+        # --files always writes that many shards, even when the sheet has fewer rows.
+        for number in range(count + 1, (num_files or 0) + 1):
+            shard = open_shard(number)
+            shard.close()
+            yield shard.path
+
+
+def split_xlsx_to_csv(input_file, output_folder, sheet_name="2024 Published or Accepted", rows_per_file=30,
+                      max_bytes=None, num_files=None, header_row=None):
+    """
+    Split one sheet into CSV shards; see :func:`iter_shards`.
+
+    Returns:
+        list: Paths of the shards written
+    """
+    shards = []
+    for path in iter_shards(input_file, output_folder, sheet_name, rows_per_file, max_bytes, num_files, header_row):
+        print(f"Saved {path}")
+        shards.append(path)
+    return shards
+
+
+def _run_command(command, shard):
+    args = shlex.split(command)
+    if not any("{shard}" in arg for arg in args):
+        args.append("{shard}")
+    return subprocess.run([arg.replace("{shard}", shard) for arg in args]).returncode
+
+
+def seed_shards(shards, command, workers):
+    """
+    Run ``command`` once per shard, ``workers`` shards at a time, starting each as soon as its shard is written.
+
+    Args:
+        shards (iterable): Shard paths, e.g. the :func:`iter_shards` generator
+        command (str): Command line; ``{shard}`` is replaced by the shard path, which is appended when absent
+        workers (int): Commands run at once
+
+    Returns:
+        dict: Shard path -> exit code
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {shard: executor.submit(_run_command, command, shard) for shard in shards}
+    return {shard: future.result() for shard, future in futures.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split an Excel sheet into CSV shards without loading it whole.")
+    parser.add_argument("input_file", nargs="?", default="./input.xlsx")
+    parser.add_argument("output_folder", nargs="?", default="./output_csv_files")
+    parser.add_argument("--sheet", default="2024 Published or Accepted", help="sheet to split")
+    parser.add_argument("--header-row", type=int, default=None, help="0-based header row (default: first table row)")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--rows", type=int, default=30, help="data rows per shard (default 30)")
+    size.add_argument("--max-bytes", type=int, default=None, help="largest shard size in bytes")
+    size.add_argument("--files", type=int, default=None, help="number of shards of consecutive rows")
+    parser.add_argument(
+        "--run", metavar="COMMAND", default=None, help="run COMMAND on every shard as it is written, {shard} is its path"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="commands run at once (default --files or every core)")
+    options = parser.parse_args(argv)
+
+    source = (options.input_file, options.output_folder, options.sheet, options.rows, options.max_bytes, options.files,
+              options.header_row)
+    try:
+        if options.run is None:
+            split_xlsx_to_csv(*source)
+            return
+        shards = iter_shards(*source)
+        workers = options.workers or options.files or os.cpu_count() or 1
+        failed = [shard for shard, code in seed_shards(shards, options.run, workers).items() if code != 0]
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e.args[0]}")
+        sys.exit(1)
+    for shard in failed:
+        print(f"Failed: {shard}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()